@@ -0,0 +1,265 @@
+"""
+Benchmark and validation of the fixed point conversions.
+
+Every implementation of float to fixed and fixed to float conversion is checked against a reference model
+built on exact `Fraction` arithmetic. Formats of up to `--exhaustive-bits` bits are swept exhaustively:
+all fixed values, all representable floats, all midpoints between them (rounding), midpoints nudged by one ulp
+and values outside the range (saturation). Wider formats are sampled randomly around the same edge cases.
+
+Throughput (conversions per second, best of several runs) is reported for each implementation,
+data type and error strategy, and saved to JSON. If baseline JSON is given, throughput drops are reported.
+Exit code is 1 if any implementation disagrees with the reference model or a regression is found.
+
+Usage:
+    python benchmark_fixed_point.py --output results.json
+    python benchmark_fixed_point.py --data-types S2Q2 S1Q31 --baseline results.json --threshold 0.2
+"""
+
+import argparse
+import json
+import random
+import sys
+from collections.abc import Callable
+from fractions import Fraction
+from timeit import Timer
+
+import numpy as np
+
+from fixed_point_numbers import ConversionError, FixedPoint, QFormat, fixed_to_float, float_to_fixed
+from fixed_point_arrays import ArrayConversionError, FixedArray, fixed_to_float_array, float_to_fixed_array
+
+# Implementations by direction: name -> (function, vectorized).
+# Vectorized functions take numpy arrays, others take lists. All of them return lists.
+TO_FIXED: dict[str, tuple[Callable, bool]] = {
+    'float_to_fixed': (lambda q, values, es: [float_to_fixed(q.data_type, v, es) for v in values], False),
+    'QFormat.to_fixed': (lambda q, values, es: [q.to_fixed(v, es) for v in values], False),
+    'FixedPoint.from_float': (lambda q, values, es: [FixedPoint.from_float(v, q, es).to_fixed() for v in values],
+                              False),
+    'float_to_fixed_array': (lambda q, values, es: float_to_fixed_array(q, values, es).tolist(), True),
+    'FixedArray.from_float': (lambda q, values, es: FixedArray.from_float(values, q, es).to_fixed().tolist(), True),
+}
+TO_FLOAT: dict[str, tuple[Callable, bool]] = {
+    'fixed_to_float': (lambda q, values: [fixed_to_float(q.data_type, v) for v in values], False),
+    'QFormat.to_float': (lambda q, values: [q.to_float(v) for v in values], False),
+    'FixedPoint.from_fixed': (lambda q, values: [FixedPoint.from_fixed(v, q).to_float() for v in values], False),
+    'fixed_to_float_array': (lambda q, values: fixed_to_float_array(q, values).tolist(), True),
+    'FixedArray.from_fixed': (lambda q, values: FixedArray.from_fixed(values, q).to_float().tolist(), True),
+}
+IMPLEMENTATIONS = list(TO_FIXED) + list(TO_FLOAT)
+
+# Implementations that support only some data types.
+SUPPORTED_DATA_TYPES: dict[str, Callable[[QFormat], bool]] = {
+    'float_to_fixed_array': lambda q: q.bits <= 64,
+    'fixed_to_float_array': lambda q: q.bits <= 64,
+    'FixedArray.from_float': lambda q: q.m + q.e <= 63,
+    'FixedArray.from_fixed': lambda q: q.m + q.e <= 63,
+}
+
+DATA_TYPES = ('S2Q2', 'U2Q2', 'S1Q2', 'U0Q2', 'S2Q0', 'U1Q0', 'S4Q4', 'U4Q12', 'S8Q8',
+              'S1Q31', 'U16Q16', 'S8Q56', 'U10Q54', 'U0Q64', 'S32Q64')
+ERROR_STRATEGIES = ('raise', 'skip')
+
+
+def reference_to_fixed(q_format: QFormat, float_value: float, error_strategy: str):
+    """
+    Float to fixed conversion by definition: exact value rounded half to even. Returns code or error type.
+    Bounds are exact, float bounds of data types wider than float mantissa are rounded.
+    """
+    if float_value in (-np.inf, np.inf):
+        raw_value = -q_format.min_fixed if float_value < 0 else q_format.max_fixed
+        outside = True
+    else:
+        raw_value = Fraction(float_value) * q_format.scale
+        outside = not -q_format.min_fixed <= raw_value <= q_format.max_fixed
+        raw_value = max(-q_format.min_fixed, min(round(raw_value), q_format.max_fixed))
+
+    if outside and error_strategy == 'raise':
+        return ConversionError
+    return (-raw_value | q_format.sign_mask) if raw_value < 0 else raw_value
+
+
+def reference_to_float(q_format: QFormat, fixed_value: int):
+    """Fixed to float conversion by definition. Returns float or error type."""
+    if fixed_value | q_format.mask != q_format.mask:
+        return ConversionError
+    if fixed_value & q_format.sign_mask:
+        raw_value = -(fixed_value ^ q_format.sign_mask or q_format.sign_mask)
+    else:
+        raw_value = fixed_value
+    return float(Fraction(raw_value, q_format.scale))
+
+
+def make_raw_values(q_format: QFormat, exhaustive_bits: int, samples: int) -> list[int]:
+    """Returns all raw values (fixed values multiplied by sign) or a sample with extreme values."""
+    min_raw, max_raw = -q_format.min_fixed, q_format.max_fixed
+    if q_format.bits <= exhaustive_bits:
+        return list(range(min_raw, max_raw + 1))
+
+    rng = random.Random(q_format.data_type)
+    edges = {min_raw, min_raw + 1, -1, 0, 1, max_raw - 1, max_raw}
+    return sorted(edges.union(rng.randint(min_raw, max_raw) for _ in range(samples)))
+
+
+def make_floats(q_format: QFormat, raw_values: list[int]) -> np.ndarray:
+    """Representable values, midpoints between them, midpoints nudged by one ulp and values outside the range."""
+    values = np.array([float(Fraction(raw_value, q_format.scale)) for raw_value in raw_values])
+    midpoints = values + 0.5 / q_format.scale
+    outside = [q_format.min_val - 1 / q_format.scale, q_format.max_val + 1 / q_format.scale,
+               q_format.min_val * 2 - 1, q_format.max_val * 2 + 1, -np.inf, np.inf]
+    return np.concatenate((values, midpoints, np.nextafter(midpoints, -np.inf), np.nextafter(midpoints, np.inf),
+                           outside, [-0.0]))
+
+
+def make_fixed_values(q_format: QFormat, raw_values: list[int]) -> list[int]:
+    """Fixed values of the raw values and the closest invalid values, if they fit in 64 bits."""
+    fixed_values = [(-raw_value | q_format.sign_mask) if raw_value < 0 else raw_value for raw_value in raw_values]
+    return fixed_values + ([q_format.mask + 1, q_format.mask + 2] if q_format.bits < 64 else [])
+
+
+def _as_array(values: list) -> np.ndarray:
+    if values and isinstance(values[0], int):
+        return np.array(values, dtype=np.uint64 if max(values) >> 63 else np.int64)
+    return np.array(values, dtype=np.float64)
+
+
+def outcomes(function: Callable, vectorized: bool, q_format: QFormat, values: list, *args) -> list:
+    """Converts each value separately, so that a value that cannot be converted is recorded as its error type."""
+    result = [ConversionError] * len(values)
+
+    if not vectorized:
+        for i, value in enumerate(values):
+            try:
+                result[i] = function(q_format, [value], *args)[0]
+            except ConversionError:
+                pass
+        return result
+
+    array = _as_array(values)
+    valid = np.arange(len(values))
+    while True:
+        try:
+            output = function(q_format, array[valid], *args) if len(valid) else []
+            break
+        except ArrayConversionError as e:
+            # indexes are relative to the valid values, drop them and try again
+            valid = np.delete(valid, e.indexes)
+    for i, value in zip(valid.tolist(), output):
+        result[i] = value
+    return result
+
+
+def find_mismatches(values: list, output: list, expected: list, limit: int = 5) -> tuple[int, list[str]]:
+    """Returns number of mismatches and descriptions of the first of them."""
+    mismatches = [f'{value!r} -> {got!r}, expected {want!r}'
+                  for value, got, want in zip(values, output, expected) if got != want]
+    return len(mismatches), mismatches[:limit]
+
+
+def measure(function: Callable, q_format: QFormat, values, args: tuple, repeat: int) -> float:
+    """Returns best time of `repeat` runs in seconds."""
+    return min(Timer(lambda: function(q_format, values, *args)).repeat(repeat, number=1))
+
+
+def run(implementations: list[str], data_types: list[str], exhaustive_bits: int, samples: int,
+        repeat: int) -> list[dict]:
+    results = []
+    for data_type in data_types:
+        q_format = QFormat.get(data_type)
+        raw_values = make_raw_values(q_format, exhaustive_bits, samples)
+        float_list = make_floats(q_format, raw_values).tolist()
+        fixed_values = make_fixed_values(q_format, raw_values)
+
+        cases = []
+        for error_strategy in ERROR_STRATEGIES:
+            expected = [reference_to_fixed(q_format, value, error_strategy) for value in float_list]
+            # time only values that convert without errors
+            timed = [value for value, result in zip(float_list, expected) if result is not ConversionError]
+            cases.append((TO_FIXED, 'to_fixed', error_strategy, float_list, expected, timed, (error_strategy,)))
+
+        expected = [reference_to_float(q_format, value) for value in fixed_values]
+        timed = [value for value, result in zip(fixed_values, expected) if result is not ConversionError]
+        cases.append((TO_FLOAT, 'to_float', None, fixed_values, expected, timed, ()))
+
+        for table, direction, error_strategy, values, expected, timed, args in cases:
+            for name in implementations:
+                if name not in table or not SUPPORTED_DATA_TYPES.get(name, lambda q: True)(q_format):
+                    continue
+                function, vectorized = table[name]
+
+                output = outcomes(function, vectorized, q_format, values, *args)
+                mismatch_count, mismatches = find_mismatches(values, output, expected)
+
+                seconds = measure(function, q_format, _as_array(timed) if vectorized else timed, args, repeat)
+                result = {
+                    'implementation': name,
+                    'direction': direction,
+                    'data_type': data_type,
+                    'error_strategy': error_strategy,
+                    'exhaustive': q_format.bits <= exhaustive_bits,
+                    'count': len(timed),
+                    'seconds': seconds,
+                    'conversions_per_second': len(timed) / seconds if seconds else float('inf'),
+                    'mismatches': mismatch_count,
+                }
+                results.append(result)
+                print(f'{name:24} {data_type:8} {error_strategy or "":6} {len(values):>8} '
+                      f'{result["conversions_per_second"]:>14,.0f}/s '
+                      f'{"OK" if not mismatch_count else f"{mismatch_count} MISMATCHES"}')
+                for mismatch in mismatches:
+                    print(f'    MISMATCH {mismatch}')
+    return results
+
+
+def _key(result: dict) -> tuple:
+    return result['implementation'], result['data_type'], result['error_strategy']
+
+
+def find_regressions(results: list[dict], baseline: list[dict], threshold: float) -> list[str]:
+    """
+    Compares results with baseline. Throughput drop by more than `threshold` (relative) is a regression.
+    """
+    baseline = {_key(result): result for result in baseline}
+    regressions = []
+    for result in results:
+        base = baseline.get(_key(result))
+        if base is None:
+            continue
+        if result['conversions_per_second'] < base['conversions_per_second'] * (1 - threshold):
+            regressions.append(f'{_key(result)}: throughput {result["conversions_per_second"]:,.0f}/s, '
+                               f'baseline {base["conversions_per_second"]:,.0f}/s')
+    return regressions
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--implementations', nargs='+', default=IMPLEMENTATIONS, choices=IMPLEMENTATIONS)
+    parser.add_argument('--data-types', nargs='+', default=list(DATA_TYPES))
+    parser.add_argument('--exhaustive-bits', type=int, default=16,
+                        help='Data types of up to this number of bits are checked exhaustively.')
+    parser.add_argument('--samples', type=int, default=10_000, help='Number of sampled values of wider data types.')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output', help='Path to JSON file to save results to.')
+    parser.add_argument('--baseline', help='Path to JSON file with saved results to compare with.')
+    parser.add_argument('--threshold', type=float, default=0.2, help='Relative change treated as regression.')
+    args = parser.parse_args(argv)
+
+    results = run(args.implementations, args.data_types, args.exhaustive_bits, args.samples, args.repeat)
+    failed = sum(result['mismatches'] for result in results) > 0
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = find_regressions(results, baseline, args.threshold)
+        for regression in regressions:
+            print(f'REGRESSION {regression}')
+        failed = failed or bool(regressions)
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
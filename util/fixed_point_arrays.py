@@ -0,0 +1,715 @@
+"""
+Converts arrays of Q formatted numbers to float arrays and visa versa.
+
+Conversions give the same results as `float_to_fixed` and `fixed_to_float` applied to each value,
+but run over whole numpy arrays. Data types up to 64 bits are supported.
+
+`FixedArray` is vectorized `FixedPoint` for bit-exact simulation of fixed point arithmetic over arrays.
+
+`pack_fixed_array` and `unpack_fixed_array` convert arrays of fixed values to tightly packed bytes and back.
+"""
+
+from typing import Optional, Union
+
+import numpy as np
+
+from fixed_point_numbers import (
+    ConversionError, FixedPoint, QFormat, add_q_format, check_strategies, mul_q_format, sub_q_format, sum_q_format)
+
+
+class ArrayConversionError(ConversionError):
+    """
+    Conversion error of some values of the array. Indexes of the values are stored in `indexes`.
+    """
+
+    def __init__(self, message: str, indexes: np.ndarray):
+        super().__init__(message)
+        self.indexes = indexes
+
+
+def _get_q_format(data_type: Union[str, QFormat]) -> QFormat:
+    q_format = data_type if isinstance(data_type, QFormat) else QFormat.get(data_type)
+    if q_format.bits > 64:
+        raise ConversionError(f'Invalid data type. Data type {q_format.data_type} is wider than 64 bits.')
+    return q_format
+
+
+def fixed_dtype(data_type: Union[str, QFormat]) -> np.dtype:
+    """Returns the smallest unsigned integer dtype that fits the data type."""
+    bits = _get_q_format(data_type).bits
+    for dtype in (np.uint8, np.uint16, np.uint32):
+        if bits <= np.iinfo(dtype).bits:
+            return np.dtype(dtype)
+    return np.dtype(np.uint64)
+
+
+def _check_invalid(invalid: np.ndarray, message: str):
+    """Raises `ArrayConversionError` if any value is invalid, at most ten indexes are listed in the message."""
+    if invalid.any():
+        indexes = np.flatnonzero(invalid)
+        shown = ', '.join(map(str, indexes[:10].tolist())) + (', ...' if len(indexes) > 10 else '')
+        raise ArrayConversionError(f'Invalid value. {message} Indexes ({len(indexes)}): {shown}.', indexes)
+
+
+def _check_fixed(q_format: QFormat, fixed_values) -> np.ndarray:
+    """Checks fixed representations of numbers and returns them as uint64 array."""
+    values = np.asarray(fixed_values)
+
+    if values.dtype.kind not in 'ui' and values.size:
+        raise ConversionError(f'Invalid value type: {values.dtype}.')
+
+    if values.dtype.kind == 'i':
+        _check_invalid(values < 0, 'Given values should be positive.')
+
+    values = values.astype(np.uint64, copy=False)
+    mask = np.uint64(q_format.mask)
+    _check_invalid((values | mask) != mask,
+                   f'Given values do not fit in the given data type {q_format.data_type}.')
+    return values
+
+
+def float_to_fixed_array(
+        data_type: Union[str, QFormat],
+        float_values,
+        error_strategy: str = 'raise') -> np.ndarray:
+    """
+    Converts array of floats into array of fixed representations of numbers. See `float_to_fixed`.
+
+    :param data_type: String containing data type of the fixed number or compiled `QFormat`.
+    :param float_values: Array of floats.
+    :param error_strategy: "raise" or "skip" errors.
+        "raise" raises `ArrayConversionError` with indexes of all values that exceed the bounds.
+        "skip" saturates such values to an extreme value of the range.
+    :return: Array of the smallest unsigned integer dtype that fits the data type.
+    """
+    q_format = _get_q_format(data_type)
+    values = np.asarray(float_values)
+
+    if values.dtype.kind != 'f':
+        raise ConversionError(f'Invalid value type. Given values of type {values.dtype} should be of float type.')
+
+    values = values.astype(np.float64, copy=False)
+
+    if error_strategy == 'raise':
+        _check_invalid(~((q_format.min_val <= values) & (values <= q_format.max_val)),
+                       f'Given values do not fit in given data type {q_format.data_type}. '
+                       f'Acceptable range: [{q_format.min_val}, {q_format.max_val}].')
+        clipped = values
+
+    elif error_strategy == 'skip':
+        if np.isnan(values).any():
+            raise ValueError('cannot convert float NaN to integer')  # same as `round` does
+        clipped = np.clip(values, q_format.min_val, q_format.max_val)
+
+    else:
+        raise ConversionError(f'Invalid error strategy. Given value {error_strategy} is not valid. '
+                              f'Valid values are: "skip", "raise".')
+
+    # convert, `rint` rounds half to even as `round` does
+    scaled = np.abs(np.rint(clipped * float(q_format.scale)))
+
+    overflow = None
+    if q_format.m + q_format.e > 53:
+        # float maximum of data types wider than float mantissa is rounded up and lets the next value in,
+        # it is checked before the cast, since the next value of unsigned 64 bit data types doesn't fit in uint64
+        overflow = (values > 0) & (scaled >= 2.0 ** (q_format.m + q_format.e))
+        if error_strategy == 'raise':
+            _check_invalid(overflow,
+                           f'Given values do not fit in given data type {q_format.data_type}. '
+                           f'Acceptable range: [{q_format.min_val}, {q_format.max_val}].')
+        scaled[overflow] = 0
+    magnitude = scaled.astype(np.uint64)
+
+    # add sign bit to negative values
+    negative = (values < 0) & (magnitude != 0)
+    fixed_values = np.where(negative, magnitude | np.uint64(q_format.sign_mask), magnitude)
+
+    if error_strategy == 'skip':
+        fixed_values[values <= q_format.min_val] = q_format.min_fixed
+        fixed_values[values >= q_format.max_val] = q_format.max_fixed
+        if overflow is not None:
+            fixed_values[overflow] = q_format.max_fixed
+
+    return fixed_values.astype(fixed_dtype(q_format))
+
+
+def fixed_to_float_array(data_type: Union[str, QFormat], fixed_values) -> np.ndarray:
+    """
+    Converts array of fixed representations of numbers into array of floats. See `fixed_to_float`.
+
+    :param data_type: String containing data type of the fixed number or compiled `QFormat`.
+    :param fixed_values: Array of integers.
+    :return: Array of float64.
+    """
+    q_format = _get_q_format(data_type)
+    values = _check_fixed(q_format, fixed_values)
+    scale = float(q_format.scale)
+
+    if not q_format.s:
+        return values / scale
+
+    sign_mask = np.uint64(q_format.sign_mask)
+    negative = (values & sign_mask) != 0
+    magnitude = values & (sign_mask - np.uint64(1))
+    float_values = magnitude / scale
+    np.negative(float_values, out=float_values, where=negative)
+    float_values[negative & (magnitude == 0)] = q_format.min_val
+    return float_values
+
+
+def _get_raw_q_format(data_type: Union[str, QFormat]) -> QFormat:
+    q_format = _get_q_format(data_type)
+    if q_format.m + q_format.e > 63:
+        raise ConversionError(f'Invalid data type. Raw values of data type {q_format.data_type} do not fit in int64.')
+    return q_format
+
+
+def _round_shift_array(raw_values: np.ndarray, shift: int, rounding: str) -> np.ndarray:
+    """Divides raw values by 2 ** shift and rounds the result, see `FixedPoint.cast`."""
+    if rounding == 'floor':
+        return raw_values >> shift
+    if rounding == 'nearest':
+        return ((raw_values >> (shift - 1)) + 1) >> 1
+    return (raw_values + np.where(raw_values < 0, (1 << shift) - 1, 0)) >> shift
+
+
+class FixedArray:
+    """
+    Array of fixed point numbers of the same data type, vectorized `FixedPoint`.
+
+    Raw values are stored in int64 array, so integer and fractional bits of each result should fit in 63 bits.
+    Operands can be `FixedArray` or `FixedPoint`, results are the same as of `FixedPoint` applied to each value.
+
+    >>> x = FixedArray.from_float(np.array([0.5, -0.25, 1.75]), 'S2Q2')
+    >>> (x * FixedPoint.from_float(-0.75, 'S2Q2')).cast('S2Q2', 'nearest')
+    FixedArray([-0.25, 0.25, -1.25], 'S2Q2')
+    """
+
+    __slots__ = ('raw', 'q_format')
+
+    def __init__(self, raw_values, data_type: Union[str, QFormat]):
+        """
+        :param raw_values: Array of signed integers equal to the numbers multiplied by scale of the data type.
+        :param data_type: String containing data type of the fixed numbers or compiled `QFormat`.
+        """
+        q_format = _get_raw_q_format(data_type)
+        raw_values = np.asarray(raw_values)
+
+        if raw_values.dtype.kind not in 'ui':
+            raise ConversionError(f'Invalid value type: {raw_values.dtype}.')
+
+        _check_invalid((raw_values < -q_format.min_fixed) | (raw_values > q_format.max_fixed),
+                       f'Given raw values do not fit in the given data type {q_format.data_type}.')
+
+        self.raw = raw_values.astype(np.int64, copy=False)
+        self.q_format = q_format
+
+    @classmethod
+    def _new(cls, raw_values: np.ndarray, q_format: QFormat):
+        # arithmetic results fit in their data types by construction, skip the checks
+        if raw_values.ndim == 0:
+            return FixedPoint(int(raw_values), q_format)
+        array = object.__new__(cls)
+        array.raw = raw_values
+        array.q_format = q_format
+        return array
+
+    @classmethod
+    def from_float(cls,
+                   float_values,
+                   data_type: Union[str, QFormat],
+                   error_strategy: str = 'raise') -> 'FixedArray':
+        """Converts array of floats into fixed point numbers. See `float_to_fixed_array`."""
+        q_format = _get_raw_q_format(data_type)
+        return cls.from_fixed(float_to_fixed_array(q_format, float_values, error_strategy), q_format)
+
+    @classmethod
+    def from_fixed(cls, fixed_values, data_type: Union[str, QFormat]) -> 'FixedArray':
+        """Creates fixed point numbers from array of their fixed representations. See `fixed_to_float_array`."""
+        q_format = _get_raw_q_format(data_type)
+        values = _check_fixed(q_format, fixed_values)
+
+        sign_mask = np.uint64(q_format.sign_mask)
+        magnitude = (values & ~sign_mask).astype(np.int64)
+        if q_format.s:
+            negative = (values & sign_mask) != 0
+            # the lowest value has only sign bit set
+            magnitude[negative & (magnitude == 0)] = -q_format.min_fixed
+            np.negative(magnitude, out=magnitude, where=negative & (magnitude > 0))
+
+        array = object.__new__(cls)
+        array.raw = magnitude
+        array.q_format = q_format
+        return array
+
+    def to_fixed(self) -> np.ndarray:
+        """Returns array of fixed representations of the numbers, as `float_to_fixed_array` does."""
+        magnitude = np.abs(self.raw).astype(np.uint64)  # abs of the lowest int64 value is fine as unsigned
+        fixed_values = np.where(self.raw < 0, magnitude | np.uint64(self.q_format.sign_mask), magnitude)
+        return fixed_values.astype(fixed_dtype(self.q_format))
+
+    def to_float(self) -> np.ndarray:
+        return self.raw / float(self.q_format.scale)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.to_float().tolist()!r}, {self.q_format.data_type!r})'
+
+    def __len__(self) -> int:
+        return len(self.raw)
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return self.raw.shape
+
+    def __getitem__(self, item) -> Union['FixedArray', FixedPoint]:
+        return self._new(self.raw[item], self.q_format)
+
+    @staticmethod
+    def _operand(other) -> Union[tuple[np.ndarray, QFormat], tuple[None, None]]:
+        if isinstance(other, FixedArray):
+            return other.raw, other.q_format
+        if isinstance(other, FixedPoint):
+            return np.int64(other.raw), _get_raw_q_format(other.q_format)
+        return None, None
+
+    def _add(self, other, sign: int, reflected: bool = False):
+        raw_values, q_format = self._operand(other)
+        if q_format is None:
+            return NotImplemented
+
+        (a_raw, a), (b_raw, b) = (raw_values, q_format), (self.raw, self.q_format)
+        if not reflected:
+            (a_raw, a), (b_raw, b) = (b_raw, b), (a_raw, a)
+
+        result = _get_raw_q_format(add_q_format(a, b) if sign > 0 else sub_q_format(a, b))
+        a_raw = a_raw << (result.e - a.e)
+        b_raw = b_raw << (result.e - b.e)
+        return self._new(a_raw + b_raw if sign > 0 else a_raw - b_raw, result)
+
+    def __add__(self, other):
+        return self._add(other, 1)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        return self._add(other, -1)
+
+    def __rsub__(self, other):
+        return self._add(other, -1, reflected=True)
+
+    def __mul__(self, other):
+        raw_values, q_format = self._operand(other)
+        if q_format is None:
+            return NotImplemented
+        return self._new(self.raw * raw_values, _get_raw_q_format(mul_q_format(self.q_format, q_format)))
+
+    __rmul__ = __mul__
+
+    def __neg__(self) -> 'FixedArray':
+        q_format = _get_raw_q_format(QFormat.from_parts(True, self.q_format.m + self.q_format.s, self.q_format.e))
+        return self._new(-self.raw, q_format)
+
+    def __lshift__(self, shift: int) -> 'FixedArray':
+        q_format = _get_raw_q_format(QFormat.from_parts(self.q_format.s, self.q_format.m + shift, self.q_format.e))
+        return self._new(self.raw << shift, q_format)
+
+    def __rshift__(self, shift: int) -> 'FixedArray':
+        if shift < 0:
+            raise ValueError('negative shift count')
+        q_format = _get_raw_q_format(QFormat.from_parts(self.q_format.s, self.q_format.m, self.q_format.e + shift))
+        return self._new(self.raw, q_format)
+
+    def cast(self,
+             data_type: Union[str, QFormat],
+             rounding: str = 'floor',
+             overflow: str = 'saturate') -> 'FixedArray':
+        """
+        Converts the numbers into another data type. See `FixedPoint.cast`.
+        "raise" overflow strategy raises `ArrayConversionError` with indexes of all values that do not fit.
+        """
+        q_format = _get_raw_q_format(data_type)
+        check_strategies(rounding, overflow)
+        min_raw, max_raw = -q_format.min_fixed, q_format.max_fixed
+
+        shift = q_format.e - self.q_format.e
+        if shift >= 0:
+            # compare before shifting, so that int64 does not overflow
+            low = self.raw < (min_raw >> shift)
+            high = self.raw > (max_raw >> shift)
+            raw_values = self.raw << shift
+        else:
+            raw_values = _round_shift_array(self.raw, -shift, rounding)
+            low = raw_values < min_raw
+            high = raw_values > max_raw
+
+        if overflow == 'saturate':
+            raw_values = np.where(low, min_raw, np.where(high, max_raw, raw_values))
+        elif overflow == 'wrap':
+            if q_format.bits < 64:  # 64-bit values are already wrapped by int64
+                raw_values = raw_values & q_format.mask
+                if q_format.s:
+                    raw_values = np.where(raw_values & q_format.sign_mask, raw_values | ~q_format.mask, raw_values)
+        else:
+            _check_invalid(low | high, f'Values do not fit in given data type {q_format.data_type}. '
+                                       f'Acceptable range: [{q_format.min_val}, {q_format.max_val}].')
+
+        return self._new(raw_values, q_format)
+
+    def sum(self, axis: Optional[int] = None) -> Union['FixedArray', FixedPoint]:
+        """Returns exact sum of the numbers along the axis, see `FixedPoint.sum`."""
+        count = self.raw.size if axis is None else self.raw.shape[axis]
+        return self._new(self.raw.sum(axis), _get_raw_q_format(sum_q_format(self.q_format, count)))
+
+    def cumsum(self, axis: Optional[int] = None) -> 'FixedArray':
+        """Returns exact running sums of the numbers along the axis in data type of the whole sum."""
+        count = self.raw.size if axis is None else self.raw.shape[axis]
+        return self._new(self.raw.cumsum(axis), _get_raw_q_format(sum_q_format(self.q_format, count)))
+
+
+_BIT_ORDERS = ('big', 'little')
+
+
+def _check_byteorder(byteorder: str):
+    if byteorder not in _BIT_ORDERS:
+        raise ConversionError(f'Invalid byte order. Given value {byteorder} is not valid. '
+                              f'Valid values are: "big", "little".')
+
+
+def pack_fixed_array(data_type: Union[str, QFormat], fixed_values, byteorder: str = 'big') -> bytes:
+    """
+    Packs fixed representations of numbers into bytes, each value takes exactly `bits` of the data type.
+    The last byte is padded with zero bits.
+
+    "big" packs values most significant bit first: the first value starts at the most significant bit
+    of the first byte. "little" packs values least significant bit first: the first value starts at
+    the least significant bit of the first byte, as if all values were concatenated into one little endian integer.
+    For data types of 8, 16, 32 or 64 bits the result is the same as of big or little endian integers.
+
+    >>> pack_fixed_array('S8Q4', [0x123, 0xABC]).hex()
+    '123abc'
+    >>> pack_fixed_array('S8Q4', [0x123, 0xABC], 'little').hex()
+    '23c1ab'
+
+    :param data_type: String containing data type of the fixed numbers or compiled `QFormat`.
+    :param fixed_values: Array of fixed representations of numbers, see `float_to_fixed_array`.
+    :param byteorder: "big" or "little".
+    """
+    q_format = _get_q_format(data_type)
+    _check_byteorder(byteorder)
+    dtype = fixed_dtype(q_format).newbyteorder('>' if byteorder == 'big' else '<')
+    values = _check_fixed(q_format, fixed_values).reshape(-1).astype(dtype)
+
+    # bits of each value in the order of the stream, the padding bits of the wider dtype are dropped
+    bits = np.unpackbits(values.view(np.uint8).reshape(-1, dtype.itemsize), axis=1, bitorder=byteorder)
+    bits = bits[:, -q_format.bits:] if byteorder == 'big' else bits[:, :q_format.bits]
+    return np.packbits(bits, bitorder=byteorder).tobytes()
+
+
+def unpack_fixed_array(
+        data_type: Union[str, QFormat],
+        data,
+        count: Optional[int] = None,
+        byteorder: str = 'big') -> np.ndarray:
+    """
+    Unpacks fixed representations of numbers from bytes packed by `pack_fixed_array`.
+
+    :param data_type: String containing data type of the fixed numbers or compiled `QFormat`.
+    :param data: Object that supports buffer protocol (`bytes`, `bytearray`, `memoryview`, `mmap`, etc.).
+    :param count: Number of values to unpack. By default all whole values in the data are unpacked.
+    :param byteorder: "big" or "little".
+    :return: Array of the smallest unsigned integer dtype that fits the data type.
+    """
+    q_format = _get_q_format(data_type)
+    _check_byteorder(byteorder)
+    dtype = fixed_dtype(q_format).newbyteorder('>' if byteorder == 'big' else '<')
+    data = np.frombuffer(data, dtype=np.uint8)
+
+    max_count = len(data) * 8 // q_format.bits
+    if count is None:
+        count = max_count
+    elif not 0 <= count <= max_count:
+        raise ConversionError(f'Invalid count. Data of {len(data)} bytes contains {max_count} values of '
+                              f'data type {q_format.data_type}, but {count} values are requested.')
+
+    bits = np.unpackbits(data, count=count * q_format.bits, bitorder=byteorder).reshape(count, q_format.bits)
+
+    # pad bits of each value up to the dtype width and read them as integers
+    padding = np.zeros((count, dtype.itemsize * 8 - q_format.bits), dtype=np.uint8)
+    bits = np.hstack((padding, bits) if byteorder == 'big' else (bits, padding))
+    values = np.packbits(bits, axis=1, bitorder=byteorder).view(dtype)
+    return values.reshape(count).astype(dtype.newbyteorder('='))
+
+
+if __name__ == '__main__':
+    import operator
+    import unittest
+
+    from fixed_point_numbers import float_to_fixed, fixed_to_float
+
+    DATA_TYPES = ('S2Q2', 'U2Q2', 'S1Q2', 'U0Q2', 'S2Q0', 'U2Q0', 'S4Q4', 'U4Q12', 'S8Q8', 'S1Q31', 'U16Q16',
+                  'U10Q54', 'U0Q64')
+    # data types of `FixedArray`, raw values are int64
+    RAW_DATA_TYPES = tuple(data_type for data_type in DATA_TYPES if QFormat(data_type).m + QFormat(data_type).e <= 63)
+
+    def sample_floats(q_format: QFormat) -> np.ndarray:
+        """Representable values, midpoints between them and values outside the range."""
+        step = 1 / q_format.scale
+        values = np.linspace(q_format.min_val - 2, q_format.max_val + 2, 2001)
+        count = min(int((q_format.max_val - q_format.min_val) / step * 2), 4096)
+        values = np.concatenate((values, q_format.min_val + np.arange(count) * (step / 2),
+                                 [q_format.min_val, q_format.max_val, -0.0, step / 2, -step / 2]))
+        return values
+
+    class TestsFloatToFixedArray(unittest.TestCase):
+
+        def test_same_as_scalar(self):
+            for data_type in DATA_TYPES:
+                with self.subTest(data_type=data_type):
+                    q_format = QFormat(data_type)
+                    values = sample_floats(q_format)
+
+                    output = float_to_fixed_array(data_type, values, 'skip')
+                    self.assertEqual(output.tolist(), [float_to_fixed(data_type, v, 'skip') for v in values.tolist()])
+
+                    # float maximum of data types wider than float mantissa is rounded up and is not valid
+                    valid = values[(q_format.min_val <= values) & (values <= q_format.max_val)
+                                   & (np.rint(values * float(q_format.scale)) < 2.0 ** (q_format.m + q_format.e))]
+                    output = float_to_fixed_array(q_format, valid)
+                    self.assertEqual(output.tolist(), [float_to_fixed(data_type, v) for v in valid.tolist()])
+
+        def test_raise(self):
+            with self.assertRaises(ArrayConversionError) as e:
+                float_to_fixed_array('S2Q2', np.array([0.0, 2.0, 1.0, -2.01, np.nan]))
+            self.assertEqual(e.exception.indexes.tolist(), [1, 3, 4])
+            self.assertIn('Invalid value', str(e.exception))
+
+            # float maximum of the data type is 128.0
+            with self.assertRaises(ArrayConversionError) as e:
+                float_to_fixed_array('S8Q56', np.array([127.5, 128.0, -128.0]))
+            self.assertEqual(e.exception.indexes.tolist(), [1])
+
+            # float maximum of the data type is 1.0, its code doesn't fit in uint64
+            with self.assertRaises(ArrayConversionError) as e:
+                float_to_fixed_array('U0Q64', np.array([0.5, 1.0]))
+            self.assertEqual(e.exception.indexes.tolist(), [1])
+
+        def test_dtype(self):
+            self.assertEqual(float_to_fixed_array('S4Q4', np.zeros(1)).dtype, np.uint8)
+            self.assertEqual(float_to_fixed_array('S4Q12', np.zeros(1)).dtype, np.uint16)
+            self.assertEqual(float_to_fixed_array('S1Q31', np.zeros(1)).dtype, np.uint32)
+            self.assertEqual(float_to_fixed_array('U16Q40', np.zeros(1)).dtype, np.uint64)
+
+        def test_negative(self):
+            for args, expected_output in (
+                    (('S2Q2', np.array([1, 2])), 'Invalid value type'),
+                    (('S2Q2', np.zeros(1), 'pass'), 'Invalid error strategy'),
+                    (('S2Q', np.zeros(1)), 'Invalid data type'),
+                    (('S33Q32', np.zeros(1)), 'Invalid data type'),
+            ):
+                with self.subTest(args=args):
+                    with self.assertRaises(ConversionError) as e:
+                        float_to_fixed_array(*args)
+                    self.assertIn(expected_output, str(e.exception))
+
+    class TestsFixedToFloatArray(unittest.TestCase):
+
+        def test_same_as_scalar(self):
+            for data_type in DATA_TYPES:
+                with self.subTest(data_type=data_type):
+                    q_format = QFormat(data_type)
+                    values = np.arange(min(q_format.mask + 1, 1 << 16), dtype=np.uint64)
+                    values = np.concatenate((values, np.array([q_format.mask, q_format.sign_mask], dtype=np.uint64)))
+                    output = fixed_to_float_array(data_type, values)
+                    self.assertEqual(output.tolist(), [fixed_to_float(data_type, v) for v in values.tolist()])
+
+        def test_negative(self):
+            for args, expected_output, indexes in (
+                    (('S2Q2', np.array([1, 0b1_00_00, 2, 0b1_00_01])), 'Invalid value', [1, 3]),
+                    (('S2Q2', np.array([-1, 1])), 'Invalid value', [0]),
+            ):
+                with self.subTest(args=args):
+                    with self.assertRaises(ArrayConversionError) as e:
+                        fixed_to_float_array(*args)
+                    self.assertIn(expected_output, str(e.exception))
+                    self.assertEqual(e.exception.indexes.tolist(), indexes)
+
+            with self.assertRaises(ConversionError) as e:
+                fixed_to_float_array('S2Q2', np.array([0.5]))
+            self.assertIn('Invalid value type', str(e.exception))
+
+    class TestsFixedArray(unittest.TestCase):
+        data_types = ('S2Q2', 'U2Q2', 'S1Q2', 'U0Q2', 'S2Q0', 'S3Q1')
+
+        @staticmethod
+        def all_numbers(data_type):
+            q_format = QFormat.get(data_type)
+            return FixedArray.from_fixed(np.arange(q_format.mask + 1), q_format)
+
+        def assert_same(self, array, numbers):
+            self.assertEqual(array.q_format, numbers[0].q_format)
+            self.assertEqual(array.raw.tolist(), [number.raw for number in numbers])
+
+        def test_conversion(self):
+            for data_type in RAW_DATA_TYPES:
+                with self.subTest(data_type=data_type):
+                    q_format = QFormat(data_type)
+                    values = sample_floats(q_format)
+                    array = FixedArray.from_float(values, data_type, 'skip')
+                    self.assert_same(array, [FixedPoint.from_float(v, data_type, 'skip') for v in values.tolist()])
+                    self.assertEqual(array.to_fixed().tolist(),
+                                     float_to_fixed_array(data_type, values, 'skip').tolist())
+                    self.assertEqual(array.to_float().tolist(), [fixed_to_float(data_type, v)
+                                                                 for v in array.to_fixed().tolist()])
+                    self.assertEqual(FixedArray(array.raw, data_type).raw.tolist(), array.raw.tolist())
+
+        def test_same_as_scalar(self):
+            for data_type_a in self.data_types:
+                for data_type_b in self.data_types:
+                    for operation in (operator.add, operator.sub, operator.mul):
+                        with self.subTest(a=data_type_a, b=data_type_b, operation=operation.__name__):
+                            a = self.all_numbers(data_type_a)
+                            b = self.all_numbers(data_type_b)
+                            a_raw = np.repeat(a.raw, len(b))
+                            b_raw = np.tile(b.raw, len(a))
+                            result = operation(FixedArray(a_raw, a.q_format), FixedArray(b_raw, b.q_format))
+                            self.assert_same(result, [operation(FixedPoint(int(x), a.q_format),
+                                                                FixedPoint(int(y), b.q_format))
+                                                      for x, y in zip(a_raw, b_raw)])
+                            # scalar operand on either side
+                            self.assert_same(operation(a, b[1]), [operation(x, b[1]) for x in a])
+                            self.assert_same(operation(b[1], a), [operation(b[1], x) for x in a])
+
+        def test_shift(self):
+            array = self.all_numbers('S3Q1')
+            numbers = list(array)
+            self.assert_same(array << 3, [number << 3 for number in numbers])
+            self.assert_same(array >> 3, [number >> 3 for number in numbers])
+            self.assert_same(-array, [-number for number in numbers])
+
+        def test_cast(self):
+            array = self.all_numbers('S3Q3')
+            for data_type in self.data_types + ('S2Q6', 'U1Q5', 'S1Q62', 'S64Q0'):
+                for rounding in ('floor', 'nearest', 'zero'):
+                    for overflow in ('saturate', 'wrap'):
+                        with self.subTest(data_type=data_type, rounding=rounding, overflow=overflow):
+                            self.assert_same(array.cast(data_type, rounding, overflow),
+                                             [number.cast(data_type, rounding, overflow) for number in array])
+
+        def test_cast_raise(self):
+            array = FixedArray.from_float(np.array([0.5, 2.0, -1.0, -2.5]), 'S3Q1')
+            with self.assertRaises(ArrayConversionError) as e:
+                array.cast('S2Q2', overflow='raise')
+            self.assertEqual(e.exception.indexes.tolist(), [1, 3])
+            self.assertEqual(array[[0, 2]].cast('S2Q2', overflow='raise').to_float().tolist(), [0.5, -1.0])
+
+        def test_wide(self):
+            values = np.array([-1.0, 1 - 2 ** -31, 0.5, -2 ** -31])
+            array = FixedArray.from_float(values, 'S1Q31')
+            product = array * array
+            self.assertEqual(product.q_format, QFormat('S2Q62'))
+            self.assert_same(product, [x * x for x in array])
+            self.assert_same(product.cast('S1Q31', 'nearest'), [(x * x).cast('S1Q31', 'nearest') for x in array])
+            with self.assertRaises(ConversionError):
+                product * array
+
+        def test_sum(self):
+            array = FixedArray.from_float(np.array([[-2.0, 1.75, -0.25], [1.0, -2.0, 0.5]]), 'S2Q2')
+            numbers = [[array[i, j] for j in range(3)] for i in range(2)]
+            self.assertEqual(array.sum(), FixedPoint.sum(numbers[0] + numbers[1]))
+            self.assert_same(array.sum(axis=1), [FixedPoint.sum(row) for row in numbers])
+            self.assertEqual(array.sum(axis=0).q_format, QFormat('S3Q2'))
+            self.assertEqual(array.cumsum(axis=1).to_float().tolist(), [[-2.0, -0.25, -0.5], [1.0, -1.0, -0.5]])
+            self.assertEqual(array.cumsum(axis=1).q_format, QFormat('S4Q2'))
+
+        def test_fir_filter(self):
+            # S1Q15 FIR filter over a long signal, same as filtering each sample with `FixedPoint`
+            rng = np.random.default_rng(0)
+            coefficients = [FixedPoint.from_float(c, 'S1Q15') for c in (0.25, -0.5, 0.125, 0.0625)]
+            samples = FixedArray.from_float(rng.uniform(-1, 1, 100_000), 'S1Q15', 'skip')
+            taps = len(coefficients)
+            output = coefficients[0] * samples[:len(samples) - taps + 1]
+            for k, c in enumerate(coefficients[1:], 1):
+                output = output + c * samples[k:len(samples) - taps + 1 + k]
+            output = output.cast('S1Q15', 'nearest')
+
+            for n in range(0, len(output), 997):
+                expected = FixedPoint.sum(c * samples[n + k] for k, c in enumerate(coefficients))
+                self.assertEqual(output[n], expected.cast('S1Q15', 'nearest'))
+
+        def test_negative(self):
+            for function, expected_output in (
+                    (lambda: FixedArray([16], 'S3Q1'), 'Invalid value'),
+                    (lambda: FixedArray([0.5], 'S3Q1'), 'Invalid value type'),
+                    (lambda: FixedArray([0], 'U64Q0'), 'Invalid data type'),
+                    (lambda: FixedArray([0], 'S3Q1').cast('S3Q1', 'ceil'), 'Invalid rounding'),
+                    (lambda: FixedArray([0], 'S3Q1').cast('S3Q1', overflow='skip'), 'Invalid overflow'),
+            ):
+                with self.subTest(expected_output=expected_output):
+                    with self.assertRaises(ConversionError) as e:
+                        function()
+                    self.assertIn(expected_output, str(e.exception))
+
+    class TestsPackFixedArray(unittest.TestCase):
+        data_types = ('U0Q1', 'U3Q0', 'S4Q8', 'S2Q2', 'U5Q6', 'S8Q8', 'S1Q23', 'U7Q30', 'S1Q31', 'U16Q47', 'S8Q56')
+
+        @staticmethod
+        def pack(fixed_values, bits, byteorder):
+            """Reference packing through one Python integer."""
+            size = (len(fixed_values) * bits + 7) // 8
+            if byteorder == 'big':
+                stream = 0
+                for value in fixed_values:
+                    stream = stream << bits | value
+                return (stream << (size * 8 - len(fixed_values) * bits)).to_bytes(size, 'big')
+            stream = sum(value << (i * bits) for i, value in enumerate(fixed_values))
+            return stream.to_bytes(size, 'little')
+
+        def test_same_as_reference(self):
+            rng = np.random.default_rng(0)
+            for data_type in self.data_types:
+                for byteorder in ('big', 'little'):
+                    for count in (0, 1, 7, 100):
+                        with self.subTest(data_type=data_type, byteorder=byteorder, count=count):
+                            q_format = QFormat(data_type)
+                            fixed_values = rng.integers(0, q_format.mask, count, dtype=np.uint64, endpoint=True)
+                            data = pack_fixed_array(data_type, fixed_values, byteorder)
+                            fixed_values = fixed_values.tolist()
+                            self.assertEqual(data, self.pack(fixed_values, q_format.bits, byteorder))
+
+                            output = unpack_fixed_array(data_type, memoryview(data), count, byteorder)
+                            self.assertEqual(output.dtype, fixed_dtype(data_type))
+                            self.assertEqual(output.tolist(), fixed_values)
+
+        def test_round_trip(self):
+            values = np.linspace(-8, 8, 1001)
+            fixed_values = float_to_fixed_array('S4Q8', values, 'skip')
+            data = bytearray(pack_fixed_array('S4Q8', fixed_values))
+            self.assertEqual(len(data), 1001 * 12 // 8 + 1)
+            output = unpack_fixed_array('S4Q8', data, 1001)
+            self.assertEqual([fixed_to_float('S4Q8', v) for v in output.tolist()],
+                             [fixed_to_float('S4Q8', float_to_fixed('S4Q8', v, 'skip')) for v in values.tolist()])
+
+        def test_byte_aligned(self):
+            fixed_values = np.array([0x1234, 0xFFFF, 0x8000], dtype=np.uint16)
+            self.assertEqual(pack_fixed_array('S8Q8', fixed_values), fixed_values.astype('>u2').tobytes())
+            self.assertEqual(pack_fixed_array('S8Q8', fixed_values, 'little'), fixed_values.astype('<u2').tobytes())
+
+        def test_default_count(self):
+            # 3 bytes hold two 12 bits values, 4 bytes hold two values and padding
+            self.assertEqual(unpack_fixed_array('S4Q8', bytes(3)).tolist(), [0, 0])
+            self.assertEqual(unpack_fixed_array('S4Q8', bytes(4)).tolist(), [0, 0])
+
+        def test_negative(self):
+            for function, expected_output in (
+                    (lambda: pack_fixed_array('S4Q8', [0x1000]), 'Invalid value'),
+                    (lambda: pack_fixed_array('S4Q8', [0x100], 'middle'), 'Invalid byte order'),
+                    (lambda: unpack_fixed_array('S4Q8', bytes(3), 3), 'Invalid count'),
+                    (lambda: unpack_fixed_array('S4Q8', bytes(3), byteorder='middle'), 'Invalid byte order'),
+                    (lambda: unpack_fixed_array('S33Q32', bytes(9)), 'Invalid data type'),
+            ):
+                with self.subTest(expected_output=expected_output):
+                    with self.assertRaises(ConversionError) as e:
+                        function()
+                    self.assertIn(expected_output, str(e.exception))
+
+    unittest.main()
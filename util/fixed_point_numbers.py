@@ -1,11 +1,17 @@
 """
 Converts Q formatted number to float and visa versa.
 
+`FixedPoint` is a Q formatted number with bit-exact fixed point arithmetic: addition, subtraction, multiplication,
+shifts and casts to other data types with rounding and overflow handling.
+
 To get information about Q number format see wiki:
     https://en.wikipedia.org/wiki/Q_(number_format)
 """
 
 import re
+from collections.abc import Iterable
+from functools import lru_cache
+from typing import Union
 
 
 class ConversionError(Exception):
@@ -16,7 +22,191 @@ class ConversionError(Exception):
 _r = re.compile('(?P<s>[SU])(?P<m>[0-9]+)Q(?P<e>[0-9]+)')
 
 
-def float_to_fixed(data_type: str, float_value: float, error_strategy: str = 'raise') -> int:
+class QFormat:
+    """
+    Compiled data type of the fixed number.
+    Data type string is parsed once, scale, bounds and masks are precomputed.
+
+    data_type should contain fixed number type representation.
+    First char should be U (unsigned) or S(signed). Next is the number of bits for significand (integer part).
+    Next should come the Q char and next is the number of bits for exponent (fractional part).
+    Example: S4Q4. Here the number of significand bits is 3, 1 bit is taken by sign. And next 4 bits represent exponent.
+    In total here is a 8 bits number.
+
+    Use `QFormat.get` to reuse already compiled data types.
+    """
+
+    __slots__ = ('data_type', 's', 'm', 'e', 'bits', 'scale', 'min_val', 'max_val', 'min_fixed', 'max_fixed',
+                 'mask', 'sign_mask')
+
+    def __init__(self, data_type: str):
+        """
+        :param data_type: String containing data type of the fixed number.
+        """
+
+        # parse data_type
+        match = _r.search(data_type)
+        if not match:
+            raise ConversionError(f'Invalid data type. '
+                                  f'Given data type {data_type} should meet the rules. See function description.')
+
+        # get mantissa value, check it later
+        m = int(match['m'])  # mantissa
+
+        # get exponent value and check it
+        e = int(match['e'])  # exponent
+
+        # get sign value
+        if match['s'] == 'S':
+            if m == 0:
+                raise ConversionError(f'Invalid data type. '
+                                      f'Significand should be greater than zero in the given data type {data_type}.')
+            s = True
+            m -= 1
+        else:
+            s = False
+
+        if m == 0 and e == 0:
+            raise ConversionError(f'Invalid data type. '
+                                  f'The final data type {data_type} should not be of zero length.')
+
+        self.data_type = data_type
+        self.s = s
+        self.m = m
+        self.e = e
+        self.bits = s + m + e
+        self.scale = 1 << e
+
+        # minimum and maximum value
+        self.min_val = - (1 << m) if s is True else 0
+        self.max_val = (1 << m) - 1 / (1 << e)
+
+        # fixed representation of minimum and maximum value
+        self.min_fixed = 1 << (m + e) if s is True else 0
+        self.max_fixed = (1 << (m + e)) - 1
+
+        self.mask = (1 << self.bits) - 1  # all bits
+        self.sign_mask = 1 << (m + e) if s is True else 0
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get(data_type: str) -> 'QFormat':
+        """Returns compiled data type, each data type string is compiled only once."""
+        return QFormat(data_type)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def from_parts(s: bool, m: int, e: int) -> 'QFormat':
+        """
+        Returns compiled data type by its parts.
+
+        :param s: True if signed.
+        :param m: Number of integer bits without the sign bit.
+        :param e: Number of fractional bits.
+        """
+        return QFormat.get(f'{"S" if s else "U"}{m + s}Q{e}')
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.data_type!r})'
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, QFormat):
+            return NotImplemented
+        return (self.s, self.m, self.e) == (other.s, other.m, other.e)
+
+    def __hash__(self) -> int:
+        return hash((self.s, self.m, self.e))
+
+    def to_fixed(self, float_value: float, error_strategy: str = 'raise') -> int:
+        """
+        Converts float into a fixed representation of a number. See `float_to_fixed`.
+        """
+
+        if not isinstance(float_value, float):
+            raise ConversionError(
+                f'Invalid value type. Given value {float_value} of type {type(float_value)} should be of float type.')
+
+        if error_strategy == 'raise':
+            # check if the value feats in variable type
+            if not (self.min_val <= float_value <= self.max_val):
+                raise ConversionError(
+                    f'Invalid value. Given value {float_value} does not fit in given data type {self.data_type}. '
+                    f'Acceptable range: [{self.min_val}, {self.max_val}].')
+
+        elif error_strategy == 'skip':
+            if float_value <= self.min_val:
+                return self.min_fixed
+            if float_value >= self.max_val:
+                return self.max_fixed
+
+        else:
+            raise ConversionError(f'Invalid error strategy. Given value {error_strategy} is not valid. '
+                                  f'Valid values are: "skip", "raise".')
+
+        # convert
+        fixed_value = round(float_value * self.scale)
+
+        # float maximum of data types wider than float mantissa is rounded up and lets the next value in
+        if fixed_value > self.max_fixed:
+            raise ConversionError(
+                f'Invalid value. Given value {float_value} does not fit in given data type {self.data_type}. '
+                f'Acceptable range: [{self.min_val}, {self.max_val}].')
+
+        # fix negative value
+        if float_value < 0 and fixed_value != 0:
+            fixed_value = -fixed_value | self.sign_mask  # convert to positive and add sign bit
+
+        return fixed_value
+
+    def to_float(self, fixed_value: int) -> float:
+        """
+        Converts fixed into a float representation of a number. See `fixed_to_float`.
+        """
+
+        self._check_fixed(fixed_value)
+
+        # convert
+        if fixed_value & self.sign_mask:  # from signed value with sign bit set
+            if fixed_value == self.sign_mask:  # if this is a lowest value
+                return float(self.min_val)
+            return - (fixed_value & (self.sign_mask - 1)) / self.scale
+
+        return fixed_value / self.scale
+
+    def to_raw(self, fixed_value: int) -> int:
+        """
+        Converts fixed into a raw representation of a number: signed integer equal to the number multiplied by scale.
+        """
+        self._check_fixed(fixed_value)
+
+        if fixed_value & self.sign_mask:
+            # the lowest value has only sign bit set
+            return -(fixed_value ^ self.sign_mask or self.sign_mask)
+
+        return fixed_value
+
+    def from_raw(self, raw_value: int) -> int:
+        """
+        Converts raw into a fixed representation of a number, inverse of `to_raw`.
+        Raw value should be in range [-min_fixed, max_fixed].
+        """
+        return -raw_value | self.sign_mask if raw_value < 0 else raw_value
+
+    def _check_fixed(self, fixed_value: int):
+        # check value
+        if not isinstance(fixed_value, int):
+            raise ConversionError(f'Invalid value type: {type(fixed_value)}.')
+
+        if fixed_value < 0:
+            raise ConversionError(f'Invalid value. The value {fixed_value} should be positive.')
+
+        # set all bits and check if the value does not exceed the masked data type
+        if not (fixed_value | self.mask == self.mask):
+            raise ConversionError(f'Invalid value. The given value {fixed_value} '
+                                  f'does not fit in the given data type {self.data_type}.')
+
+
+def float_to_fixed(data_type: Union[str, QFormat], float_value: float, error_strategy: str = 'raise') -> int:
     """
     Converts float into a fixed representation of a number.
 
@@ -26,7 +216,7 @@ def float_to_fixed(data_type: str, float_value: float, error_strategy: str = 'ra
     Example: S4Q4. Here the number of significand bits is 3, 1 bit is taken by sign. And next 4 bits represent exponent.
     In total here is a 8 bits number.
 
-    :param data_type: String containing data type of the fixed number.
+    :param data_type: String containing data type of the fixed number or compiled `QFormat`.
     :param float_value: Float value to convert from.
     :param error_strategy: "raise" or "skip" errors.
         This option influence on how to handle the values that exceed any bound.
@@ -34,140 +224,261 @@ def float_to_fixed(data_type: str, float_value: float, error_strategy: str = 'ra
         "raise" can raise ConversionError in a similar case.
         Setting this option to "skip" doesn't mean that other exceptions cannot raise.
     """
+    if not isinstance(data_type, QFormat):
+        data_type = QFormat.get(data_type)
+    return data_type.to_fixed(float_value, error_strategy)
 
-    if not isinstance(float_value, float):
-        raise ConversionError(
-            f'Invalid value type. Given value {float_value} of type {type(float_value)} should be of float type.')
-
-    if error_strategy not in ('skip', 'raise'):
-        raise ConversionError(f'Invalid error strategy. Given value {error_strategy} is not valid. '
-                              f'Valid values are: "skip", "raise".')
 
-    # parse data_type
-    match = _r.search(data_type)
-    if not match:
-        raise ConversionError(f'Invalid data type. '
-                              f'Given data type {data_type} should meet the rules. See function description.')
+def fixed_to_float(data_type: Union[str, QFormat], fixed_value: int) -> float:
+    """
+    Converts fixed into a float representation of a number.
 
-    # get mantissa value, check it later
-    m = int(match['m'])  # mantissa
+    data_type should contain fixed number type representation.
+    First char should be U (unsigned) or S(signed). Next is the number of bits for significand (integer part).
+    Next should come the Q char and next is the number of bits for exponent (fractional part).
+    Example: S4Q4. Here the number of significand bits is 3, 1 bit is taken by sign. And next 4 bits represent exponent.
+    In total here is a 8 bits number.
 
-    # get exponent value and check it
-    e = int(match['e'])  # exponent
+    :param data_type: string containing data type of the fixed number or compiled `QFormat`
+    :param fixed_value: int value to convert from to float
+    """
+    if not isinstance(data_type, QFormat):
+        data_type = QFormat.get(data_type)
+    return data_type.to_float(fixed_value)
 
-    # get sign value
-    if match['s'] == 'S':
-        if m == 0:
-            raise ConversionError(f'Invalid data type. '
-                                  f'Significand should be greater than zero in the given data type {data_type}.')
-        s = True
-        m -= 1
-    else:
-        s = False
 
-    if m == 0 and e == 0:
-        raise ConversionError(f'Invalid data type. '
-                              f'The final data type {data_type} should not be of zero length.')
+ROUNDINGS = ('floor', 'nearest', 'zero')
+OVERFLOWS = ('saturate', 'wrap', 'raise')
 
-    # calculate maximum and minimum value
-    min_val = - (1 << m) if s is True else 0
-    max_val = (1 << m) - 1 / (1 << e)
 
-    # check if the value feats in variable type
-    if error_strategy == 'raise' and not (min_val <= float_value <= max_val):
-        raise ConversionError(
-            f'Invalid value. Given value {float_value} does not fit in given data type {data_type}. '
-            f'Acceptable range: [{min_val}, {max_val}].')
+def common_q_format(*q_formats: QFormat) -> QFormat:
+    """Returns the narrowest data type that holds any value of given data types."""
+    return QFormat.from_parts(any(q.s for q in q_formats), max(q.m for q in q_formats), max(q.e for q in q_formats))
 
-    if error_strategy == 'skip':
-        if float_value <= min_val:
-            return 1 << (m + e) if s is True else 0
-        if float_value >= max_val:
-            return (1 << (m + e)) - 1
 
-    # convert
-    fixed_value = round(float_value * (1 << e))
+def sum_q_format(q_format: QFormat, count: int) -> QFormat:
+    """Returns data type of the exact sum of `count` values of the data type, guard bits are added to integer part."""
+    return QFormat.from_parts(q_format.s, q_format.m + (count - 1).bit_length(), q_format.e)
 
-    # fix negative value
-    if float_value < 0 and fixed_value != 0:
-        fixed_value = abs(fixed_value) | (1 << (m + e))  # convert to positive and add sign bit
 
-    return fixed_value
+def add_q_format(a: QFormat, b: QFormat) -> QFormat:
+    """Returns data type of the exact sum: one more integer bit than the widest operand."""
+    return sum_q_format(common_q_format(a, b), 2)
 
 
-def fixed_to_float(data_type: str, fixed_value: int) -> float:
+def sub_q_format(a: QFormat, b: QFormat) -> QFormat:
     """
-    Converts fixed into a float representation of a number.
+    Returns data type of the exact difference, it is always signed.
+    Difference of unsigned numbers is less than the widest operand in magnitude and needs no extra integer bit.
+    """
+    return QFormat.from_parts(True, max(a.m, b.m) + (a.s or b.s), max(a.e, b.e))
 
-    data_type should contain fixed number type representation.
-    First char should be U (unsigned) or S(signed). Next is the number of bits for significand (integer part).
-    Next should come the Q char and next is the number of bits for exponent (fractional part).
-    Example: S4Q4. Here the number of significand bits is 3, 1 bit is taken by sign. And next 4 bits represent exponent.
-    In total here is a 8 bits number.
 
-    :param data_type: string containing data type of the fixed number
-    :param fixed_value: int value to convert from to float
+def mul_q_format(a: QFormat, b: QFormat) -> QFormat:
+    """
+    Returns data type of the exact product: integer and fractional bits are summed up.
+    Product of two signed numbers needs one more integer bit to hold (-min) * (-min).
     """
+    return QFormat.from_parts(a.s or b.s, a.m + b.m + (a.s and b.s), a.e + b.e)
 
-    # check value
-    if not isinstance(fixed_value, int):
-        raise ConversionError(f'Invalid value type: {type(fixed_value)}.')
 
-    # parse data_type
-    match = _r.search(data_type)
-    if not match:
-        raise ConversionError(f'Invalid data type. '
-                              f'Given data type {data_type} should meet the rules. See function description.')
+def check_strategies(rounding: str, overflow: str):
+    """Raises `ConversionError` if rounding or overflow strategy is unknown."""
+    if rounding not in ROUNDINGS:
+        raise ConversionError(f'Invalid rounding. Given value {rounding} is not valid. '
+                              f'Valid values are: {", ".join(ROUNDINGS)}.')
+    if overflow not in OVERFLOWS:
+        raise ConversionError(f'Invalid overflow. Given value {overflow} is not valid. '
+                              f'Valid values are: {", ".join(OVERFLOWS)}.')
 
-    # get mantissa value, check it later
-    m = int(match['m'])  # mantissa
 
-    # get exponent value and check it
-    e = int(match['e'])  # exponent
+def _as_q_format(data_type: Union[str, QFormat]) -> QFormat:
+    return data_type if isinstance(data_type, QFormat) else QFormat.get(data_type)
 
-    # get sign value
-    if match['s'] == 'S':
-        if m == 0:
-            raise ConversionError(f'Invalid data type. '
-                                  f'Significand should be greater than zero in the given data type {data_type}.')
-        s = 1
-        m -= 1
-    else:
-        s = 0
-
-    if m == 0 and e == 0:
-        raise ConversionError(f'Invalid data type. '
-                              f'The final data type {data_type} should not be of zero length.')
-
-    if fixed_value < 0:
-        raise ConversionError(f'Invalid value. The value {fixed_value} should be positive.')
-
-    mask = (1 << (s + m + e)) - 1  # all bits
-    if not (fixed_value | mask == mask):  # set all bits and check if the value does not exceed the masked data type
-        raise ConversionError(f'Invalid value. '
-                              f'The given value {fixed_value} does not fit in the given data type {data_type}.')
-
-    # convert
-    if fixed_value == 0:
-        float_value = 0
-    elif s:  # from signed value
-        mask = (1 << (m + e))  # mask for sign bit
-        lowest = fixed_value & mask  # value that contains only sign bit, also it is a lowest possible float value
-        if lowest:  # if sign bit is set
-            if lowest == fixed_value:  # if this is a lowest value
-                float_value = - (1 << m)
+
+def _round_shift(raw_value: int, shift: int, rounding: str) -> int:
+    """Divides raw value by 2 ** shift and rounds the result."""
+    if rounding == 'floor':
+        return raw_value >> shift
+    if rounding == 'nearest':  # half up, as adding a half of LSB before truncation does
+        return ((raw_value >> (shift - 1)) + 1) >> 1
+    # towards zero
+    return (raw_value + ((1 << shift) - 1 if raw_value < 0 else 0)) >> shift
+
+
+class FixedPoint:
+    """
+    Fixed point number for bit-exact simulation of fixed point arithmetic.
+
+    The number is stored as raw value, i.e. signed integer equal to the number multiplied by scale of its data type.
+    Arithmetic is exact, data type of the result is derived from data types of operands by Q format rules,
+    see `add_q_format`, `sub_q_format`, `mul_q_format`. Shifts are exact too: `<<` adds integer bits and
+    `>>` adds fractional bits. Use `cast` to round and saturate the result into the data type of a register.
+
+    >>> a = FixedPoint.from_float(1.75, 'S2Q2')
+    >>> b = FixedPoint.from_float(-0.75, 'S2Q2')
+    >>> a * b
+    FixedPoint(-1.3125, 'S4Q4')
+    >>> (a * b).cast('S2Q2')
+    FixedPoint(-1.5, 'S2Q2')
+    >>> (a * b).cast('S2Q2', rounding='nearest')
+    FixedPoint(-1.25, 'S2Q2')
+    >>> (a * b).to_fixed() == float_to_fixed('S4Q4', -1.3125)
+    True
+    """
+
+    __slots__ = ('raw', 'q_format')
+
+    def __init__(self, raw_value: int, data_type: Union[str, QFormat]):
+        """
+        :param raw_value: Signed integer equal to the number multiplied by scale of the data type.
+        :param data_type: String containing data type of the fixed number or compiled `QFormat`.
+        """
+        q_format = _as_q_format(data_type)
+
+        if not isinstance(raw_value, int):
+            raise ConversionError(f'Invalid value type: {type(raw_value)}.')
+
+        if not -q_format.min_fixed <= raw_value <= q_format.max_fixed:
+            raise ConversionError(f'Invalid value. The raw value {raw_value} '
+                                  f'does not fit in the given data type {q_format.data_type}.')
+
+        self.raw = raw_value
+        self.q_format = q_format
+
+    @classmethod
+    def _new(cls, raw_value: int, q_format: QFormat) -> 'FixedPoint':
+        # raw value of arithmetic results fits in its data type by construction, skip the checks
+        number = object.__new__(cls)
+        number.raw = raw_value
+        number.q_format = q_format
+        return number
+
+    @classmethod
+    def from_float(cls,
+                   float_value: float,
+                   data_type: Union[str, QFormat],
+                   error_strategy: str = 'raise') -> 'FixedPoint':
+        """Converts float into fixed point number. See `float_to_fixed`."""
+        q_format = _as_q_format(data_type)
+        return cls._new(q_format.to_raw(q_format.to_fixed(float_value, error_strategy)), q_format)
+
+    @classmethod
+    def from_fixed(cls, fixed_value: int, data_type: Union[str, QFormat]) -> 'FixedPoint':
+        """Creates fixed point number from its fixed representation. See `fixed_to_float`."""
+        q_format = _as_q_format(data_type)
+        return cls._new(q_format.to_raw(fixed_value), q_format)
+
+    def to_fixed(self) -> int:
+        """Returns fixed representation of the number, as `float_to_fixed` does."""
+        return self.q_format.from_raw(self.raw)
+
+    def to_float(self) -> float:
+        return self.raw / self.q_format.scale
+
+    __float__ = to_float
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.to_float()!r}, {self.q_format.data_type!r})'
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, FixedPoint):
+            return NotImplemented
+        return self.raw == other.raw and self.q_format == other.q_format
+
+    def __hash__(self) -> int:
+        return hash((self.raw, self.q_format))
+
+    def __add__(self, other: 'FixedPoint') -> 'FixedPoint':
+        if not isinstance(other, FixedPoint):
+            return NotImplemented
+        q_format = add_q_format(self.q_format, other.q_format)
+        return self._new((self.raw << (q_format.e - self.q_format.e)) + (other.raw << (q_format.e - other.q_format.e)),
+                         q_format)
+
+    def __sub__(self, other: 'FixedPoint') -> 'FixedPoint':
+        if not isinstance(other, FixedPoint):
+            return NotImplemented
+        q_format = sub_q_format(self.q_format, other.q_format)
+        return self._new((self.raw << (q_format.e - self.q_format.e)) - (other.raw << (q_format.e - other.q_format.e)),
+                         q_format)
+
+    def __mul__(self, other: 'FixedPoint') -> 'FixedPoint':
+        if not isinstance(other, FixedPoint):
+            return NotImplemented
+        return self._new(self.raw * other.raw, mul_q_format(self.q_format, other.q_format))
+
+    def __neg__(self) -> 'FixedPoint':
+        q_format = self.q_format
+        return self._new(-self.raw, QFormat.from_parts(True, q_format.m + q_format.s, q_format.e))
+
+    def __lshift__(self, shift: int) -> 'FixedPoint':
+        q_format = self.q_format
+        return self._new(self.raw << shift, QFormat.from_parts(q_format.s, q_format.m + shift, q_format.e))
+
+    def __rshift__(self, shift: int) -> 'FixedPoint':
+        if shift < 0:
+            raise ValueError('negative shift count')
+        q_format = self.q_format
+        return self._new(self.raw, QFormat.from_parts(q_format.s, q_format.m, q_format.e + shift))
+
+    def cast(self,
+             data_type: Union[str, QFormat],
+             rounding: str = 'floor',
+             overflow: str = 'saturate') -> 'FixedPoint':
+        """
+        Converts the number into another data type.
+
+        :param data_type: String containing data type of the fixed number or compiled `QFormat`.
+        :param rounding: How to drop fractional bits.
+            "floor" rounds towards minus infinity, as arithmetic shift right does.
+            "nearest" rounds to the nearest value, halves are rounded up.
+            "zero" rounds towards zero.
+        :param overflow: How to handle values that exceed any bound.
+            "saturate" converts the value to an extreme value of the range.
+            "wrap" drops the most significant bits as two's complement arithmetic does.
+            "raise" raises ConversionError.
+        """
+        q_format = _as_q_format(data_type)
+        check_strategies(rounding, overflow)
+
+        shift = q_format.e - self.q_format.e
+        raw_value = self.raw << shift if shift >= 0 else _round_shift(self.raw, -shift, rounding)
+
+        if not -q_format.min_fixed <= raw_value <= q_format.max_fixed:
+            if overflow == 'saturate':
+                raw_value = max(-q_format.min_fixed, min(raw_value, q_format.max_fixed))
+            elif overflow == 'wrap':
+                raw_value &= q_format.mask
+                if raw_value & q_format.sign_mask:
+                    raw_value |= ~q_format.mask  # extend the sign
             else:
-                float_value = - (fixed_value & (mask - 1)) / (1 << e)
-        else:  # has no sign
-            float_value = fixed_value / (1 << e)
-    else:  # from unsigned
-        float_value = fixed_value / (1 << e)
+                raise ConversionError(f'Invalid value. Value {self.to_float()} does not fit '
+                                      f'in given data type {q_format.data_type}. '
+                                      f'Acceptable range: [{q_format.min_val}, {q_format.max_val}].')
+
+        return self._new(raw_value, q_format)
 
-    return float(float_value)
+    @staticmethod
+    def sum(numbers: Iterable['FixedPoint']) -> 'FixedPoint':
+        """
+        Returns exact sum of the numbers. Integer part of the result is extended by guard bits,
+        so that the sum never overflows, see `sum_q_format`.
+        """
+        numbers = list(numbers)
+        if not numbers:
+            raise ConversionError('Invalid value. Sum of no numbers has no data type.')
+
+        q_format = common_q_format(*{number.q_format for number in numbers})
+        raw_value = sum(number.raw << (q_format.e - number.q_format.e) for number in numbers)
+        return FixedPoint._new(raw_value, sum_q_format(q_format, len(numbers)))
 
 
 if __name__ == '__main__':
+    import math
+    import operator
     import unittest
+    from fractions import Fraction
 
     class TestsFloatToFixed(unittest.TestCase):
         positive_tests = (
@@ -270,6 +581,7 @@ if __name__ == '__main__':
 
             # boundary values
             (('U0Q8', 4.0, 'raise'), 'Invalid value'),
+            (('S8Q56', 128.0, 'raise'), 'Invalid value'),  # float maximum of the data type is 128.0
             (('U2Q2', -0.01, 'raise'), 'Invalid value'),
             (('S2Q2', 1.76, 'raise'), 'Invalid value'),
             (('S2Q2', -2.01, 'raise'), 'Invalid value'),
@@ -372,4 +684,186 @@ if __name__ == '__main__':
                         fixed_to_float(*input_data)
                     self.assertIn(expected_output, str(e.exception))
 
+    class TestsQFormat(unittest.TestCase):
+
+        def test_same_as_string_data_type(self):
+            for input_data, expected_output in TestsFloatToFixed.positive_tests:
+                with self.subTest(input_data=input_data, expected_output=expected_output):
+                    data_type, *args = input_data
+                    self.assertEqual(float_to_fixed(QFormat(data_type), *args), expected_output)
+                    self.assertEqual(QFormat.get(data_type).to_fixed(*args), expected_output)
+            for input_data, expected_output in TestsFixedToFloat.positive_tests:
+                with self.subTest(input_data=input_data, expected_output=expected_output):
+                    data_type, *args = input_data
+                    self.assertEqual(fixed_to_float(QFormat(data_type), *args), expected_output)
+                    self.assertEqual(QFormat.get(data_type).to_float(*args), expected_output)
+
+        def test_negative(self):
+            for tests, method in ((TestsFloatToFixed.negative_tests, QFormat.to_fixed),
+                                  (TestsFixedToFloat.negative_tests, QFormat.to_float)):
+                for input_data, expected_output in tests:
+                    with self.subTest(input_data=input_data, expected_output=expected_output):
+                        data_type, *args = input_data
+                        with self.assertRaises(ConversionError) as e:
+                            method(QFormat(data_type), *args)
+                        self.assertIn(expected_output, str(e.exception))
+
+        def test_compiled_once(self):
+            self.assertIs(QFormat.get('S4Q4'), QFormat.get('S4Q4'))
+            self.assertEqual(QFormat('S4Q4'), QFormat.get('S4Q4'))
+            self.assertNotEqual(QFormat('S4Q4'), QFormat('U4Q4'))
+
+        def test_attributes(self):
+            q_format = QFormat('S4Q4')
+            self.assertEqual(q_format.bits, 8)
+            self.assertEqual(q_format.scale, 16)
+            self.assertEqual(q_format.min_val, -8)
+            self.assertEqual(q_format.max_val, 8 - 1 / 16)
+            self.assertEqual(q_format.mask, 0xFF)
+            self.assertEqual(q_format.sign_mask, 0x80)
+
+    class TestsFixedPoint(unittest.TestCase):
+        data_types = ('S2Q2', 'U2Q2', 'S1Q2', 'U0Q2', 'S2Q0', 'U1Q0', 'S3Q1')
+
+        @staticmethod
+        def all_numbers(data_type):
+            q_format = QFormat.get(data_type)
+            return [FixedPoint.from_fixed(fixed_value, q_format) for fixed_value in range(q_format.mask + 1)]
+
+        @staticmethod
+        def exact(number):
+            return Fraction(number.raw, number.q_format.scale)
+
+        def assert_fits(self, number):
+            q_format = number.q_format
+            self.assertTrue(-q_format.min_fixed <= number.raw <= q_format.max_fixed, number)
+
+        def test_conversion(self):
+            for input_data, expected_output in TestsFloatToFixed.positive_tests:
+                with self.subTest(input_data=input_data, expected_output=expected_output):
+                    number = FixedPoint.from_float(input_data[1], *input_data[::2])
+                    self.assertEqual(number.to_fixed(), expected_output)
+                    self.assertEqual(float(number), fixed_to_float(input_data[0], expected_output))
+            for input_data, expected_output in TestsFixedToFloat.positive_tests:
+                with self.subTest(input_data=input_data, expected_output=expected_output):
+                    number = FixedPoint.from_fixed(input_data[1], input_data[0])
+                    self.assertEqual(number.to_float(), expected_output)
+                    self.assertEqual(number.to_fixed(), input_data[1])
+                    self.assertEqual(FixedPoint(number.raw, input_data[0]), number)
+
+        def test_arithmetic_is_exact(self):
+            operations = (
+                (operator.add, add_q_format),
+                (operator.sub, sub_q_format),
+                (operator.mul, mul_q_format),
+            )
+            for data_type_a in self.data_types:
+                for data_type_b in self.data_types:
+                    for operation, get_q_format in operations:
+                        with self.subTest(a=data_type_a, b=data_type_b, operation=operation.__name__):
+                            q_format = get_q_format(QFormat.get(data_type_a), QFormat.get(data_type_b))
+                            for a in self.all_numbers(data_type_a):
+                                for b in self.all_numbers(data_type_b):
+                                    result = operation(a, b)
+                                    self.assertEqual(result.q_format, q_format)
+                                    self.assertEqual(self.exact(result), operation(self.exact(a), self.exact(b)))
+                                    self.assert_fits(result)
+
+        def test_result_data_type(self):
+            for operation, a, b, expected_output in (
+                    (operator.add, 'S2Q2', 'S2Q2', 'S3Q2'),
+                    (operator.add, 'U2Q2', 'S4Q1', 'S5Q2'),
+                    (operator.add, 'U2Q2', 'U2Q2', 'U3Q2'),
+                    (operator.sub, 'U2Q2', 'U2Q2', 'S3Q2'),
+                    (operator.mul, 'S2Q2', 'S2Q2', 'S4Q4'),
+                    (operator.mul, 'S1Q15', 'S1Q15', 'S2Q30'),
+                    (operator.mul, 'U8Q8', 'S1Q15', 'S9Q23'),
+                    (operator.mul, 'U8Q0', 'U8Q0', 'U16Q0'),
+            ):
+                with self.subTest(operation=operation.__name__, a=a, b=b):
+                    result = operation(FixedPoint(0, a), FixedPoint(0, b))
+                    self.assertEqual(result.q_format, QFormat(expected_output))
+
+        def test_shift(self):
+            for number in self.all_numbers('S3Q1'):
+                with self.subTest(number=number):
+                    self.assertEqual(self.exact(number << 2), self.exact(number) * 4)
+                    self.assertEqual((number << 2).q_format, QFormat('S5Q1'))
+                    self.assertEqual(self.exact(number >> 2), self.exact(number) / 4)
+                    self.assertEqual((number >> 2).q_format, QFormat('S3Q3'))
+                    self.assertEqual(self.exact(-number), -self.exact(number))
+                    self.assert_fits(-number)
+
+        def test_cast(self):
+            round_functions = {
+                'floor': math.floor,
+                'nearest': lambda value: math.floor(value + Fraction(1, 2)),
+                'zero': math.trunc,
+            }
+            for data_type in self.data_types:
+                for number in self.all_numbers('S3Q3'):
+                    for rounding, round_function in round_functions.items():
+                        with self.subTest(data_type=data_type, number=number, rounding=rounding):
+                            q_format = QFormat.get(data_type)
+                            raw_value = round_function(self.exact(number) * q_format.scale)
+                            fits = -q_format.min_fixed <= raw_value <= q_format.max_fixed
+
+                            saturated = number.cast(q_format, rounding, 'saturate')
+                            self.assertEqual(saturated.q_format, q_format)
+                            self.assertEqual(saturated.raw,
+                                             max(-q_format.min_fixed, min(raw_value, q_format.max_fixed)))
+
+                            wrapped = number.cast(q_format, rounding, 'wrap')
+                            self.assert_fits(wrapped)
+                            self.assertEqual((wrapped.raw - raw_value) % (q_format.mask + 1), 0)
+
+                            if fits:
+                                self.assertEqual(number.cast(q_format, rounding, 'raise').raw, raw_value)
+                            else:
+                                with self.assertRaises(ConversionError):
+                                    number.cast(q_format, rounding, 'raise')
+
+        def test_sum(self):
+            numbers = [FixedPoint.from_float(-2.0, 'S2Q2')] * 5 + [FixedPoint.from_float(0.5, 'U0Q1')]
+            result = FixedPoint.sum(numbers)
+            self.assertEqual(result.q_format, QFormat('S5Q2'))  # 3 guard bits for 6 numbers
+            self.assertEqual(result.to_float(), -9.5)
+            self.assertEqual(FixedPoint.sum(numbers[:1]), numbers[0])
+
+        def test_fir_filter(self):
+            # firmware-like FIR filter: S1Q15 samples and coefficients, S1Q15 output
+            coefficients = [FixedPoint.from_float(c, 'S1Q15') for c in (0.25, -0.5, 0.125)]
+            samples = [FixedPoint.from_float(x, 'S1Q15') for x in (0.5, -0.25, 0.75, -1.0)]
+            output = [
+                FixedPoint.sum(c * x for c, x in zip(coefficients, samples[n:n + 3])).cast('S1Q15', 'nearest')
+                for n in range(len(samples) - 2)
+            ]
+            self.assertEqual([y.to_float() for y in output], [0.34375, -0.5625])
+            self.assertEqual(output[0].q_format, QFormat('S1Q15'))
+
+        def test_doc(self):
+            import doctest
+            runner = doctest.DocTestRunner()
+            for test in doctest.DocTestFinder().find(FixedPoint, globs={'FixedPoint': FixedPoint,
+                                                                         'float_to_fixed': float_to_fixed}):
+                runner.run(test)
+            failed, attempted = runner.summarize(verbose=False)
+            self.assertGreater(attempted, 0)
+            self.assertEqual(failed, 0)
+
+        def test_negative(self):
+            for function, expected_output in (
+                    (lambda: FixedPoint(16, 'S3Q1'), 'Invalid value'),
+                    (lambda: FixedPoint(-17, 'S3Q1'), 'Invalid value'),
+                    (lambda: FixedPoint(-1, 'U3Q1'), 'Invalid value'),
+                    (lambda: FixedPoint(0.5, 'U3Q1'), 'Invalid value type'),
+                    (lambda: FixedPoint(0, 'S3Q1').cast('S3Q1', 'ceil'), 'Invalid rounding'),
+                    (lambda: FixedPoint(0, 'S3Q1').cast('S3Q1', overflow='skip'), 'Invalid overflow'),
+                    (lambda: FixedPoint.sum([]), 'Invalid value'),
+            ):
+                with self.subTest(expected_output=expected_output):
+                    with self.assertRaises(ConversionError) as e:
+                        function()
+                    self.assertIn(expected_output, str(e.exception))
+
     unittest.main()
@@ -1,3 +1,6 @@
 from bit import Bit
 from bit_field import BitField
 from register import Register
+from bulk_decode import decode_registers
+from register_block import MappedRegister, RegisterBlock
+from register_diff import field_changes, iter_field_changes
@@ -0,0 +1,100 @@
+from collections.abc import Callable
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def mask_segments(mask: int) -> tuple[tuple[int, int, int], ...]:
+    """
+    Splits mask into contiguous segments of ones.
+    Each segment is described by (shift, width, short_shift), where `shift` is the position of the segment
+    in the mask and `short_shift` is its position in the short value, i.e. in the value composed only of masked bits.
+
+    Example:
+    |1|1|0|1| <- mask
+    segments: (0, 1, 0), (2, 2, 1)
+
+    >>> mask_segments(0b_1101)
+    ((0, 1, 0), (2, 2, 1))
+    """
+    if mask < 0:
+        raise ValueError(f'Invalid mask {mask}. Mask should be positive.')
+
+    segments = []
+    shift = 0
+    short_shift = 0
+    while mask:
+        # skip zeros
+        zeros = (mask & -mask).bit_length() - 1
+        mask >>= zeros
+        shift += zeros
+        # count ones
+        width = (mask ^ (mask + 1)).bit_length() - 1
+        segments.append((shift, width, short_shift))
+        mask >>= width
+        shift += width
+        short_shift += width
+    return tuple(segments)
+
+
+@lru_cache(maxsize=None)
+def compile_mask(mask: int) -> tuple[Callable[[int], int], Callable[[int], int]]:
+    """
+    Compiles mask into a pair of functions (extract, deposit).
+    `extract(value)` gathers masked bits of the value into a short value.
+    `deposit(short_value)` is the inverse operation, it scatters bits of the short value into masked positions.
+
+    Contiguous mask is compiled into a single shift-and-AND, otherwise a table of contiguous segments is used.
+    """
+    segments = mask_segments(mask)
+
+    if len(segments) <= 1:
+        shift, width, _ = segments[0] if segments else (0, 0, 0)
+        ones = (1 << width) - 1
+
+        def extract(value: int) -> int:
+            return value >> shift & ones
+
+        def deposit(short_value: int) -> int:
+            return (short_value & ones) << shift
+
+    else:
+        table = tuple((shift, (1 << width) - 1, short_shift) for shift, width, short_shift in segments)
+
+        def extract(value: int) -> int:
+            result = 0
+            for shift, ones, short_shift in table:
+                result |= (value >> shift & ones) << short_shift
+            return result
+
+        def deposit(short_value: int) -> int:
+            result = 0
+            for shift, ones, short_shift in table:
+                result |= (short_value >> short_shift & ones) << shift
+            return result
+
+    return extract, deposit
+
+
+def extract(value: int, mask: int) -> int:
+    """
+    Gathers bits of the value present in mask into a short value.
+
+    >>> bin(extract(0b_1100, 0b_0101))
+    '0b10'
+    """
+    return compile_mask(mask)[0](value)
+
+
+def deposit(short_value: int, mask: int) -> int:
+    """
+    Scatters bits of the short value into positions of ones in the mask.
+
+    >>> bin(deposit(0b_10, 0b_0101))
+    '0b100'
+    """
+    return compile_mask(mask)[1](short_value)
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
@@ -0,0 +1,106 @@
+"""
+Decodes many register values at once into arrays of bit and bit field values.
+"""
+
+from typing import Optional
+
+import numpy as np
+
+from bit import Bit
+from bit_mask import mask_segments
+from register import Register
+
+# Default dtype of the raw values given in a buffer, by register bit count.
+_DTYPES = {8: 'u1', 16: '<u2', 32: '<u4', 64: '<u8'}
+
+
+def check_mask(values: np.ndarray, mask: int, name: str = 'mask'):
+    """
+    Raises `ValueError` if the mask has bits beyond the bits of the values' dtype.
+
+    :param values: Array of unsigned raw register values.
+    :param mask: Mask of a bit, a bit field or a register.
+    :param name: Name of the mask in the error message.
+    """
+    bit_count = values.dtype.itemsize * 8
+    if mask.bit_length() > bit_count:
+        raise ValueError(f'Invalid {name} {mask:#x}. Mask is wider than {bit_count}-bit values '
+                         f'of dtype {values.dtype}.')
+
+
+def extract_array(values: np.ndarray, mask: int) -> np.ndarray:
+    """
+    Vectorized `Register._get_short_value`: gathers masked bits of each value into a short value (pext).
+    Each contiguous segment of the mask costs one shift-and-AND over the array.
+    """
+    check_mask(values, mask)
+    dtype = values.dtype.type
+    segments = mask_segments(mask)
+
+    if len(segments) == 1:
+        shift, width, _ = segments[0]
+        return (values >> dtype(shift)) & dtype((1 << width) - 1)
+
+    result = np.zeros_like(values)
+    for shift, width, short_shift in segments:
+        result |= ((values >> dtype(shift)) & dtype((1 << width) - 1)) << dtype(short_shift)
+    return result
+
+
+def as_raw_values(register_class: type[Register], data, dtype=None) -> np.ndarray:
+    """
+    Returns array of unsigned raw register values.
+
+    :param register_class: Register subclass, its `_BIT_COUNT` defines default dtype of a buffer.
+    :param data: numpy array of integers or a buffer (`bytes`, `memoryview`, etc.) with packed values.
+    :param dtype: dtype of values in the buffer, e.g. '>u2'. Required if register has no `_BIT_COUNT`.
+    """
+    if isinstance(data, np.ndarray):
+        values = data if dtype is None else data.astype(dtype, copy=False)
+    else:
+        if dtype is None:
+            bit_count = getattr(register_class, '_BIT_COUNT', None)
+            if bit_count not in _DTYPES:
+                raise ValueError(f'Invalid dtype. Cannot guess dtype of {register_class.__name__} values, '
+                                 f'please provide one.')
+            dtype = _DTYPES[bit_count]
+        values = np.frombuffer(data, dtype=dtype)
+
+    if values.dtype.kind == 'i':
+        values = values.view(values.dtype.str.replace('i', 'u'))
+    elif values.dtype.kind != 'u':
+        raise ValueError(f'Invalid dtype {values.dtype}. Register values should be integers.')
+
+    if not values.dtype.isnative:
+        values = values.astype(values.dtype.newbyteorder('='))
+
+    return values
+
+
+def decode_registers(
+        register_class: type[Register],
+        data,
+        dtype=None,
+        mask: Optional[int] = None) -> dict[str, np.ndarray]:
+    """
+    Decodes array of raw register values into an array per bit and bit field.
+    Equal to creating `register_class(value, mask)` for each value and reading its bits and bit fields.
+
+    :param register_class: Register subclass that defines bits and bit fields.
+    :param data: numpy array of integers or a buffer with packed values, see `as_raw_values`.
+    :param dtype: dtype of values in the buffer.
+    :param mask: Register mask applied to each value.
+    :return: Dictionary of bit and bit field names to arrays of their values.
+    """
+    values = as_raw_values(register_class, data, dtype)
+    if mask is not None:
+        check_mask(values, mask, 'register mask')
+        values = values & values.dtype.type(mask)
+
+    result = {}
+    for name in register_class._bit_names + register_class._bit_field_names:
+        field = getattr(register_class, name)
+        field_mask = 1 << field.index if isinstance(field, Bit) else field.mask
+        check_mask(values, field_mask, f'mask of {name}')
+        result[name] = extract_array(values, field_mask)
+    return result
@@ -1,6 +1,48 @@
-from copy import deepcopy
 from bit import Bit
 from bit_field import BitField
+from bit_mask import compile_mask, deposit, extract
+
+
+class _Field:
+    """
+    Descriptor of a bit or a bit field defined in the register class.
+
+    Access through the class returns the `Bit` or `BitField` defined by user.
+    Access through the instance returns its copy with the value decoded from the register value.
+    The copy is created on first access and cached in the instance.
+    Assignment of an integer through the instance encodes it into the register value.
+    """
+
+    __slots__ = ('name', 'prototype', 'extract')
+
+    def __init__(self, name: str, prototype):
+        self.name = name
+        self.prototype = prototype
+        if isinstance(prototype, BitField):
+            self.extract = compile_mask(prototype.mask)[0]
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self.prototype
+
+        field = instance.__dict__.get(self.name)
+        if field is not None:
+            return field
+
+        # Shallow copy of the prototype without going through `copy` machinery.
+        field = object.__new__(self.prototype.__class__)
+        field.__dict__.update(self.prototype.__dict__)
+        if isinstance(field, Bit):
+            field.value = instance.masked_value >> field.index & 1
+        else:
+            field.value = self.extract(instance.masked_value)
+
+        instance.__dict__[self.name] = field
+        return field
+
+    def __set__(self, instance, short_value: int):
+        mask = instance._field_masks[self.name]
+        instance._write(mask, short_value)
 
 
 class Register:
@@ -8,12 +50,18 @@ class Register:
     Representation of the HW register.
 
     User should define bits and bit fields as class properties.
+    Layout of the register is collected once, when the class is defined, see `__init_subclass__`.
 
     Several helpful structures are defined:
-    self._bits       : List of `Bit`s of the register instance.
-    self._bit_fields : List of `BitField`s of the register instance.
+    self.bits       : List of `Bit`s of the register instance.
+    self.bit_fields : List of `BitField`s of the register instance.
     """
 
+    # Names of bits and bit fields, filled in for each subclass.
+    _bit_names: tuple[str, ...] = ()
+    _bit_field_names: tuple[str, ...] = ()
+    _field_masks: dict[str, int] = {}
+
     def __init__(self, value: int, mask: int = None):
         self.value = value
         self.mask = mask
@@ -23,11 +71,48 @@ class Register:
         else:
             self.masked_value = value & mask
 
-        # helpers
-        self.bits = []
-        self.bit_fields = []
+    def __init_subclass__(cls, **kwargs):
+        """
+        Collects bits and bit fields of the register class and wraps them into descriptors which decode
+        the value lazily.
+        """
+        super().__init_subclass__(**kwargs)
+
+        bit_names = []
+        bit_field_names = []
+
+        # Iterate over class properties
+        for attr_name in dir(cls):
+
+            # All magic is excluded
+            if attr_name.startswith('_'):
+                continue
+
+            attr = getattr(cls, attr_name)
 
-        self._load()
+            if isinstance(attr, Bit):
+                bit_names.append(attr_name)
+            elif isinstance(attr, BitField):
+                bit_field_names.append(attr_name)
+            else:
+                continue
+
+            # Inherited fields are already wrapped in the parent class.
+            if attr_name in cls.__dict__:
+                setattr(cls, attr_name, _Field(attr_name, attr))
+
+        cls._bit_names = tuple(bit_names)
+        cls._bit_field_names = tuple(bit_field_names)
+        cls._field_masks = {name: 1 << getattr(cls, name).index for name in bit_names}
+        cls._field_masks.update({name: getattr(cls, name).mask for name in bit_field_names})
+
+    @property
+    def bits(self) -> list[Bit]:
+        return [getattr(self, name) for name in self._bit_names]
+
+    @property
+    def bit_fields(self) -> list[BitField]:
+        return [getattr(self, name) for name in self._bit_field_names]
 
     def __getitem__(self, index):
         """
@@ -46,43 +131,50 @@ class Register:
             return self.masked_value >> index & 1
 
         elif isinstance(index, slice):
-            slice_ = index
-            val = 0
-            step = 1 if slice_.start < slice_.stop else -1
-            for i in range(slice_.start, slice_.stop + step, step):
-                val |= 1 << i & self.masked_value
-            # get short value
-            val >>= min(slice_.start, slice_.stop)
-            return val
+            return extract(self.masked_value, self._slice_mask(index))
 
         raise IndexError(f'Bit number {index} is not defined in {self.__class__.__name__} class')
 
-    def _load(self):
-        """Loads value passed to the class initializer and parses it into bits and bit fields."""
+    def __setitem__(self, index, short_value: int):
+        """
+        Set bit value or bits of a slice, see `__getitem__` for indexing rules.
+        """
 
-        # Iterate over class properties
-        for attr_name in dir(self.__class__):
+        if isinstance(index, int):
+            self._write(1 << index, short_value)
 
-            # All magic is excluded
-            if attr_name.startswith('_'):
-                continue
+        elif isinstance(index, slice):
+            self._write(self._slice_mask(index), short_value)
 
-            attr = getattr(self.__class__, attr_name)
+        else:
+            raise IndexError(f'Bit number {index} is not defined in {self.__class__.__name__} class')
 
-            if isinstance(attr, Bit):
-                bit = self._copy_instance(attr_name, attr)
-                self.bits.append(bit)
-                bit.value = self.masked_value >> bit.index & 1
+    @staticmethod
+    def _slice_mask(slice_: slice) -> int:
+        """Returns mask of bits between slice borders, both borders are included."""
+        low, high = sorted((slice_.start, slice_.stop))
+        return ((1 << (high - low + 1)) - 1) << low
 
-            elif isinstance(attr, BitField):
-                bit_field = self._copy_instance(attr_name, attr)
-                self.bit_fields.append(bit_field)
-                bit_field.value = self._get_short_value(self.masked_value, bit_field.mask)
+    def _write(self, mask: int, short_value: int):
+        """
+        Encodes short value into the bits of the register value present in mask.
+        Decoded bits and bit fields that overlap the mask are dropped, they are decoded again on next access.
+        """
+        if not isinstance(short_value, int):
+            raise TypeError(f'Invalid value type {type(short_value)}. Value should be an integer.')
+        if short_value < 0 or short_value >> mask.bit_count():
+            raise ValueError(f'Invalid value {short_value}. Value does not fit in mask {mask:#b}.')
+
+        self.value = self.value & ~mask | deposit(short_value, mask)
+
+        if self.mask is None:
+            self.masked_value = self.value
+        else:
+            self.masked_value = self.value & self.mask
 
-    def _copy_instance(self, name, instance):
-        instance_copy = deepcopy(instance)
-        setattr(self, name, instance_copy)
-        return instance_copy
+        for name, field_mask in self._field_masks.items():
+            if field_mask & mask:
+                self.__dict__.pop(name, None)
 
     @staticmethod
     def _get_short_value(value: int, mask: int) -> int:
@@ -98,16 +190,7 @@ class Register:
         :param mask: Register mask.
         :return: Short value: Such bits are extracted from value where mask at the same position contains 1.
         """
-        res = 0
-        i = 0
-        while mask and value:
-            if mask & 1:
-                if value & 1:
-                    res |= 1 << i
-                i += 1
-            mask >>= 1
-            value >>= 1
-        return res
+        return extract(value, mask)
 
     def __eq__(self, other) -> bool:
         assert isinstance(other, self.__class__)
@@ -0,0 +1,142 @@
+from struct import Struct
+from collections.abc import Generator, Iterable
+from typing import Optional
+
+from register import Register
+
+_STRUCT_FORMATS = {1: 'B', 2: 'H', 4: 'I', 8: 'Q'}
+_BYTE_ORDERS = {'little': '<', 'big': '>'}
+
+
+class MappedRegister:
+    """
+    Register placed at an offset of the register block.
+
+    Access through the block instance decodes the register from the block buffer.
+    The register is created on first access and stored in the block instance.
+    """
+
+    __slots__ = ('register_class', 'offset', 'width', 'byteorder', 'mask', 'name', '_struct')
+
+    def __init__(self,
+                 register_class: type[Register],
+                 offset: int,
+                 width: Optional[int] = None,
+                 byteorder: str = 'little',
+                 mask: Optional[int] = None):
+        """
+        :param register_class: Register subclass.
+        :param offset: Offset of the register in the block in bytes.
+        :param width: Width of the register in bytes. By default is taken from the register `_BIT_COUNT`.
+        :param byteorder: 'little' or 'big'.
+        :param mask: Register mask passed to the register initializer.
+        """
+        if byteorder not in _BYTE_ORDERS:
+            raise ValueError(f'Invalid byte order {byteorder}. Valid values are: "little", "big".')
+        if width is None:
+            width = (getattr(register_class, '_BIT_COUNT', 8) + 7) // 8
+
+        self.register_class = register_class
+        self.offset = offset
+        self.width = width
+        self.byteorder = byteorder
+        self.mask = mask
+        self.name = None
+        self._struct = Struct(_BYTE_ORDERS[byteorder] + _STRUCT_FORMATS[width]) if width in _STRUCT_FORMATS else None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def unpack(self, buffer: memoryview, base: int = 0) -> int:
+        """Reads raw register value from the buffer without copying it."""
+        if self._struct is not None:
+            return self._struct.unpack_from(buffer, base + self.offset)[0]
+        start = base + self.offset
+        return int.from_bytes(buffer[start:start + self.width], self.byteorder)
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+
+        register = self.register_class(self.unpack(instance.buffer, instance.base), self.mask)
+        instance.__dict__[self.name] = register
+        return register
+
+
+class RegisterBlock:
+    """
+    Memory map of the peripheral: registers are defined as `MappedRegister` class properties.
+
+    Block instance wraps a dump of the address space (`bytes`, `bytearray`, `mmap`, etc.) into `memoryview`.
+    Nothing is copied and registers are decoded only when accessed.
+
+    Example:
+        class TIMER(RegisterBlock):
+            CTRL = MappedRegister(TIMER_CTRL, 0x00)
+            COUNT = MappedRegister(TIMER_COUNT, 0x04, width=4, byteorder='big')
+
+        timer = TIMER(dump)
+        timer.CTRL.EN.value
+    """
+
+    # Registers of the block by name, filled in for each subclass.
+    _registers: dict[str, MappedRegister] = {}
+    _offsets: dict[int, str] = {}
+    # Size of the block in bytes, at least the end of the last register.
+    _SIZE: int = 0
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        registers = {}
+        for attr_name in dir(cls):
+            attr = getattr(cls, attr_name)
+            if isinstance(attr, MappedRegister):
+                registers[attr_name] = attr
+
+        cls._registers = dict(sorted(registers.items(), key=lambda item: item[1].offset))
+        cls._offsets = {register.offset: name for name, register in cls._registers.items()}
+        cls._SIZE = max([cls._SIZE] + [register.offset + register.width for register in registers.values()])
+
+    def __init__(self, buffer, base: int = 0):
+        """
+        :param buffer: Object that supports buffer protocol with the dump of the block.
+        :param base: Offset of the block in the buffer in bytes.
+        """
+        self.buffer = memoryview(buffer).cast('B')
+        self.base = base
+
+        if len(self.buffer) < base + self._SIZE:
+            raise ValueError(f'Invalid buffer. {self.__class__.__name__} needs {self._SIZE} bytes at offset {base}, '
+                             f'but buffer size is {len(self.buffer)} bytes.')
+
+    def __iter__(self) -> Generator[tuple[str, Register]]:
+        """Yields (name, register) ordered by register offset."""
+        for name in self._registers:
+            yield name, getattr(self, name)
+
+    def at(self, offset: int) -> Register:
+        """Returns register placed at the offset."""
+        try:
+            return getattr(self, self._offsets[offset])
+        except KeyError:
+            raise KeyError(f'No register at offset {offset:#x} in {self.__class__.__name__}.') from None
+
+    @classmethod
+    def iter_dumps(cls, dumps: Iterable) -> Generator['RegisterBlock']:
+        """Yields block for each dump."""
+        for dump in dumps:
+            yield cls(dump)
+
+    @classmethod
+    def iter_buffer(cls, buffer, stride: Optional[int] = None) -> Generator['RegisterBlock']:
+        """
+        Yields blocks for dumps stored one after another in a single buffer.
+
+        :param buffer: Object that supports buffer protocol.
+        :param stride: Distance between dumps in bytes, size of the block by default.
+        """
+        buffer = memoryview(buffer).cast('B')
+        stride = stride or cls._SIZE
+        for base in range(0, len(buffer) - cls._SIZE + 1, stride):
+            yield cls(buffer, base)
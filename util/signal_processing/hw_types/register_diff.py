@@ -0,0 +1,78 @@
+"""
+Finds changes of bits and bit fields in a sequence of register snapshots.
+"""
+
+from collections.abc import Generator
+from typing import Optional
+
+import numpy as np
+
+from bulk_decode import as_raw_values, check_mask, extract_array
+from register import Register
+
+
+def field_changes(
+        register_class: type[Register],
+        data,
+        dtype=None,
+        mask: Optional[int] = None) -> dict[str, tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    Compares consecutive register values and returns changes of each bit and bit field.
+
+    Consecutive values are XORed once, samples without any change are skipped entirely,
+    then the difference is checked against the mask of each field.
+
+    :param register_class: Register subclass that defines bits and bit fields.
+    :param data: numpy array of integers or a buffer with packed values, see `as_raw_values`.
+    :param dtype: dtype of values in the buffer.
+    :param mask: Register mask applied to each value.
+    :return: Dictionary of bit and bit field names to struct of arrays (indexes, old values, new values),
+        where index is the index of the sample with the new value.
+    """
+    values = as_raw_values(register_class, data, dtype)
+    if mask is not None:
+        check_mask(values, mask, 'register mask')
+        values = values & values.dtype.type(mask)
+
+    difference = values[1:] ^ values[:-1]
+    changed = np.flatnonzero(difference)
+    difference = difference[changed]
+
+    result = {}
+    for name in register_class._bit_names + register_class._bit_field_names:
+        field_mask = register_class._field_masks[name]
+        check_mask(values, field_mask, f'mask of {name}')
+        previous_indexes = changed[(difference & values.dtype.type(field_mask)) != 0]
+        indexes = previous_indexes + 1
+        result[name] = (
+            indexes,
+            extract_array(values[previous_indexes], field_mask),
+            extract_array(values[indexes], field_mask),
+        )
+    return result
+
+
+def iter_field_changes(
+        register_class: type[Register],
+        data,
+        dtype=None,
+        mask: Optional[int] = None) -> Generator[tuple[int, str, int, int]]:
+    """
+    Yields (sample index, field name, old value, new value) ordered by sample index.
+    Fields changed in the same sample are yielded in order of `Register.bits` and then `Register.bit_fields`.
+    See `field_changes` for parameters.
+    """
+    changes = field_changes(register_class, data, dtype, mask)
+    if not changes:
+        return
+
+    names = list(changes)
+    indexes = np.concatenate([indexes for indexes, _, _ in changes.values()])
+    name_ids = np.concatenate([np.full(len(changes[name][0]), i) for i, name in enumerate(names)])
+    old_values = np.concatenate([old for _, old, _ in changes.values()])
+    new_values = np.concatenate([new for _, _, new in changes.values()])
+
+    order = np.argsort(indexes, kind='stable')
+    for index, name_id, old_value, new_value in zip(
+            indexes[order].tolist(), name_ids[order].tolist(), old_values[order].tolist(), new_values[order].tolist()):
+        yield index, names[name_id], old_value, new_value
@@ -1,7 +1,14 @@
 import unittest
+
+import numpy as np
+
 from bit import Bit
 from bit_field import BitField
 from register import Register
+from bulk_decode import decode_registers, extract_array
+from bit_mask import extract, deposit
+from register_block import MappedRegister, RegisterBlock
+from register_diff import field_changes, iter_field_changes
 
 
 class RegisterUsageExample(unittest.TestCase):
@@ -110,5 +117,261 @@ class RegisterUsageExample(unittest.TestCase):
         pass
 
 
+class RegisterLayoutTest(unittest.TestCase):
+
+    class REG(Register):
+        EN = Bit(0)
+        MODE = BitField(0b_0110)
+        READY = Bit(7)
+
+    def test_layout_is_collected_once(self):
+        self.assertEqual(self.REG._bit_names, ('EN', 'READY'))
+        self.assertEqual(self.REG._bit_field_names, ('MODE',))
+
+    def test_fields_are_decoded_lazily(self):
+        reg = self.REG(0b_1000_0101)
+        self.assertNotIn('MODE', vars(reg))
+        self.assertEqual(reg.MODE.value, 0b10)
+        self.assertIn('MODE', vars(reg))
+        self.assertEqual([bit.value for bit in reg.bits], [1, 1])
+        self.assertEqual([bit_field.value for bit_field in reg.bit_fields], [0b10])
+
+    def test_instances_do_not_share_fields(self):
+        reg1 = self.REG(0b_0001)
+        reg2 = self.REG(0b_0000)
+        reg1.EN.value = 0
+        self.assertIsNot(reg1.EN, reg2.EN)
+        self.assertIsNot(reg1.EN, self.REG.EN)
+        self.assertIsNone(self.REG.EN.value)
+        self.assertEqual(reg2.EN.value, 0)
+
+    def test_inheritance(self):
+        class EXTENDED(self.REG):
+            BUSY = Bit(8)
+
+        reg = EXTENDED(0b_1_0000_0001)
+        self.assertEqual(EXTENDED._bit_names, ('BUSY', 'EN', 'READY'))
+        self.assertEqual(reg.BUSY.value, 1)
+        self.assertEqual(reg.EN.value, 1)
+        self.assertEqual(reg.READY.value, 0)
+
+
+class WritableRegisterTest(unittest.TestCase):
+
+    class REG(Register):
+        EN = Bit(0)
+        MODE = BitField(0b_0110)
+        SPLIT = BitField(0b_1001_0000)
+
+    def test_extract_deposit(self):
+        for mask in (0, 0b_1, 0b_0110, 0b_1001_0000, 0b_1011_0101, (1 << 64) - 1):
+            for short_value in range(1 << min(bin(mask).count('1'), 8)):
+                with self.subTest(mask=mask, short_value=short_value):
+                    value = deposit(short_value, mask)
+                    self.assertEqual(value & ~mask, 0)
+                    self.assertEqual(extract(value, mask), short_value)
+                    self.assertEqual(Register._get_short_value(value | ~mask & 0xFF, mask), short_value)
+
+    def test_assign_field(self):
+        reg = self.REG(0b_1111_0000)
+        self.assertEqual(reg.MODE.value, 0b00)
+        reg.MODE = 0b10
+        self.assertEqual(reg.value, 0b_1111_0100)
+        self.assertEqual(reg.MODE.value, 0b10)
+        reg.SPLIT = 0b01
+        self.assertEqual(reg.value, 0b_0111_0100)
+        reg.EN = 1
+        self.assertEqual(reg.value, 0b_0111_0101)
+        self.assertEqual(reg.EN.value, 1)
+        self.assertEqual(reg.SPLIT.value, 0b01)
+
+    def test_assign_with_mask(self):
+        reg = self.REG(0b_0000, mask=0b_0011)
+        reg.MODE = 0b11
+        self.assertEqual(reg.value, 0b_0110)
+        self.assertEqual(reg.masked_value, 0b_0010)
+        self.assertEqual(reg.MODE.value, 0b01)
+
+    def test_assign_invalid(self):
+        reg = self.REG(0)
+        with self.assertRaises(ValueError):
+            reg.MODE = 0b100
+        with self.assertRaises(ValueError):
+            reg.EN = -1
+        with self.assertRaises(TypeError):
+            reg.EN = 1.0
+
+    def test_setitem(self):
+        reg = self.REG(0b_1010)
+        reg[0] = 1
+        self.assertEqual(reg.value, 0b_1011)
+        reg[3:2] = 0b01
+        self.assertEqual(reg.value, 0b_0111)
+        self.assertEqual(reg[2:3], 0b01)
+        self.assertEqual(reg.MODE.value, 0b11)
+
+
+class BulkDecodeTest(unittest.TestCase):
+
+    class REG(Register):
+        EN = Bit(0)
+        READY = Bit(15)
+        MODE = BitField(0b_0110)
+        SPLIT = BitField(0b_1010_0000_1001_0000)  # non-contiguous mask
+        _BIT_COUNT = 16
+
+    def assert_decoded(self, output, values, mask=None):
+        for name in self.REG._bit_names + self.REG._bit_field_names:
+            with self.subTest(name=name):
+                self.assertEqual(output[name].tolist(), [getattr(self.REG(v, mask), name).value for v in values])
+
+    def test_array(self):
+        values = list(range(0, 1 << 16, 97)) + [0xFFFF]
+        for dtype in (np.uint16, np.uint32, np.uint64, np.int32):
+            with self.subTest(dtype=dtype):
+                self.assert_decoded(decode_registers(self.REG, np.array(values, dtype=dtype)), values)
+
+    def test_mask(self):
+        values = [0xFFFF, 0x1234]
+        self.assert_decoded(decode_registers(self.REG, np.array(values, dtype=np.uint16), mask=0x0F0F),
+                            values, mask=0x0F0F)
+
+    def test_buffer(self):
+        values = [0x0001, 0x8006, 0xA090]
+        self.assert_decoded(decode_registers(self.REG, np.array(values, dtype='<u2').tobytes()), values)
+        self.assert_decoded(decode_registers(self.REG, np.array(values, dtype='>u2').tobytes(), dtype='>u2'),
+                            values)
+
+    def test_buffer_without_dtype(self):
+        class NOSIZE(Register):
+            EN = Bit(0)
+
+        with self.assertRaises(ValueError):
+            decode_registers(NOSIZE, b'\x00')
+
+    def test_mask_wider_than_values(self):
+        class WIDE(Register):
+            EN = Bit(0)
+            VALUE = BitField(0x1FF)
+
+        for function, expected_output in (
+                (lambda: decode_registers(WIDE, np.zeros(2, dtype=np.uint8)), 'Invalid mask of VALUE 0x1ff'),
+                (lambda: decode_registers(self.REG, np.zeros(2, dtype=np.uint16), mask=0x1FFFF),
+                 'Invalid register mask 0x1ffff'),
+                (lambda: extract_array(np.zeros(2, dtype=np.uint8), 0x100), 'Invalid mask 0x100'),
+        ):
+            with self.assertRaises(ValueError) as e:
+                function()
+            self.assertIn(expected_output, str(e.exception))
+        self.assertEqual(decode_registers(WIDE, np.array([0x1FF], dtype=np.uint16))['VALUE'].tolist(), [0x1FF])
+
+
+class RegisterBlockTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        class TIMER_CTRL(Register):
+            EN = Bit(0)
+            MODE = BitField(0b_0110)
+            _BIT_COUNT = 8
+
+        class TIMER_COUNT(Register):
+            LOW = BitField(0x00FF)
+            HIGH = BitField(0xFF00)
+            _BIT_COUNT = 16
+
+        class TIMER(RegisterBlock):
+            CTRL = MappedRegister(TIMER_CTRL, 0x00)
+            COUNT = MappedRegister(TIMER_COUNT, 0x02)
+            COUNT_BE = MappedRegister(TIMER_COUNT, 0x04, byteorder='big')
+            WIDE = MappedRegister(TIMER_COUNT, 0x06, width=3)
+
+        cls.TIMER = TIMER
+
+    def test_decode(self):
+        dump = bytes([0b_0000_0101, 0xEE, 0x34, 0x12, 0x34, 0x12, 0x01, 0x02, 0x03])
+        timer = self.TIMER(dump)
+        self.assertEqual(self.TIMER._SIZE, 9)
+        self.assertNotIn('CTRL', vars(timer))
+        self.assertEqual(timer.CTRL.EN.value, 1)
+        self.assertEqual(timer.CTRL.MODE.value, 0b10)
+        self.assertIs(timer.CTRL, timer.CTRL)
+        self.assertEqual(timer.COUNT.value, 0x1234)
+        self.assertEqual(timer.COUNT.HIGH.value, 0x12)
+        self.assertEqual(timer.COUNT_BE.value, 0x3412)
+        self.assertEqual(timer.WIDE.value, 0x030201)
+        self.assertEqual([name for name, _ in timer], ['CTRL', 'COUNT', 'COUNT_BE', 'WIDE'])
+        self.assertIs(timer.at(0x02), timer.COUNT)
+        with self.assertRaises(KeyError):
+            timer.at(0x01)
+
+    def test_buffer_too_small(self):
+        with self.assertRaises(ValueError):
+            self.TIMER(bytes(8))
+
+    def test_many_dumps(self):
+        dumps = [bytes([i] * 9) for i in range(3)]
+        self.assertEqual([timer.CTRL.value for timer in self.TIMER.iter_dumps(dumps)], [0, 1, 2])
+        buffer = bytearray(b''.join(dumps))
+        self.assertEqual([timer.COUNT.value for timer in self.TIMER.iter_buffer(buffer)], [0, 0x0101, 0x0202])
+        self.assertEqual([timer.CTRL.value for timer in self.TIMER.iter_buffer(buffer, stride=4)],
+                         [0, 0, 0, 1, 1])
+
+
+class RegisterDiffTest(unittest.TestCase):
+
+    class REG(Register):
+        EN = Bit(0)
+        MODE = BitField(0b_0110)
+        SPLIT = BitField(0b_1001_0000)
+        _BIT_COUNT = 8
+
+    def test_iter_field_changes(self):
+        values = np.array([0b_0000_0000, 0b_0000_0000, 0b_0000_0011, 0b_1000_0011, 0b_0100_0011, 0b_0100_0010],
+                          dtype=np.uint8)
+        self.assertEqual(list(iter_field_changes(self.REG, values)), [
+            (2, 'EN', 0, 1),
+            (2, 'MODE', 0b00, 0b01),
+            (3, 'SPLIT', 0b00, 0b10),
+            (4, 'SPLIT', 0b10, 0b00),
+            (5, 'EN', 1, 0),
+        ])
+
+    def test_same_as_register_comparison(self):
+        rng = np.random.default_rng(0)
+        values = rng.integers(0, 4, 200, dtype=np.uint8) << np.uint8(3)  # mostly changes of not defined bits
+        exp_output = []
+        for i in range(1, len(values)):
+            old, new = self.REG(int(values[i - 1])), self.REG(int(values[i]))
+            for field in self.REG._bit_names + self.REG._bit_field_names:
+                if getattr(old, field).value != getattr(new, field).value:
+                    exp_output.append((i, field, getattr(old, field).value, getattr(new, field).value))
+        self.assertEqual(list(iter_field_changes(self.REG, values.tobytes())), exp_output)
+
+    def test_mask(self):
+        changes = field_changes(self.REG, np.array([0b_0000, 0b_0111], dtype=np.uint8), mask=0b_0001)
+        self.assertEqual(changes['EN'][0].tolist(), [1])
+        self.assertEqual(changes['MODE'][0].tolist(), [])
+
+    def test_no_values(self):
+        self.assertEqual(list(iter_field_changes(self.REG, b'')), [])
+
+    def test_mask_wider_than_values(self):
+        class WIDE(Register):
+            EN = Bit(0)
+            VALUE = BitField(0x1FE)
+
+        for function, expected_output in (
+                (lambda: field_changes(WIDE, np.zeros(2, dtype=np.uint8)), 'Invalid mask of VALUE 0x1fe'),
+                (lambda: field_changes(self.REG, np.zeros(2, dtype=np.uint8), mask=0x100),
+                 'Invalid register mask 0x100'),
+        ):
+            with self.assertRaises(ValueError) as e:
+                function()
+            self.assertIn(expected_output, str(e.exception))
+        changes = field_changes(WIDE, np.array([0, 0x101], dtype=np.uint16))
+        self.assertEqual([changes[name][2].tolist() for name in ('EN', 'VALUE')], [[1], [0x80]])
+
+
 if __name__ == '__main__':
     unittest.main()
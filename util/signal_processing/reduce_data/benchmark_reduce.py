@@ -0,0 +1,194 @@
+"""
+Benchmark of the reduce implementations.
+
+Every implementation is run over several data shapes, sizes and input container types.
+Throughput (samples per second, best of several runs) and peak memory (traced by `tracemalloc`)
+are recorded to JSON. If baseline JSON is given, results are compared with it and regressions are reported.
+
+Usage:
+    python benchmark_reduce.py --sizes 10000 100000 --output results.json
+    python benchmark_reduce.py --baseline results.json --threshold 0.2
+"""
+
+import argparse
+import json
+import sys
+import tracemalloc
+from array import array
+from collections.abc import Callable
+from timeit import Timer
+
+import numpy as np
+
+from reduce import reduce
+from reduce2 import reduce2
+from get_reduced_list import get_reduced_list
+from get_reduced_list2 import get_reduced_list2
+from get_reduced_list3 import get_reduced_list3
+from reduce_with_info import reduce_with_info
+from reduce_with_info_numpy import reduce_with_info_numpy
+from reduce_with_info_parallel import reduce_with_info_parallel
+from reduce_chunked import reduce_with_info_chunked_arrays
+from reduce_with_tolerance import reduce_with_tolerance, reduce_with_tolerance_summary
+from reduce_with_tolerance_numpy import reduce_with_tolerance_summary_numpy
+
+TOLERANCE = 0.5
+CHUNK_SIZE = 1 << 16
+
+IMPLEMENTATIONS: dict[str, Callable] = {
+    'reduce': lambda data: list(reduce(data)),
+    'reduce2': lambda data: list(reduce2(data)),
+    'get_reduced_list': get_reduced_list,
+    'get_reduced_list2': get_reduced_list2,
+    'get_reduced_list3': get_reduced_list3,
+    'reduce_with_info': lambda data: list(reduce_with_info(data)),
+    'reduce_with_info_numpy': reduce_with_info_numpy,
+    'reduce_with_info_chunked_arrays': lambda data: list(reduce_with_info_chunked_arrays(
+        data[i:i + CHUNK_SIZE] for i in range(0, len(data), CHUNK_SIZE))),
+    'reduce_with_info_parallel': lambda data: reduce_with_info_parallel(data, min_segment_size=CHUNK_SIZE),
+    'reduce_with_tolerance[mean]': lambda data: list(reduce_with_tolerance(data, TOLERANCE, 'mean')),
+    'reduce_with_tolerance[previous]': lambda data: list(reduce_with_tolerance(data, TOLERANCE, 'previous')),
+    'reduce_with_tolerance_summary[mean]':
+        lambda data: list(reduce_with_tolerance_summary(data, TOLERANCE, 'mean')),
+    'reduce_with_tolerance_summary[previous]':
+        lambda data: list(reduce_with_tolerance_summary(data, TOLERANCE, 'previous')),
+    'reduce_with_tolerance_summary_numpy': lambda data: reduce_with_tolerance_summary_numpy(data, TOLERANCE),
+}
+
+# Implementations that accept only some container types (by their signature).
+SUPPORTED_CONTAINERS: dict[str, tuple[str, ...]] = {
+    'get_reduced_list2': ('list', 'tuple'),
+    'get_reduced_list3': ('list', 'tuple'),
+}
+
+
+def make_shape(shape: str, size: int) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    if shape == 'distinct':
+        return np.arange(size, dtype=np.int64)
+    if shape == 'equal':
+        return np.zeros(size, dtype=np.int64)
+    if shape == 'geometric':
+        # runs of random values with mean length of 100 samples
+        lengths = rng.geometric(0.01, size // 50 + 1)
+        return np.repeat(rng.integers(0, 4, len(lengths)), lengths)[:size]
+    if shape == 'noisy_floats':
+        return rng.normal(0, 0.1, size).cumsum() + rng.normal(0, 0.01, size)
+    raise ValueError(f'Invalid shape {shape}.')
+
+
+def make_container(data: np.ndarray, container: str):
+    if container == 'list':
+        return data.tolist()
+    if container == 'tuple':
+        return tuple(data.tolist())
+    if container == 'array':
+        return array('d' if data.dtype.kind == 'f' else 'q', data.tolist())
+    if container == 'ndarray':
+        return data
+    raise ValueError(f'Invalid container {container}.')
+
+
+SHAPES = ('distinct', 'equal', 'geometric', 'noisy_floats')
+CONTAINERS = ('list', 'tuple', 'array', 'ndarray')
+
+
+def measure(f: Callable, data, repeat: int) -> tuple[float, int]:
+    """
+    Returns best time of `repeat` runs in seconds and peak traced memory in bytes.
+    """
+    seconds = min(Timer(lambda: f(data)).repeat(repeat, number=1))
+
+    tracemalloc.start()
+    try:
+        f(data)
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return seconds, peak_memory
+
+
+def run(implementations: list[str], shapes: list[str], containers: list[str], sizes: list[int],
+        repeat: int) -> list[dict]:
+    results = []
+    for size in sizes:
+        for shape in shapes:
+            data = make_shape(shape, size)
+            for container in containers:
+                container_data = make_container(data, container)
+                for name in implementations:
+                    if container not in SUPPORTED_CONTAINERS.get(name, CONTAINERS):
+                        continue
+                    seconds, peak_memory = measure(IMPLEMENTATIONS[name], container_data, repeat)
+                    result = {
+                        'implementation': name,
+                        'shape': shape,
+                        'container': container,
+                        'size': size,
+                        'seconds': seconds,
+                        'samples_per_second': size / seconds if seconds else float('inf'),
+                        'peak_memory': peak_memory,
+                    }
+                    results.append(result)
+                    print(f'{name:42} {shape:12} {container:8} {size:>10} '
+                          f'{result["samples_per_second"]:>14,.0f}/s {peak_memory:>14,}B')
+    return results
+
+
+def _key(result: dict) -> tuple:
+    return result['implementation'], result['shape'], result['container'], result['size']
+
+
+def find_regressions(results: list[dict], baseline: list[dict], threshold: float) -> list[str]:
+    """
+    Compares results with baseline. Throughput drop or peak memory growth by more than `threshold`
+    (relative) is a regression.
+    """
+    baseline = {_key(result): result for result in baseline}
+    regressions = []
+    for result in results:
+        base = baseline.get(_key(result))
+        if base is None:
+            continue
+        if result['samples_per_second'] < base['samples_per_second'] * (1 - threshold):
+            regressions.append(f'{_key(result)}: throughput {result["samples_per_second"]:,.0f}/s, '
+                               f'baseline {base["samples_per_second"]:,.0f}/s')
+        if result['peak_memory'] > base['peak_memory'] * (1 + threshold):
+            regressions.append(f'{_key(result)}: peak memory {result["peak_memory"]:,}B, '
+                               f'baseline {base["peak_memory"]:,}B')
+    return regressions
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--implementations', nargs='+', default=list(IMPLEMENTATIONS), choices=IMPLEMENTATIONS)
+    parser.add_argument('--shapes', nargs='+', default=list(SHAPES), choices=SHAPES)
+    parser.add_argument('--containers', nargs='+', default=list(CONTAINERS), choices=CONTAINERS)
+    parser.add_argument('--sizes', nargs='+', type=int, default=[10_000, 1_000_000])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output', help='Path to JSON file to save results to.')
+    parser.add_argument('--baseline', help='Path to JSON file with saved results to compare with.')
+    parser.add_argument('--threshold', type=float, default=0.2, help='Relative change treated as regression.')
+    args = parser.parse_args(argv)
+
+    results = run(args.implementations, args.shapes, args.containers, args.sizes, args.repeat)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = find_regressions(results, baseline, args.threshold)
+        for regression in regressions:
+            print(f'REGRESSION {regression}')
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,123 @@
+from typing import Any, Union
+from collections.abc import Iterable, Iterator, Generator
+from itertools import chain
+
+import numpy as np
+
+from reduce_with_info_numpy import reduce_with_info_numpy
+from reduce_with_tolerance import reduce_with_tolerance
+
+
+def stitch_runs(runs: Iterable[tuple[np.ndarray, np.ndarray, np.ndarray]]) -> \
+        Generator[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    Merges consecutive batches of runs into finished runs.
+
+    Each batch is a struct of arrays (starts, values, lengths) of neighbouring data segments,
+    starts should be global indexes. The last run of a batch is kept open till the next batch comes in
+    since it may continue there. Yields struct of arrays of finished runs.
+    """
+    open_start = open_value = open_length = None
+
+    for starts, values, lengths in runs:
+        if not len(starts):
+            continue
+
+        if open_start is not None:
+            # Comparison is done the same way as in `reduce_with_info`.
+            if values[0] != open_value:
+                yield _single_run(open_start, open_value, open_length)
+            else:
+                starts = starts.copy()
+                lengths = lengths.copy()
+                starts[0] = open_start
+                lengths[0] += open_length
+
+        if len(starts) > 1:
+            yield starts[:-1], values[:-1], lengths[:-1]
+
+        open_start, open_value, open_length = starts[-1], values[-1], lengths[-1]
+
+    if open_start is not None:
+        yield _single_run(open_start, open_value, open_length)
+
+
+def _single_run(start, value, length) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    values = np.empty(1, dtype=np.asarray(value).dtype)
+    values[0] = value
+    return np.array([start], dtype=np.intp), values, np.array([length], dtype=np.intp)
+
+
+def _as_chunk_array(chunk) -> np.ndarray:
+    if isinstance(chunk, (bytes, bytearray)):
+        return np.frombuffer(chunk, dtype=np.uint8)
+    return chunk
+
+
+def reduce_with_info_chunked_arrays(chunks: Iterable) -> Generator[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    Reduces data that comes in chunks. Each chunk is reduced in bulk with `reduce_with_info_numpy`.
+    Open run is carried over chunk boundaries, so the result does not depend on how data is chunked.
+    Yields struct of arrays (starts, values, lengths) of finished runs, starts are global indexes.
+
+    :param chunks: Iterable of chunks. Chunk can be `bytes` (one sample per byte), numpy array,
+        any buffer protocol object or list.
+    """
+
+    def iter_runs():
+        offset = 0
+        for chunk in chunks:
+            starts, values, lengths = reduce_with_info_numpy(_as_chunk_array(chunk))
+            starts += offset
+            offset += int(lengths.sum())
+            yield starts, values, lengths
+
+    yield from stitch_runs(iter_runs())
+
+
+def reduce_with_info_chunked(chunks: Iterable) -> Generator[tuple]:
+    """
+    Same as `reduce_with_info`, but data comes in chunks.
+
+    Example:
+    >>> list(reduce_with_info_chunked([[1, 2], [2, 3], [3, 3, 1]]))
+    [(0, 1, 1), (1, 2, 2), (3, 3, 3), (6, 1, 1)]
+    """
+    for starts, values, lengths in reduce_with_info_chunked_arrays(chunks):
+        yield from zip(starts.tolist(), values.tolist(), lengths.tolist())
+
+
+def reduce_chunked(chunks: Iterable) -> Generator[Any]:
+    """
+    Same as `reduce`, but data comes in chunks.
+
+    Example:
+    >>> list(reduce_chunked([b'ab', b'bc', b'cca']))
+    [97, 98, 99, 97]
+    """
+    for _, values, _ in reduce_with_info_chunked_arrays(chunks):
+        yield from values.tolist()
+
+
+def reduce_with_tolerance_chunked(
+        chunks: Iterable,
+        tolerance: Union[float, int],
+        strategy: str = 'mean') -> \
+            Generator[tuple[tuple[float, int], float]]:
+    """
+    Same as `reduce_with_tolerance`, but data comes in chunks.
+    Tolerance strategies are sequential by nature, so chunks are only flattened here.
+
+    Example:
+    >>> list(reduce_with_tolerance_chunked([[1.1], [0.9, 2.]], 0.5))
+    [(1.1, 0.9), (2.0,)]
+    """
+    flat_data: Iterator = chain.from_iterable(
+        _as_chunk_array(chunk).tolist() if isinstance(chunk, (bytes, bytearray, np.ndarray)) else chunk
+        for chunk in chunks)
+    yield from reduce_with_tolerance(flat_data, tolerance, strategy)
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
@@ -0,0 +1,88 @@
+"""
+Reduces raw binary capture files.
+
+Input file is read through `np.memmap`, so data is never loaded whole nor copied into a Python list.
+Output file is a packed array of records (start, value, length), where start and length are
+little-endian unsigned 64-bit integers and value has the dtype of the input data.
+"""
+
+import os
+from collections.abc import Generator
+
+import numpy as np
+
+from reduce_chunked import reduce_with_info_chunked_arrays
+
+
+def reduced_dtype(dtype) -> np.dtype:
+    """
+    Returns dtype of the output file records for the given input data dtype.
+    """
+    return np.dtype([('start', '<u8'), ('value', np.dtype(dtype)), ('length', '<u8')])
+
+
+def iter_file_chunks(path: str, dtype, chunk_size: int = 1 << 24, offset: int = 0) -> Generator[np.ndarray]:
+    """
+    Yields memory-mapped chunks of the raw binary file.
+
+    :param path: Path to the file.
+    :param dtype: Data type of the samples, e.g. 'u1' or '<i2'.
+    :param chunk_size: Number of samples in each chunk.
+    :param offset: Offset in bytes where the data starts in the file.
+    """
+    dtype = np.dtype(dtype)
+    if os.path.getsize(path) - offset < dtype.itemsize:
+        return  # empty file cannot be mapped
+
+    data = np.memmap(path, dtype=dtype, mode='r', offset=offset)
+    for i in range(0, len(data), chunk_size):
+        yield data[i:i + chunk_size]
+
+
+def reduce_with_info_file(
+        input_path: str,
+        output_path: str,
+        dtype,
+        chunk_size: int = 1 << 24,
+        offset: int = 0) -> int:
+    """
+    Reduces raw binary file as `reduce_with_info` does and writes result straight to the output file.
+    Memory consumption is bounded by the chunk size.
+
+    :param input_path: Path to the raw binary capture.
+    :param output_path: Path to the file to write reduced data to. See `reduced_dtype` for its format.
+    :param dtype: Data type of the samples, e.g. 'u1' or '<i2'.
+    :param chunk_size: Number of samples processed at once.
+    :param offset: Offset in bytes where the data starts in the input file.
+    :return: Number of written runs.
+    """
+    record_dtype = reduced_dtype(dtype)
+    count = 0
+
+    with open(output_path, 'wb') as f:
+        for starts, values, lengths in reduce_with_info_chunked_arrays(
+                iter_file_chunks(input_path, dtype, chunk_size, offset)):
+            records = np.empty(len(starts), dtype=record_dtype)
+            records['start'] = starts
+            records['value'] = values
+            records['length'] = lengths
+            records.tofile(f)
+            count += len(records)
+
+    return count
+
+
+def read_reduced_file(path: str, dtype) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Maps file written by `reduce_with_info_file` into struct of arrays (starts, values, lengths).
+    Returned arrays are memory-mapped views, nothing is read until accessed.
+
+    :param path: Path to the reduced file.
+    :param dtype: Data type of the samples of the original data.
+    """
+    record_dtype = reduced_dtype(dtype)
+    if os.path.getsize(path) < record_dtype.itemsize:
+        records = np.empty(0, dtype=record_dtype)
+    else:
+        records = np.memmap(path, dtype=record_dtype, mode='r')
+    return records['start'], records['value'], records['length']
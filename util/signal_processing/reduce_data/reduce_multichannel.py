@@ -0,0 +1,83 @@
+"""
+Run-length reduction of multichannel captures stored as 2-D arrays.
+
+By default data is of shape (channels, samples), i.e. each row is a channel.
+Use `sample_axis=0` for data of shape (samples, channels).
+"""
+
+import numpy as np
+
+
+def _as_channels(data, sample_axis: int) -> np.ndarray:
+    """Returns 2-D array of shape (channels, samples)."""
+    array = np.asarray(data)
+    if array.ndim != 2:
+        raise ValueError(f'Invalid data. Data should be 2-D, but has {array.ndim} dimension(s).')
+    if sample_axis not in (0, 1, -1, -2):
+        raise ValueError(f'Invalid sample axis {sample_axis}.')
+    return np.moveaxis(array, sample_axis, -1)
+
+
+def reduce_with_info_any_channel(data, sample_axis: int = 1) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Same as `reduce_with_info_numpy`, but new run starts when any channel changes.
+    Values of each run are returned as columns, i.e. values are of shape (channels, runs).
+    With `sample_axis=0` values are transposed the same way as data, i.e. values are of shape (runs, channels).
+
+    Example:
+    >>> starts, values, lengths = reduce_with_info_any_channel([[0, 0, 1, 1], [0, 0, 0, 1]])
+    >>> starts.tolist(), values.tolist(), lengths.tolist()
+    ([0, 2, 3], [[0, 1, 1], [0, 0, 1]], [2, 1, 1])
+    """
+    channels = _as_channels(data, sample_axis)
+    n = channels.shape[1]
+
+    if n == 0:
+        starts = np.empty(0, dtype=np.intp)
+    else:
+        changed = (channels[:, 1:] != channels[:, :-1]).any(axis=0)
+        starts = np.flatnonzero(changed)
+        starts += 1
+        starts = np.concatenate((np.zeros(1, dtype=starts.dtype), starts))
+    lengths = np.diff(starts, append=n)
+    values = channels[:, starts]
+
+    if sample_axis in (0, -2):
+        values = values.T
+    return starts, values, lengths
+
+
+def reduce_with_info_each_channel(data, sample_axis: int = 1) -> list[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    Same as `reduce_with_info_numpy` applied to each channel independently.
+    All channels are processed at once. Returns struct of arrays (starts, values, lengths) per channel.
+
+    Example:
+    >>> [starts.tolist() for starts, _, _ in reduce_with_info_each_channel([[0, 0, 1, 1], [0, 0, 0, 1]])]
+    [[0, 2], [0, 3]]
+    """
+    channels = _as_channels(data, sample_axis)
+    n_channels, n = channels.shape
+
+    if n_channels == 0:
+        return []
+    if n == 0:
+        return [(np.empty(0, dtype=np.intp), channels[i, :0].copy(), np.empty(0, dtype=np.intp))
+                for i in range(n_channels)]
+
+    changed = channels[:, 1:] != channels[:, :-1]
+    # Indexes of changes are ordered by channel, so they can be split by count of changes per channel.
+    _, starts = np.nonzero(changed)
+    starts += 1
+    splits = np.cumsum(changed.sum(axis=1))[:-1]
+
+    result = []
+    for i, channel_starts in enumerate(np.split(starts, splits)):
+        channel_starts = np.concatenate((np.zeros(1, dtype=channel_starts.dtype), channel_starts))
+        result.append((channel_starts, channels[i, channel_starts], np.diff(channel_starts, append=n)))
+    return result
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
@@ -0,0 +1,198 @@
+"""
+Compression of slowly drifting signals into support points, as process historians do it.
+
+Each strategy keeps a set of support points (index, value), so that the signal restored from them
+differs from the original one by no more than the tolerance:
+- 'deadband' - new point is stored when value leaves tolerance band around the last stored value.
+  Signal is restored by holding the last value.
+- 'band' - sibling values are grouped while max - min of the group does not exceed 2 * tolerance.
+  Middle of the group range is stored. Signal is restored by holding the last value.
+- 'swinging_door' - point is stored when no line from the last stored point can pass within tolerance
+  of all samples since then. Bounds of the line slope ("doors") are tracked incrementally.
+  Signal is restored by linear interpolation between points.
+- 'linear' - points are original samples, the line between sibling points passes within tolerance
+  of all samples between them. Point is stored when the line from the last stored point to the current sample
+  misses any sample since then. Bounds of the line slope are tracked incrementally as in 'swinging_door'.
+  Signal is restored by linear interpolation between points.
+
+All strategies process data in O(1) per sample.
+"""
+
+from typing import Union
+from collections.abc import Iterator, Generator
+
+HOLD_STRATEGIES = ('deadband', 'band')
+LINEAR_STRATEGIES = ('swinging_door', 'linear')
+
+
+def reduce_to_support_points(
+        data: Iterator[float, int],
+        tolerance: Union[float, int],
+        strategy: str = 'swinging_door') -> \
+            Generator[tuple[int, float]]:
+    """
+    Yields support points (index, value) of the data.
+
+    :param data: Data set.
+    :param tolerance: Absolute tolerance to apply.
+    :param strategy: 'deadband', 'band', 'swinging_door' or 'linear'. See module description.
+
+    Examples:
+    >>> list(reduce_to_support_points([0, 1, 2, 3, 2, 1], 0.1))
+    [(0, 0), (3, 3.0), (5, 1.0)]
+    >>> list(reduce_to_support_points([0, 0.5, 2, 2.2], 1, 'deadband'))
+    [(0, 0), (2, 2)]
+    >>> list(reduce_to_support_points([0, 1, 2, 3, 2, 1], 0.1, 'linear'))
+    [(0, 0), (3, 3), (5, 1)]
+    """
+
+    if strategy not in HOLD_STRATEGIES + LINEAR_STRATEGIES:
+        raise ValueError(f'Invalid strategy {strategy}. '
+                         f'Valid values are: {", ".join(HOLD_STRATEGIES + LINEAR_STRATEGIES)}.')
+
+    iter_data = iter(data)
+
+    try:
+        first_value = next(iter_data)
+    except StopIteration:
+        return
+
+    if strategy == 'deadband':
+
+        yield 0, first_value
+        stored_value = first_value
+
+        for current_index, current_value in enumerate(iter_data, 1):
+            if not (stored_value - tolerance <= current_value <= stored_value + tolerance):
+                yield current_index, current_value
+                stored_value = current_value
+
+    elif strategy == 'band':
+
+        start_index = 0
+        min_value = max_value = first_value
+        band = 2 * tolerance
+
+        for current_index, current_value in enumerate(iter_data, 1):
+            if current_value < min_value:
+                if max_value - current_value <= band:
+                    min_value = current_value
+                    continue
+            elif current_value > max_value:
+                if current_value - min_value <= band:
+                    max_value = current_value
+                    continue
+            else:
+                continue
+            yield start_index, (min_value + max_value) / 2
+            start_index = current_index
+            min_value = max_value = current_value
+
+        yield start_index, (min_value + max_value) / 2
+
+    elif strategy == 'swinging_door':
+
+        yield 0, first_value
+        origin_index, origin_value = 0, first_value
+        previous_index = None
+        upper_slope = float('inf')
+        lower_slope = float('-inf')
+
+        for current_index, current_value in enumerate(iter_data, 1):
+            dt = current_index - origin_index
+            new_upper_slope = min(upper_slope, (current_value + tolerance - origin_value) / dt)
+            new_lower_slope = max(lower_slope, (current_value - tolerance - origin_value) / dt)
+
+            if new_lower_slope <= new_upper_slope:
+                upper_slope, lower_slope = new_upper_slope, new_lower_slope
+            else:
+                # Doors are closed. Store the previous point on the line that fits all samples since
+                # the origin. Stored value differs from the sample value, but not more than the tolerance.
+                slope = (upper_slope + lower_slope) / 2
+                origin_value += slope * (previous_index - origin_index)
+                origin_index = previous_index
+                yield origin_index, origin_value
+                upper_slope = current_value + tolerance - origin_value
+                lower_slope = current_value - tolerance - origin_value
+            previous_index = current_index
+
+        if previous_index is not None:
+            slope = (upper_slope + lower_slope) / 2
+            yield previous_index, origin_value + slope * (previous_index - origin_index)
+
+    elif strategy == 'linear':
+
+        yield 0, first_value
+        origin_index, origin_value = 0, first_value
+        previous_index = previous_value = None
+        upper_slope = float('inf')
+        lower_slope = float('-inf')
+
+        for current_index, current_value in enumerate(iter_data, 1):
+            dt = current_index - origin_index
+            if not lower_slope <= (current_value - origin_value) / dt <= upper_slope:
+                # Line to the current sample misses some samples since the origin,
+                # line to the previous sample fits all of them, so the previous sample is stored.
+                origin_index, origin_value = previous_index, previous_value
+                yield origin_index, origin_value
+                upper_slope = float('inf')
+                lower_slope = float('-inf')
+                dt = 1
+            # Slope bounds of lines that pass within tolerance of the current sample,
+            # they apply to lines to the next samples.
+            upper_slope = min(upper_slope, (current_value + tolerance - origin_value) / dt)
+            lower_slope = max(lower_slope, (current_value - tolerance - origin_value) / dt)
+            previous_index, previous_value = current_index, current_value
+
+        if previous_index is not None:
+            yield previous_index, previous_value
+
+
+def restore_from_support_points(
+        points: Iterator[tuple[int, float]],
+        length: int,
+        strategy: str = 'swinging_door') -> list[float]:
+    """
+    Restores data from support points yielded by `reduce_to_support_points`.
+
+    :param points: Support points (index, value).
+    :param length: Length of the original data. Data is padded with the last value up to this length.
+    :param strategy: Strategy used for reduction.
+
+    Example:
+    >>> restore_from_support_points([(0, 0), (3, 3.0), (5, 1.0)], 6)
+    [0, 1.0, 2.0, 3.0, 2.0, 1.0]
+    """
+
+    result = []
+
+    if strategy in HOLD_STRATEGIES:
+        previous_value = None
+        for index, value in points:
+            result.extend([previous_value] * (index - len(result)))
+            previous_value = value
+        if previous_value is not None:
+            result.extend([previous_value] * (length - len(result)))
+
+    elif strategy in LINEAR_STRATEGIES:
+        previous_index = previous_value = None
+        for index, value in points:
+            if previous_index is None:
+                result.append(value)
+            else:
+                slope = (value - previous_value) / (index - previous_index)
+                result.extend(previous_value + slope * i for i in range(1, index - previous_index + 1))
+            previous_index, previous_value = index, value
+        if previous_value is not None:
+            result.extend([previous_value] * (length - len(result)))
+
+    else:
+        raise ValueError(f'Invalid strategy {strategy}. '
+                         f'Valid values are: {", ".join(HOLD_STRATEGIES + LINEAR_STRATEGIES)}.')
+
+    return result
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
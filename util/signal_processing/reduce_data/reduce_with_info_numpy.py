@@ -0,0 +1,63 @@
+import numpy as np
+
+
+def as_array(data) -> np.ndarray:
+    """
+    Returns 1-D numpy array view of the data.
+    Buffer protocol objects (`array.array`, `bytes`, `memoryview`, etc.) are wrapped without copying.
+
+    :param data: numpy array, object that supports buffer protocol or any sequence.
+        Sequences of strings mixed with other values are kept as arrays of objects.
+    """
+    if isinstance(data, np.ndarray):
+        array = data
+    else:
+        try:
+            array = np.asarray(memoryview(data))
+        except TypeError:
+            array = np.asarray(data)
+            if array.dtype.kind in 'US':
+                # numpy converts values of mixed types to strings, so that 1 and '1' would be equal
+                value_type = str if array.dtype.kind == 'U' else bytes
+                if not all(isinstance(value, value_type) for value in data):
+                    array = np.asarray(data, dtype=object)
+
+    if array.ndim != 1:
+        raise ValueError(f'Invalid data. Data should be 1-D, but has {array.ndim} dimension(s).')
+
+    return array
+
+
+def reduce_with_info_numpy(data) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Vectorized version of `reduce_with_info`.
+    Run boundaries are found in bulk, result is returned as struct of arrays:
+    - indexes of first reduced elements;
+    - values of first reduced elements;
+    - reduced elements counts.
+
+    Example:
+    >>> starts, values, lengths = reduce_with_info_numpy([1, 2, 2, 3, 3, 3, 1])
+    >>> list(zip(starts.tolist(), values.tolist(), lengths.tolist()))
+    [(0, 1, 1), (1, 2, 2), (3, 3, 3), (6, 1, 1)]
+    """
+    array = as_array(data)
+    n = len(array)
+
+    if n == 0:
+        return np.empty(0, dtype=np.intp), array[:0].copy(), np.empty(0, dtype=np.intp)
+
+    # Index of each element that differs from the previous one starts new run.
+    starts = np.flatnonzero(array[1:] != array[:-1])
+    starts += 1
+    starts = np.concatenate((np.zeros(1, dtype=starts.dtype), starts))
+
+    lengths = np.diff(starts, append=n)
+    values = array[starts]
+
+    return starts, values, lengths
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
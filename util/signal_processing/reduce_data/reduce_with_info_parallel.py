@@ -0,0 +1,72 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from multiprocessing.shared_memory import SharedMemory
+from typing import Optional
+
+import numpy as np
+
+from reduce_chunked import stitch_runs
+from reduce_with_info_numpy import as_array, reduce_with_info_numpy
+
+
+def _reduce_segment(name: str, dtype: np.dtype, size: int, start: int, stop: int) -> \
+        tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Worker. Attaches to the shared buffer and reduces its segment [start, stop).
+    """
+    shm = SharedMemory(name=name)
+    try:
+        data = np.ndarray((size,), dtype=dtype, buffer=shm.buf)
+        starts, values, lengths = reduce_with_info_numpy(data[start:stop])
+        # Views to the shared buffer should be released before it is closed.
+        del data
+    finally:
+        shm.close()
+    starts += start
+    return starts, values, lengths
+
+
+def reduce_with_info_parallel(
+        data,
+        processes: Optional[int] = None,
+        min_segment_size: int = 1 << 20) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Parallel version of `reduce_with_info_numpy`.
+
+    Data is copied once into `multiprocessing.shared_memory` and split into segments which are reduced
+    in a process pool. Runs that cross segment edges are merged, so the result is the same as the serial one.
+
+    :param data: numpy array or object that supports buffer protocol. Object dtype is not supported.
+    :param processes: Number of worker processes. Defaults to the number of CPUs.
+    :param min_segment_size: Minimal number of samples per segment. Small data is reduced serially.
+    :return: Struct of arrays (starts, values, lengths).
+    """
+    array = as_array(data)
+    if array.dtype.hasobject:
+        raise ValueError('Invalid data. Python objects cannot be shared between processes.')
+
+    n = len(array)
+    processes = processes or os.cpu_count() or 1
+    segments = max(1, min(processes, n // max(1, min_segment_size)))
+    if segments == 1:
+        return reduce_with_info_numpy(array)
+
+    bounds = np.linspace(0, n, segments + 1).astype(np.intp).tolist()
+
+    shm = SharedMemory(create=True, size=array.nbytes)
+    try:
+        shared = np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)
+        shared[:] = array
+        del shared
+
+        with ProcessPoolExecutor(min(processes, segments)) as executor:
+            results = executor.map(
+                _reduce_segment, repeat(shm.name), repeat(array.dtype), repeat(n), bounds[:-1], bounds[1:])
+            batches = list(stitch_runs(results))
+    finally:
+        shm.close()
+        shm.unlink()
+
+    starts, values, lengths = zip(*batches)
+    return np.concatenate(starts), np.concatenate(values), np.concatenate(lengths)
@@ -0,0 +1,67 @@
+from typing import Any
+from collections.abc import Iterator, Generator
+
+import numpy as np
+
+from reduce_with_info_numpy import as_array, reduce_with_info_numpy
+
+
+def reduce_with_timestamps(data: Iterator[tuple[Any, Any]]) -> Generator[tuple]:
+    """
+    Reduces (timestamp, value) stream to change points.
+    Yields info of each run:
+    - timestamp of the first element;
+    - timestamp of the last element;
+    - value;
+    - elements count.
+
+    Example:
+    >>> list(reduce_with_timestamps([(0.0, 1), (0.5, 1), (1.0, 2), (1.5, 1)]))
+    [(0.0, 0.5, 1, 2), (1.0, 1.0, 2, 1), (1.5, 1.5, 1, 1)]
+    """
+
+    iter_data = iter(data)
+
+    try:
+        first_timestamp, previous_value = next(iter_data)
+    except StopIteration:
+        return
+
+    last_timestamp = first_timestamp
+    count = 1
+
+    for timestamp, current_value in iter_data:
+        if current_value != previous_value:
+            yield first_timestamp, last_timestamp, previous_value, count
+            first_timestamp = timestamp
+            previous_value = current_value
+            count = 0
+        last_timestamp = timestamp
+        count += 1
+
+    yield first_timestamp, last_timestamp, previous_value, count
+
+
+def reduce_with_timestamps_numpy(timestamps, values) -> \
+        tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Vectorized version of `reduce_with_timestamps` for parallel timestamp and value arrays.
+    Returns struct of arrays (first timestamps, last timestamps, values, lengths).
+
+    Example:
+    >>> first, last, values, lengths = reduce_with_timestamps_numpy([0.0, 0.5, 1.0, 1.5], [1, 1, 2, 1])
+    >>> first.tolist(), last.tolist(), values.tolist(), lengths.tolist()
+    ([0.0, 1.0, 1.5], [0.5, 1.0, 1.5], [1, 2, 1], [2, 1, 1])
+    """
+    timestamps = as_array(timestamps)
+    starts, values, lengths = reduce_with_info_numpy(values)
+
+    if len(timestamps) != lengths.sum():
+        raise ValueError('Invalid data. Timestamps and values should be of the same size.')
+
+    return timestamps[starts], timestamps[starts + lengths - 1], values, lengths
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
@@ -1,7 +1,20 @@
-from typing import Union
+from typing import NamedTuple, Union
 from collections.abc import Iterator, Generator
 
 
+class ToleranceGroup(NamedTuple):
+    """
+    Summary of the group of values reduced with tolerance.
+    """
+    start_index: int
+    count: int
+    mean: float
+    min: Union[float, int]
+    max: Union[float, int]
+    first: Union[float, int]
+    last: Union[float, int]
+
+
 def reduce_with_tolerance(
         data: Iterator[float, int],
         tolerance: Union[float, int],
@@ -64,3 +77,89 @@ def reduce_with_tolerance(
             previous_value = current_value
 
         yield tuple(values)
+
+
+def reduce_with_tolerance_summary(
+        data: Iterator[float, int],
+        tolerance: Union[float, int],
+        strategy: str = 'mean') -> \
+            Generator[ToleranceGroup]:
+    """
+    Same as `reduce_with_tolerance`, but yields only summary of each group instead of all its values.
+    Summary is updated per sample, so memory does not depend on group size.
+
+    :param data: Data set.
+    :param tolerance: Absolute tolerance to apply.
+    :param strategy: How to apply tolerance value. See `reduce_with_tolerance`.
+
+    Examples:
+    >>> list(reduce_with_tolerance_summary([1, 3, 2], 1))
+    [ToleranceGroup(start_index=0, count=1, mean=1.0, min=1, max=1, first=1, last=1), \
+ToleranceGroup(start_index=1, count=2, mean=2.5, min=2, max=3, first=3, last=2)]
+    """
+
+    if strategy not in ('mean', 'previous'):
+        raise ValueError(f'Invalid strategy {strategy}. Valid values are: "mean", "previous".')
+
+    iter_data = iter(data)
+
+    try:
+        first_value = next(iter_data)
+    except StopIteration:
+        return
+
+    start_index = 0
+    current_index = 1
+    f_sum = min_value = max_value = last_value = first_value
+    n = 1
+    # Bounds are kept between samples and recalculated only when their reference value changes:
+    # mean of the group after each accepted sample or previous sample after each sample,
+    # so that each sample is compared with precomputed bounds.
+    low, high = first_value - tolerance, first_value + tolerance
+
+    if strategy == 'mean':
+
+        for current_value in iter_data:
+            if low <= current_value <= high:
+                f_sum += current_value
+                n += 1
+                if current_value < min_value:
+                    min_value = current_value
+                elif current_value > max_value:
+                    max_value = current_value
+                values_mean = f_sum / n
+                low, high = values_mean - tolerance, values_mean + tolerance
+            else:
+                yield ToleranceGroup(start_index, n, f_sum / n, min_value, max_value, first_value, last_value)
+                start_index = current_index
+                f_sum = min_value = max_value = first_value = current_value
+                n = 1
+                low, high = current_value - tolerance, current_value + tolerance
+            last_value = current_value
+            current_index += 1
+
+    elif strategy == 'previous':
+
+        for current_value in iter_data:
+            if low <= current_value <= high:
+                f_sum += current_value
+                n += 1
+                if current_value < min_value:
+                    min_value = current_value
+                elif current_value > max_value:
+                    max_value = current_value
+            else:
+                yield ToleranceGroup(start_index, n, f_sum / n, min_value, max_value, first_value, last_value)
+                start_index = current_index
+                f_sum = min_value = max_value = first_value = current_value
+                n = 1
+            low, high = current_value - tolerance, current_value + tolerance
+            last_value = current_value
+            current_index += 1
+
+    yield ToleranceGroup(start_index, n, f_sum / n, min_value, max_value, first_value, last_value)
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
@@ -0,0 +1,58 @@
+from typing import Union
+
+import numpy as np
+
+from reduce_with_info_numpy import as_array
+from reduce_with_tolerance import ToleranceGroup
+
+
+def reduce_with_tolerance_summary_numpy(data, tolerance: Union[float, int]) -> ToleranceGroup:
+    """
+    Vectorized version of `reduce_with_tolerance_summary` with 'previous' strategy.
+    The 'mean' strategy depends on every previous decision, so it cannot be vectorized.
+
+    Returns `ToleranceGroup` of arrays, i.e. struct of arrays, one element per group.
+
+    Example:
+    >>> groups = reduce_with_tolerance_summary_numpy([1, 3, 2], 1)
+    >>> groups.start_index.tolist(), groups.count.tolist(), groups.mean.tolist()
+    ([0, 1], [1, 2], [1.0, 2.5])
+    """
+    array = as_array(data)
+    n = len(array)
+
+    if n == 0:
+        empty = np.empty(0, dtype=np.intp)
+        return ToleranceGroup(empty, empty, np.empty(0), array[:0], array[:0], array[:0], array[:0])
+
+    # Avoid wrap around of small and unsigned integers when tolerance is added or subtracted.
+    if array.dtype.kind in 'iub':
+        compared = array.astype(np.int64 if isinstance(tolerance, (int, np.integer)) else np.float64)
+    else:
+        compared = array
+
+    previous_values = compared[:-1]
+    current_values = compared[1:]
+    within = (previous_values - tolerance <= current_values) & (current_values <= previous_values + tolerance)
+
+    starts = np.flatnonzero(~within)
+    starts += 1
+    starts = np.concatenate((np.zeros(1, dtype=starts.dtype), starts))
+    counts = np.diff(starts, append=n)
+
+    sums = np.add.reduceat(array, starts, dtype=np.float64)
+
+    return ToleranceGroup(
+        start_index=starts,
+        count=counts,
+        mean=sums / counts,
+        min=np.minimum.reduceat(array, starts),
+        max=np.maximum.reduceat(array, starts),
+        first=array[starts],
+        last=array[starts + counts - 1],
+    )
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
@@ -0,0 +1,134 @@
+from collections.abc import Iterable, Generator
+from itertools import repeat
+from typing import Any
+
+import numpy as np
+
+from reduce_with_info_numpy import reduce_with_info_numpy
+
+
+class RunLengthArray:
+    """
+    Read-only array stored as runs (start index, value, length), as returned by `reduce_with_info`.
+    Data is never expanded: element access is a binary search over run starts, slicing returns
+    another `RunLengthArray`.
+
+    Example:
+    >>> rla = RunLengthArray.from_data([1, 2, 2, 3, 3, 3, 1])
+    >>> len(rla), rla[4], rla[-1]
+    (7, 3, 1)
+    >>> list(rla[2:5].runs())
+    [(0, 2, 1), (1, 3, 2)]
+    """
+
+    __slots__ = ('starts', 'values', 'lengths', '_size')
+
+    def __init__(self, starts, values, lengths):
+        """
+        :param starts: Indexes of first elements of runs. Should start from zero and be increasing.
+        :param values: Values of runs.
+        :param lengths: Runs lengths.
+        """
+        self.starts = np.asarray(starts, dtype=np.intp)
+        self.values = np.asarray(values)
+        self.lengths = np.asarray(lengths, dtype=np.intp)
+
+        if not (len(self.starts) == len(self.values) == len(self.lengths)):
+            raise ValueError('Invalid runs. Starts, values and lengths should be of the same size.')
+
+        self._size = int(self.starts[-1] + self.lengths[-1]) if len(self.starts) else 0
+
+    @classmethod
+    def from_data(cls, data) -> 'RunLengthArray':
+        """Reduces the data with `reduce_with_info_numpy`."""
+        return cls(*reduce_with_info_numpy(data))
+
+    @classmethod
+    def from_runs(cls, runs: Iterable[tuple]) -> 'RunLengthArray':
+        """Builds array from (start index, value, length) tuples, e.g. from `reduce_with_info`."""
+        runs = list(runs)
+        if not runs:
+            return cls([], [], [])
+        return cls(*zip(*runs))
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(runs={len(self.starts)}, length={self._size})'
+
+    def _run_index(self, index: int) -> int:
+        return int(np.searchsorted(self.starts, index, side='right')) - 1
+
+    def __getitem__(self, index):
+        """
+        Get value by its index in the original data or a slice of the array.
+        """
+        if isinstance(index, slice):
+            return self._get_slice(index)
+
+        try:
+            index = int(index)
+        except TypeError:
+            raise TypeError(f'Invalid index type {type(index)}.') from None
+
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError(f'Index {index} is out of range.')
+
+        return self.values.item(self._run_index(index))
+
+    def _get_slice(self, slice_: slice) -> 'RunLengthArray':
+        start, stop, step = slice_.indices(self._size)
+
+        if step < 0:
+            # Slice reversed array, positions are mirrored.
+            return self._reversed()[self._size - 1 - start:self._size - 1 - stop:-step]
+
+        if start >= stop:
+            return self.__class__([], self.values[:0], [])
+
+        first = self._run_index(start)
+        last = self._run_index(stop - 1)
+        run_starts = self.starts[first:last + 1]
+        run_ends = run_starts + self.lengths[first:last + 1]
+
+        # Number of picked positions `start + k * step` before each run start and end.
+        k_starts = -((start - np.maximum(run_starts, start)) // step)
+        k_ends = -((start - np.minimum(run_ends, stop)) // step)
+        lengths = k_ends - k_starts
+        values = self.values[first:last + 1]
+
+        if step != 1:
+            # Runs can be skipped completely, merge neighbours with equal values.
+            picked = lengths > 0
+            lengths, values = lengths[picked], values[picked]
+            new_run = np.concatenate(([True], values[1:] != values[:-1]))
+            lengths = np.add.reduceat(lengths, np.flatnonzero(new_run))
+            values = values[new_run]
+
+        starts = np.concatenate(([0], np.cumsum(lengths[:-1])))
+        return self.__class__(starts, values, lengths)
+
+    def _reversed(self) -> 'RunLengthArray':
+        lengths = self.lengths[::-1]
+        starts = self._size - (self.starts + self.lengths)[::-1]
+        return self.__class__(starts, self.values[::-1], lengths)
+
+    def __iter__(self) -> Generator[Any]:
+        for value, length in zip(self.values.tolist(), self.lengths.tolist()):
+            yield from repeat(value, length)
+
+    def runs(self) -> Generator[tuple]:
+        """Yields (start index, value, length) tuples as `reduce_with_info` does."""
+        yield from zip(self.starts.tolist(), self.values.tolist(), self.lengths.tolist())
+
+    def to_numpy(self) -> np.ndarray:
+        """Expands runs into the original data."""
+        return np.repeat(self.values, self.lengths)
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
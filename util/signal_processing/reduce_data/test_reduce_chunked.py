@@ -0,0 +1,76 @@
+import unittest
+from array import array
+
+import numpy as np
+
+from reduce import reduce
+from reduce_with_info import reduce_with_info
+from reduce_with_tolerance import reduce_with_tolerance
+from reduce_chunked import reduce_chunked, reduce_with_info_chunked, reduce_with_tolerance_chunked
+
+
+def split(data: list, size: int) -> list:
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class TestCase(unittest.TestCase):
+    test_data = (
+        [],
+        [0],
+        [0, 1],
+        [0, 0],
+        [0, 0, 1, 0],
+        [0, 1, 1, 0],
+        [0, 0, 1, 1, 0, 0],
+        [1, 1, 1, 1, 1, 1, 1],
+        [None, None, 1],
+    )
+
+    def test_reduce_with_info(self):
+        for data in self.test_data:
+            for size in (1, 2, 3, 100):
+                with self.subTest(data=data, size=size):
+                    output = list(reduce_with_info_chunked(split(data, size)))
+                    self.assertEqual(output, list(reduce_with_info(data)))
+
+    def test_reduce(self):
+        for data in self.test_data:
+            for size in (1, 2, 3, 100):
+                with self.subTest(data=data, size=size):
+                    output = list(reduce_chunked(split(data, size)))
+                    self.assertEqual(output, list(reduce(data)))
+
+    def test_reduce_with_tolerance(self):
+        data = [1, 2, 3, 3, 1, 2, 5]
+        for size in (1, 2, 3, 100):
+            for strategy in ('mean', 'previous'):
+                with self.subTest(size=size, strategy=strategy):
+                    output = list(reduce_with_tolerance_chunked(split(data, size), 1, strategy))
+                    self.assertEqual(output, list(reduce_with_tolerance(data, 1, strategy)))
+
+    def test_chunk_types(self):
+        chunks = (
+            b'\x01\x01',
+            bytearray(b'\x01\x02'),
+            np.array([2, 2], dtype=np.uint8),
+            array('B', [3]),
+            [],
+            [3, 1],
+        )
+        output = list(reduce_with_info_chunked(chunks))
+        self.assertEqual(output, [(0, 1, 3), (3, 2, 3), (6, 3, 2), (8, 1, 1)])
+
+    def test_lazy(self):
+        # runs are yielded as soon as they are finished
+        def chunks():
+            yield [1, 1, 2]
+            yield [2, 3]
+            raise AssertionError('Should not be reached')
+
+        output = reduce_with_info_chunked(chunks())
+        self.assertEqual(next(output), (0, 1, 2))
+        self.assertEqual(next(output), (2, 2, 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
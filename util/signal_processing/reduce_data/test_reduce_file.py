@@ -0,0 +1,55 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from reduce_with_info import reduce_with_info
+from reduce_file import reduce_with_info_file, read_reduced_file
+
+
+class TestCase(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.input_path = os.path.join(self.dir.name, 'capture.bin')
+        self.output_path = os.path.join(self.dir.name, 'reduced.bin')
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test(self):
+        test_data = (
+            [],
+            [0],
+            [0, 0, 1, 0],
+            [0, 1, 1, 0],
+            [5, 5, 5, 5, 5],
+            [0, 0, 1, 1, 0, 0, 7, 7, 7, 1],
+        )
+        for data in test_data:
+            for dtype in ('u1', '<i2', '>u4', '<f8'):
+                for chunk_size in (1, 2, 3, 1000):
+                    with self.subTest(data=data, dtype=dtype, chunk_size=chunk_size):
+                        np.array(data, dtype=dtype).tofile(self.input_path)
+
+                        count = reduce_with_info_file(self.input_path, self.output_path, dtype, chunk_size)
+
+                        exp_output = list(reduce_with_info(data))
+                        self.assertEqual(count, len(exp_output))
+                        self.assertEqual(os.path.getsize(self.output_path), count * (16 + np.dtype(dtype).itemsize))
+
+                        starts, values, lengths = read_reduced_file(self.output_path, dtype)
+                        output = list(zip(starts.tolist(), values.tolist(), lengths.tolist()))
+                        self.assertEqual(output, exp_output)
+
+    def test_offset(self):
+        with open(self.input_path, 'wb') as f:
+            f.write(b'HEADER')
+            f.write(bytes([1, 1, 2]))
+        reduce_with_info_file(self.input_path, self.output_path, 'u1', offset=6)
+        starts, values, lengths = read_reduced_file(self.output_path, 'u1')
+        self.assertEqual(list(zip(starts.tolist(), values.tolist(), lengths.tolist())), [(0, 1, 2), (2, 2, 1)])
+
+
+if __name__ == '__main__':
+    unittest.main()
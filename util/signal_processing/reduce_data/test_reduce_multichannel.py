@@ -0,0 +1,48 @@
+import unittest
+
+import numpy as np
+
+from reduce_with_info import reduce_with_info
+from reduce_multichannel import reduce_with_info_any_channel, reduce_with_info_each_channel
+
+
+class TestCase(unittest.TestCase):
+    rng = np.random.default_rng(0)
+    test_data = (
+        np.zeros((3, 0), dtype=np.uint8),
+        np.zeros((0, 5), dtype=np.uint8),
+        np.zeros((1, 1), dtype=np.uint8),
+        np.array([[0, 0, 1, 1], [0, 0, 0, 1]]),
+        np.array([[0, 0, 0, 0], [1, 1, 1, 1]]),
+        rng.integers(0, 2, (4, 100), dtype=np.uint8),
+        rng.integers(0, 3, (2, 50)).astype(np.float64),
+    )
+
+    def test_any_channel(self):
+        for data in self.test_data:
+            for sample_axis, input_ in ((1, data), (0, data.T)):
+                with self.subTest(data=data, sample_axis=sample_axis):
+                    starts, values, lengths = reduce_with_info_any_channel(input_, sample_axis)
+                    rows = values.T if sample_axis == 1 else values
+                    output = list(zip(starts.tolist(), map(tuple, rows.tolist()), lengths.tolist()))
+                    self.assertEqual(output, list(reduce_with_info(map(tuple, data.T.tolist()))))
+
+    def test_each_channel(self):
+        for data in self.test_data:
+            for sample_axis, input_ in ((1, data), (0, data.T)):
+                with self.subTest(data=data, sample_axis=sample_axis):
+                    output = reduce_with_info_each_channel(input_, sample_axis)
+                    self.assertEqual(len(output), len(data))
+                    for (starts, values, lengths), channel in zip(output, data.tolist()):
+                        self.assertEqual(list(zip(starts.tolist(), values.tolist(), lengths.tolist())),
+                                         list(reduce_with_info(channel)))
+
+    def test_invalid_dimension(self):
+        with self.assertRaises(ValueError):
+            reduce_with_info_any_channel([1, 2])
+        with self.assertRaises(ValueError):
+            reduce_with_info_each_channel([1, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import random
+import unittest
+
+from reduce_to_support_points import reduce_to_support_points, restore_from_support_points
+
+
+class TestCase(unittest.TestCase):
+    strategies = ('deadband', 'band', 'swinging_door', 'linear')
+
+    def test_restore_within_tolerance(self):
+        rnd = random.Random(0)
+        walk = [0.]
+        for _ in range(2000):
+            walk.append(walk[-1] + rnd.gauss(0, 0.1))
+        test_data = (
+            [],
+            [1],
+            [1, 1],
+            [1, 2],
+            [0, 1, 2, 3, 2, 1],
+            [0, 0, 0, 5, 5, 5, 0],
+            walk,
+        )
+        for data in test_data:
+            for tolerance in (0, 0.1, 1):
+                for strategy in self.strategies:
+                    with self.subTest(data=data, tolerance=tolerance, strategy=strategy):
+                        points = list(reduce_to_support_points(data, tolerance, strategy))
+                        restored = restore_from_support_points(points, len(data), strategy)
+                        self.assertEqual(len(restored), len(data))
+                        for value, restored_value in zip(data, restored):
+                            self.assertLessEqual(abs(value - restored_value), tolerance + 1e-9)
+
+    def test_compression(self):
+        data = [i / 100 for i in range(1000)]  # line
+        self.assertEqual(len(list(reduce_to_support_points(data, 0.01, 'swinging_door'))), 2)
+        self.assertEqual(len(list(reduce_to_support_points(data, 0.01, 'linear'))), 2)
+        self.assertEqual(len(list(reduce_to_support_points(data, 0.5, 'deadband'))), 20)
+        self.assertEqual(len(list(reduce_to_support_points(data, 0.5, 'band'))), 10)
+
+    def test_linear_points_are_samples(self):
+        rnd = random.Random(1)
+        data = [rnd.randint(0, 10) for _ in range(500)]
+        points = list(reduce_to_support_points(data, 2, 'linear'))
+        self.assertEqual([value for _, value in points], [data[index] for index, _ in points])
+        self.assertEqual(points[-1][0], len(data) - 1)
+
+    def test_restore_length(self):
+        for strategy in self.strategies:
+            with self.subTest(strategy=strategy):
+                self.assertEqual(restore_from_support_points([(0, 1), (2, 3)], 5, strategy)[3:], [3, 3])
+
+    def test_invalid_strategy(self):
+        with self.assertRaises(ValueError):
+            list(reduce_to_support_points([1], 1, 'mean'))
+        with self.assertRaises(ValueError):
+            restore_from_support_points([(0, 1)], 1, 'mean')
+
+
+if __name__ == '__main__':
+    unittest.main()
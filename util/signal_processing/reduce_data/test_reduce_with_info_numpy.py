@@ -0,0 +1,61 @@
+import unittest
+from array import array
+
+import numpy as np
+
+from reduce_with_info import reduce_with_info
+from reduce_with_info_numpy import reduce_with_info_numpy
+
+
+class TestCase(unittest.TestCase):
+    def test(self):
+        test_data = (
+            [],
+            [0],
+            [0, 1],
+            [0, 0],
+            [0, 0, 1],
+            [1, 0, 0],
+            [0, 0, 1, 0],
+            [0, 1, 0, 0],
+            [0, 1, 1, 0],
+            [0, 0, 1, 1, 0, 0],
+            [None, None],
+            ['a', 'a', 'b'],
+            [1, '1'],
+            ['1', '1', 1],
+            [b'1', 1, 1],
+        )
+        for input_ in test_data:
+            with self.subTest(input_=input_):
+                starts, values, lengths = reduce_with_info_numpy(input_)
+                data = list(zip(starts.tolist(), values.tolist(), lengths.tolist()))
+                self.assertEqual(data, list(reduce_with_info(input_)))
+
+    def test_input_types(self):
+        exp_output = [(0, 1, 2), (2, 2, 1), (3, 1, 3)]
+        for input_ in (
+                np.array([1, 1, 2, 1, 1, 1], dtype=np.uint8),
+                array('h', [1, 1, 2, 1, 1, 1]),
+                bytes([1, 1, 2, 1, 1, 1]),
+                memoryview(bytearray([1, 1, 2, 1, 1, 1])),
+                (1, 1, 2, 1, 1, 1),
+        ):
+            with self.subTest(input_=input_):
+                starts, values, lengths = reduce_with_info_numpy(input_)
+                data = list(zip(starts.tolist(), values.tolist(), lengths.tolist()))
+                self.assertEqual(data, exp_output)
+
+    def test_nan(self):
+        # as in `reduce_with_info`, NaN is not equal to itself
+        starts, values, lengths = reduce_with_info_numpy(np.array([np.nan, np.nan, 1.]))
+        self.assertEqual(starts.tolist(), [0, 1, 2])
+        self.assertEqual(lengths.tolist(), [1, 1, 1])
+
+    def test_invalid_dimension(self):
+        with self.assertRaises(ValueError):
+            reduce_with_info_numpy(np.zeros((2, 2)))
+
+
+if __name__ == '__main__':
+    unittest.main()
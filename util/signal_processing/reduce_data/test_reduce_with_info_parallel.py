@@ -0,0 +1,34 @@
+import unittest
+
+import numpy as np
+
+from reduce_with_info_numpy import reduce_with_info_numpy
+from reduce_with_info_parallel import reduce_with_info_parallel
+
+
+class TestCase(unittest.TestCase):
+    def test(self):
+        rng = np.random.default_rng(0)
+        test_data = (
+            np.array([], dtype=np.uint8),
+            np.array([1], dtype=np.uint8),
+            np.zeros(100, dtype=np.int16),
+            np.arange(100, dtype=np.int32),
+            rng.integers(0, 2, 1000, dtype=np.uint8),
+            np.repeat(rng.integers(0, 4, 100), rng.geometric(0.1, 100)).astype('>u2'),
+            rng.integers(0, 2, 1000).astype(np.float64),
+        )
+        for data in test_data:
+            for processes in (1, 2, 3):
+                with self.subTest(data=data, processes=processes):
+                    output = reduce_with_info_parallel(data, processes=processes, min_segment_size=7)
+                    for array, exp_array in zip(output, reduce_with_info_numpy(data)):
+                        self.assertEqual(array.tolist(), exp_array.tolist())
+
+    def test_object_dtype(self):
+        with self.assertRaises(ValueError):
+            reduce_with_info_parallel(np.array([None, None], dtype=object))
+
+
+if __name__ == '__main__':
+    unittest.main()
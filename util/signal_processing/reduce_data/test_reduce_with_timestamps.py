@@ -0,0 +1,43 @@
+import unittest
+
+import numpy as np
+
+from reduce_with_timestamps import reduce_with_timestamps, reduce_with_timestamps_numpy
+
+
+class TestCase(unittest.TestCase):
+    test_data = (
+        ([], []),
+        ([(0, 1)], [(0, 0, 1, 1)]),
+        ([(0, 1), (1, 1)], [(0, 1, 1, 2)]),
+        ([(0, 1), (1, 2)], [(0, 0, 1, 1), (1, 1, 2, 1)]),
+        ([(0, 0), (2, 0), (5, 1), (6, 1), (9, 0)], [(0, 2, 0, 2), (5, 6, 1, 2), (9, 9, 0, 1)]),
+        ([(0, None), (1, None)], [(0, 1, None, 2)]),
+    )
+
+    def test(self):
+        for input_, exp_output in self.test_data:
+            with self.subTest(input_=input_, exp_output=exp_output):
+                self.assertEqual(list(reduce_with_timestamps(input_)), exp_output)
+
+    def test_numpy(self):
+        for input_, exp_output in self.test_data:
+            with self.subTest(input_=input_, exp_output=exp_output):
+                timestamps = np.array([timestamp for timestamp, _ in input_], dtype=np.int64)
+                values = [value for _, value in input_]
+                output = reduce_with_timestamps_numpy(timestamps, values)
+                self.assertEqual(list(zip(*(array.tolist() for array in output))), exp_output)
+
+    def test_numpy_datetime(self):
+        timestamps = np.array(['2020-01-01T00:00', '2020-01-01T00:01', '2020-01-01T00:02'], dtype='datetime64[m]')
+        first, last, values, lengths = reduce_with_timestamps_numpy(timestamps, np.array([1., 1., 2.]))
+        self.assertEqual(first.tolist(), timestamps[[0, 2]].tolist())
+        self.assertEqual(last.tolist(), timestamps[[1, 2]].tolist())
+
+    def test_numpy_size_mismatch(self):
+        with self.assertRaises(ValueError):
+            reduce_with_timestamps_numpy([0, 1], [1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,5 @@
 import unittest
-from reduce_with_tolerance import reduce_with_tolerance
+from reduce_with_tolerance import reduce_with_tolerance, reduce_with_tolerance_summary
 
 
 class TestCase(unittest.TestCase):
@@ -33,6 +33,37 @@ class TestCase(unittest.TestCase):
                 output = list(reduce_with_tolerance(data, tolerance))
                 self.assertEqual(output, exp_output)
 
+    def test_summary(self):
+        # summary should describe the same groups as `reduce_with_tolerance` yields
+        test_data = (
+            [],
+            [1],
+            [1, 2, 3],
+            [3, 1, 2],
+            [1, 2, 3, 3, 1, 2, 5],
+            [0.5, 1.4, 0.3, 2.2, 2.1, -1.],
+        )
+        for data in test_data:
+            for strategy in ('mean', 'previous'):
+                with self.subTest(data=data, strategy=strategy):
+                    output = list(reduce_with_tolerance_summary(data, 1, strategy))
+                    groups = list(reduce_with_tolerance(data, 1, strategy))
+                    self.assertEqual(len(output), len(groups))
+                    start_index = 0
+                    for summary, group in zip(output, groups):
+                        self.assertEqual(summary.start_index, start_index)
+                        self.assertEqual(summary.count, len(group))
+                        self.assertAlmostEqual(summary.mean, sum(group) / len(group))
+                        self.assertEqual(summary.min, min(group))
+                        self.assertEqual(summary.max, max(group))
+                        self.assertEqual(summary.first, group[0])
+                        self.assertEqual(summary.last, group[-1])
+                        start_index += len(group)
+
+    def test_summary_invalid_strategy(self):
+        with self.assertRaises(ValueError):
+            list(reduce_with_tolerance_summary([1], 1, 'median'))
+
 
 if __name__ == '__main__':
     unittest.main()
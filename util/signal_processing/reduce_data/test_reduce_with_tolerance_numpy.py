@@ -0,0 +1,35 @@
+import unittest
+
+import numpy as np
+
+from reduce_with_tolerance import reduce_with_tolerance_summary
+from reduce_with_tolerance_numpy import reduce_with_tolerance_summary_numpy
+
+
+class TestCase(unittest.TestCase):
+    def test(self):
+        rng = np.random.default_rng(0)
+        test_data = (
+            np.array([], dtype=np.float64),
+            np.array([1.]),
+            np.array([1, 2, 3, 3, 1, 2, 5], dtype=np.uint8),
+            np.array([-128, -128, 127, 126, -1, 0], dtype=np.int8),
+            np.array([-32768, 32767, 32767, 0], dtype=np.int16),
+            np.array([True, True, False]),
+            np.array([0.5, 1.4, 0.3, 2.2, 2.1, -1.]),
+            rng.normal(size=1000).cumsum(),
+        )
+        for data in test_data:
+            for tolerance in (0, 1, 2.5, 1000):
+                with self.subTest(data=data, tolerance=tolerance):
+                    output = reduce_with_tolerance_summary_numpy(data, tolerance)
+                    exp_output = list(reduce_with_tolerance_summary(data.tolist(), tolerance, 'previous'))
+                    self.assertEqual(len(output.start_index), len(exp_output))
+                    for field in ('start_index', 'count', 'min', 'max', 'first', 'last'):
+                        self.assertEqual(getattr(output, field).tolist(),
+                                         [getattr(group, field) for group in exp_output])
+                    np.testing.assert_allclose(output.mean, [group.mean for group in exp_output])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import unittest
+
+import numpy as np
+
+from reduce_with_info import reduce_with_info
+from run_length_array import RunLengthArray
+
+
+class TestCase(unittest.TestCase):
+    data = [0, 0, 1, 1, 1, 2, 0, 0, 0, 0, 3, 1]
+
+    def test_getitem(self):
+        rla = RunLengthArray.from_data(self.data)
+        self.assertEqual(len(rla), len(self.data))
+        for index in range(-len(self.data), len(self.data)):
+            with self.subTest(index=index):
+                self.assertEqual(rla[index], self.data[index])
+
+        for index in (len(self.data), -len(self.data) - 1):
+            with self.subTest(index=index):
+                with self.assertRaises(IndexError):
+                    _ = rla[index]
+
+    def test_slice(self):
+        rla = RunLengthArray.from_data(self.data)
+        bounds = (None, -13, -5, -1, 0, 1, 2, 5, 11, 12, 20)
+        for start in bounds:
+            for stop in bounds:
+                for step in (None, 1, 2, 3, 5, -1, -2, -4):
+                    slice_ = slice(start, stop, step)
+                    with self.subTest(slice_=slice_):
+                        exp_data = self.data[slice_]
+                        output = rla[slice_]
+                        self.assertIsInstance(output, RunLengthArray)
+                        self.assertEqual(len(output), len(exp_data))
+                        self.assertEqual(output.to_numpy().tolist(), exp_data)
+                        # result is also reduced
+                        self.assertEqual(list(output.runs()), list(reduce_with_info(exp_data)))
+
+    def test_iter(self):
+        rla = RunLengthArray.from_data(np.array(self.data, dtype=np.uint8))
+        self.assertEqual(list(rla), self.data)
+
+    def test_from_runs(self):
+        runs = list(reduce_with_info(self.data))
+        rla = RunLengthArray.from_runs(runs)
+        self.assertEqual(list(rla.runs()), runs)
+        self.assertEqual(len(RunLengthArray.from_runs([])), 0)
+        self.assertEqual(list(RunLengthArray.from_runs([])), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,14 @@
+import io
+import sys
 from functools import wraps
-from typing import Union
-from collections.abc import Iterator
+from itertools import chain, islice
+from typing import Callable, Optional, Union
+from collections.abc import Iterable, Iterator, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # numpy columns are formatted as any other columns
+    np = None
 
 
 # def cached(f):
@@ -36,6 +44,8 @@ class TextTableStyle:
     down_and_horizontal = ''
     up_and_horizontal = ''
     vertical_and_horizontal = ''
+    # Replaces the last char of a value truncated to its column width.
+    truncation = ''
 
 
 class LightTextTableStyle(TextTableStyle):
@@ -50,6 +60,7 @@ class LightTextTableStyle(TextTableStyle):
     down_and_horizontal = '┬'
     up_and_horizontal = '┴'
     vertical_and_horizontal = '┼'
+    truncation = '…'
 
 
 class SimpleTextTableStyle(TextTableStyle):
@@ -64,6 +75,7 @@ class SimpleTextTableStyle(TextTableStyle):
     down_and_horizontal = '*'
     up_and_horizontal = '*'
     vertical_and_horizontal = '*'
+    truncation = '~'
 
 
 class ArcCornersTextTableStyle(LightTextTableStyle):
@@ -85,6 +97,7 @@ class DoubleTextTableStyle(TextTableStyle):
     down_and_horizontal = '╦'
     up_and_horizontal = '╩'
     vertical_and_horizontal = '╬'
+    truncation = '…'
 
 
 TextTableStyle.Light = LightTextTableStyle
@@ -139,11 +152,12 @@ class TextTableBuilder:
     Builds a table in text representation.
     """
 
-    # todo introduce widths:
-    #  list of widths for each column
-
     # todo introduce word wrap functionality
 
+    WIDTH_POLICIES = ('fixed', 'sample', 'grow')
+    LIVE_WIDTH_POLICIES = ('truncate', 'widen', 'rerender')
+    ALIGNMENTS = ('<', '>', '^')
+
     def __init__(self,
                  header: Union[tuple, list],
                  data: Union[tuple[Iterator], list[Iterator]],
@@ -151,7 +165,10 @@ class TextTableBuilder:
                  min_cell_width: int = 0,
                  insert_header_every_n_rows: int = 20,
                  insert_header_at_the_bottom: bool = False,
-                 build_and_print_immediately: bool = True):
+                 build_and_print_immediately: bool = True,
+                 widths: Optional[list[int]] = None,
+                 formats: Optional[list[Union[str, Callable[..., str], None]]] = None,
+                 alignments: Optional[list[str]] = None):
         """
         :param header:
             Table header. List of names.
@@ -169,6 +186,15 @@ class TextTableBuilder:
         :param style:
             TextTableStyle to use to print table. Prototype is given in TextTableStyle class.
             Also you can apply mixed style. Prototype is given in MixedStyle class.
+        :param widths:
+            List of widths for each column. Columns are not measured then, values wider than the column are truncated.
+            A column is still widened to fit its name and `min_cell_width`.
+        :param formats:
+            List of formats for each column: format spec (example: '.3f', ',', ',.2f'),
+            function that converts a value to string or None to use `str`.
+        :param alignments:
+            List of alignments for each column: '<' (left, default), '>' (right) or '^' (center).
+            Names in the header are aligned the same way.
         """
 
         # Initialize variables.
@@ -178,8 +204,21 @@ class TextTableBuilder:
         self.min_cell_width = min_cell_width
         self.insert_header_every_n_rows = insert_header_every_n_rows
         self.insert_header_at_the_bottom = insert_header_at_the_bottom
+        self.widths = widths
+        self.formats = formats if formats is not None else [None] * len(header)
+        self.alignments = alignments if alignments is not None else ['<'] * len(header)
         # build_and_print_immediately is not stored in class instance
 
+        for name, values in (('widths', self.widths), ('formats', self.formats), ('alignments', self.alignments)):
+            if values is not None and len(values) != len(header):
+                raise TextTableBuilderException(f'Invalid number of {name}. '
+                                                f'Given {len(values)} {name} for {len(header)} columns.')
+
+        for alignment in self.alignments:
+            if alignment not in self.ALIGNMENTS:
+                raise TextTableBuilderException(f'Invalid alignment {alignment}. '
+                                                f'Valid values are: {", ".join(self.ALIGNMENTS)}.')
+
         # Define private variables.
         self._widths: list[int]
         self._top_row: str
@@ -187,6 +226,11 @@ class TextTableBuilder:
         self._delimiter: str
         self._head: str
         self._rows: str
+        self._row_template: str
+        self._row_length: int
+        # Formatted values of each column, or None if widths are given.
+        self._cells: Optional[list[list[str]]] = None
+        self._formatters: list[Callable[..., str]] = [self._compile_formatter(spec) for spec in self.formats]
 
         # Private variables for mixed style.
         self._delimiter_up_light_down_heavy: str
@@ -196,6 +240,15 @@ class TextTableBuilder:
         # A switch to indicate if table was built.
         self._built = False
 
+        # A switch to indicate if widths and columns are ready to render pages, see `build_index`.
+        self._indexed = False
+        self._n_rows: int
+
+        # State of a live table, see `begin`.
+        self._live_width_policy: Optional[str] = None
+        self._live_count: int
+        self._live_rows: Optional[list[list[str]]]
+
         if build_and_print_immediately:
             self.print()
 
@@ -205,18 +258,57 @@ class TextTableBuilder:
         Uses ``self.header`` and ``self.data`` to calculate maximum column widths.
         Note, this is a first most consuming build step.
         """
+        # values of iterators are kept, otherwise rows would get nothing after widths are found
+        if isinstance(self.data, Iterator):
+            self.data = tuple(self.data)
+        if any(isinstance(variable, Iterator) for variable in self.data):
+            self.data = [tuple(variable) if isinstance(variable, Iterator) else variable for variable in self.data]
+
+        if self.widths is not None:
+            self._widths = self._get_initial_widths()
+            self._cells = None
+            return
+
+        # each value is formatted only once, cells are reused to build rows
         widths = []
-        for name, variable in zip(self.header, self.data):
-            width = self.min_cell_width
-            len_name = len(str(name))
-            if len_name > self.min_cell_width:
-                width = len_name
-            for value in variable:
-                len_value = len(str(value))
-                if len_value > width:
-                    width = len_value
-            widths.append(width)
+        cells = []
+        for name, variable, spec, formatter in zip(self.header, self.data, self.formats, self._formatters):
+            column = self._format_column(variable, spec, formatter)
+            widths.append(max(self.min_cell_width, len(str(name)), max(map(len, column), default=0)))
+            cells.append(column)
         self._widths = widths
+        self._cells = cells
+
+    @staticmethod
+    def _compile_formatter(spec: Union[str, Callable[..., str], None]) -> Callable[..., str]:
+        """
+        Returns function that converts a value to string by format spec.
+        """
+        if spec is None:
+            return str
+        if callable(spec):
+            return spec
+        return f'{{:{spec}}}'.format
+
+    @staticmethod
+    def _format_column(variable: Iterable, spec, formatter: Callable[..., str]) -> list[str]:
+        """
+        Formats all values of a column.
+        Numpy arrays are converted into python scalars at once, they are formatted much faster than numpy scalars.
+        Float arrays narrower than float64 are converted into strings by numpy to keep their short representation.
+        """
+        if np is not None and isinstance(variable, np.ndarray) and variable.dtype.kind in 'biufU':
+            if spec is None and variable.dtype.kind == 'f' and variable.dtype.itemsize < 8:
+                return variable.astype(str).tolist()
+            variable = variable.tolist()
+        return list(map(formatter, variable))
+
+    def _get_initial_widths(self) -> list[int]:
+        """
+        Returns widths of columns without values: given widths widened to fit names and minimal cell width.
+        """
+        widths = self.widths if self.widths is not None else (0,) * len(self.header)
+        return [max(width, self.min_cell_width, len(str(name))) for name, width in zip(self.header, widths)]
 
     def _build_delimiter(self):
         """
@@ -314,8 +406,8 @@ class TextTableBuilder:
         vertical = self.style.heavy_vertical if issubclass(self.style, MixedTextTableStyle) else self.style.vertical
 
         head = [vertical]
-        for name, width in zip(self.header, self._widths):
-            head.append(f' {name:<{width}} ' + vertical)
+        for name, width, alignment in zip(self.header, self._widths, self.alignments):
+            head.append(f' {str(name):{alignment}{width}} ' + vertical)
         self._head = ''.join(head)
 
     def _build_rows(self):
@@ -323,151 +415,434 @@ class TextTableBuilder:
         Builds rows of a table from ``self.data``.
         Note, this is a second most consuming build steps.
         """
-        rows = []
-        for variables in zip(*self.data):
-            row = [self.style.vertical]
-            for width, variable in zip(self._widths, variables):
-                row.append(f' {variable:<{width}} ' + self.style.vertical)
-            row = ''.join(row)
-            rows.append(row)
-        self._rows = rows
+        self._rows = list(self._iter_build_rows())
 
     def _iter_build_rows(self):
-        for variables in zip(*self.data):
-            row = [self.style.vertical]
-            for width, variable in zip(self._widths, variables):
-                row.append(f' {variable:<{width}} {self.style.vertical}')
-            row = ''.join(row)
-            yield row
+        if self._cells is not None:
+            # values are formatted and measured already
+            row_template = self._row_template
+            for values in zip(*self._cells):
+                yield row_template.format(*values)
+        else:
+            for variables in zip(*self.data):
+                yield self._build_row(self._format_row(variables))
 
-    def _build_table_structure(self):
+    def _build_row_template(self):
         """
-        Build a table structure.
+        Builds a format string of a row of a table and the length of a row.
         """
-        self._find_widths()
+        vertical = self.style.vertical.replace('{', '{{').replace('}', '}}')
+        self._row_template = vertical + ''.join(f' {{:{alignment}{width}}} {vertical}'
+                                                for width, alignment in zip(self._widths, self.alignments))
+        self._row_length = len(self._row_template.format(*([''] * len(self._widths))))
+
+    def _format_row(self, variables: Iterable) -> list[str]:
+        """
+        Converts values of a row to strings by formats of columns.
+        """
+        return [formatter(variable) for formatter, variable in zip(self._formatters, variables)]
+
+    def _build_row(self, values: list[str]) -> str:
+        """
+        Builds a row of a table from formatted values, values wider than their columns are truncated.
+        """
+        row = self._row_template.format(*values)
+        if len(row) != self._row_length:
+            # some values are wider than their columns
+            truncation = self.style.truncation
+            values = [value if len(value) <= width else value[:width - len(truncation)] + truncation if width else ''
+                      for width, value in zip(self._widths, values)]
+            row = self._row_template.format(*values)
+        return row
+
+    def _build_borders(self):
+        """
+        Builds all rows of a table that depend only on widths.
+        """
+        self._build_row_template()
         self._build_top_row()
         self._build_bottom_row()
 
         if issubclass(self.style, MixedTextTableStyle):
             self._build_delimiter_up_light_down_heavy()
             self._build_delimiter_up_heavy_down_light()
+            self._build_bottom_row_heavy()
         else:
             self._build_delimiter()
 
         self._build_head()
-        self._build_rows()
 
-    def _print_table(self):
+    def _iter_head(self) -> Iterator[str]:
         """
-        Actually prints a table.
+        Yields top rows of a table: top row, header and delimiter.
         """
-        print(self._top_row)
-        print(self._head)
+        yield self._top_row
+        yield self._head
         if issubclass(self.style, MixedTextTableStyle):
-            print(self._delimiter_up_heavy_down_light)
+            yield self._delimiter_up_heavy_down_light
         else:
-            print(self._delimiter)
-
-        if self.insert_header_every_n_rows:
-            for i, row in enumerate(self._rows):
-                # Check whether need to inset the header.
-                if i != 0 and i % self.insert_header_every_n_rows == 0:
-                    if issubclass(self.style, MixedTextTableStyle):
-                        print(self._delimiter_up_light_down_heavy)
-                    else:
-                        print(self._delimiter)
-                    print(self._head)
-                    if issubclass(self.style, MixedTextTableStyle):
-                        print(self._delimiter_up_heavy_down_light)
-                    else:
-                        print(self._delimiter)
-                print(row)
+            yield self._delimiter
+
+    def _iter_inserted_header(self) -> Iterator[str]:
+        """
+        Yields header inserted between rows of a table.
+        """
+        if issubclass(self.style, MixedTextTableStyle):
+            yield self._delimiter_up_light_down_heavy
+            yield self._head
+            yield self._delimiter_up_heavy_down_light
         else:
-            for row in self._rows:
-                print(row)
+            yield self._delimiter
+            yield self._head
+            yield self._delimiter
 
+    def _iter_tail(self) -> Iterator[str]:
+        """
+        Yields bottom rows of a table, with header if needed.
+        """
         if self.insert_header_at_the_bottom:
             if issubclass(self.style, MixedTextTableStyle):
-                print(self._delimiter_up_light_down_heavy)
-            else:
-                print(self._delimiter)
-            print(self._head)
-            if issubclass(self.style, MixedTextTableStyle):
-                print(self._bottom_row_heavy)
+                yield self._delimiter_up_light_down_heavy
+                yield self._head
+                yield self._bottom_row_heavy
             else:
-                print(self._bottom_row)
+                yield self._delimiter
+                yield self._head
+                yield self._bottom_row
         else:
-            print(self._bottom_row)
+            yield self._bottom_row
 
-    def build(self):
-        self._build_table_structure()
-        self._built = True
-        return self
+    def iter_stream_lines(self,
+                          width_policy: str = 'grow',
+                          sample_size: int = 100,
+                          rows: Optional[Iterable[Sequence]] = None) -> Iterator[str]:
+        """
+        Yields lines of a table reading values lazily, so that iterators of any length can be rendered.
+        Only current row and widths are kept in memory.
 
-    def print(self):
-        if not self._built:
-            self.build()
-        self._print_table()
+        :param width_policy:
+            How to find widths of columns.
+            "fixed" uses `widths` (or names and `min_cell_width`), wider values are truncated.
+              First line is yielded immediately.
+            "sample" measures first `sample_size` rows, wider values in later rows are truncated.
+              These rows are kept in memory until they are yielded.
+            "grow" starts as "fixed" and widens columns to fit any value. If a column is widened,
+              the table is closed and a new one with new widths and header starts.
+        :param sample_size:
+            Number of rows to measure with "sample" width policy.
+        :param rows:
+            Iterable of rows to render instead of columns in ``self.data``.
+        """
+        if width_policy not in self.WIDTH_POLICIES:
+            raise TextTableBuilderException(f'Invalid width policy {width_policy}. '
+                                            f'Valid values are: {", ".join(self.WIDTH_POLICIES)}.')
 
-    def iter_print(self):
-        for line in self._iter_get_line():
+        rows = map(self._format_row, zip(*self.data) if rows is None else rows)
+        widths = self._get_initial_widths()
+
+        if width_policy == 'sample':
+            sample = list(islice(rows, sample_size))
+            for values in sample:
+                widths = [max(width, len(value)) for width, value in zip(widths, values)]
+            rows = chain(sample, rows)
+
+        self._widths = widths
+        self._indexed = False
+        self._build_borders()
+        yield from self._iter_head()
+
+        grow = width_policy == 'grow'
+        i = 0
+        for values in rows:
+            if grow:
+                new_widths = [max(width, len(value)) for width, value in zip(self._widths, values)]
+                if new_widths != self._widths:
+                    yield self._bottom_row
+                    self._widths = new_widths
+                    self._build_borders()
+                    yield from self._iter_head()
+                    i = 0
+
+            # Check whether need to inset the header.
+            if self.insert_header_every_n_rows and i != 0 and i % self.insert_header_every_n_rows == 0:
+                yield from self._iter_inserted_header()
+            yield self._build_row(values)
+            i += 1
+
+        yield from self._iter_tail()
+
+    def stream_print(self, width_policy: str = 'grow', sample_size: int = 100, rows: Optional[Iterable] = None):
+        """
+        Prints a table line by line reading values lazily. See `iter_stream_lines`.
+        """
+        for line in self.iter_stream_lines(width_policy, sample_size, rows):
             print(line)
 
-    def _iter_get_line(self):
-        self._find_widths()
+    def begin(self, width_policy: str = 'truncate') -> list[str]:
+        """
+        Starts a live table that grows row by row with `append` and ends with `finish`.
+        Returns top rows of a table and rows of ``self.data`` if any.
 
-        self._build_top_row()
-        yield self._top_row
+        :param width_policy:
+            What to do with a value wider than its column.
+            "truncate" truncates the value.
+            "widen" widens the column for new rows: the table is closed and a new one with new widths and header starts.
+            "rerender" widens the column and renders the whole table again. Formatted rows are kept in memory.
+        """
+        if width_policy not in self.LIVE_WIDTH_POLICIES:
+            raise TextTableBuilderException(f'Invalid width policy {width_policy}. '
+                                            f'Valid values are: {", ".join(self.LIVE_WIDTH_POLICIES)}.')
 
-        self._build_head()
-        yield self._head
+        rows = [self._format_row(variables) for variables in zip(*self.data)]
+        widths = self._get_initial_widths()
+        if self.widths is None:
+            for values in rows:
+                widths = [max(width, len(value)) for width, value in zip(widths, values)]
 
-        if issubclass(self.style, MixedTextTableStyle):
-            self._build_delimiter_up_light_down_heavy()
-            self._build_delimiter_up_heavy_down_light()
-            yield self._delimiter_up_heavy_down_light
-        else:
-            self._build_delimiter()
-            yield self._delimiter
+        self._live_width_policy = width_policy
+        self._live_rows = rows if width_policy == 'rerender' else None
+        self._widths = widths
+        self._indexed = False
+        self._build_borders()
+        return self._get_live_lines(rows)
 
-        if self.insert_header_every_n_rows:
-            i = 0
-            for row in self._iter_build_rows():
-                if i == self.insert_header_every_n_rows:
-                    if issubclass(self.style, MixedTextTableStyle):
-                        yield self._delimiter_up_light_down_heavy
-                    else:
-                        yield self._delimiter
-                    yield self._head
-                    if issubclass(self.style, MixedTextTableStyle):
-                        yield self._delimiter_up_heavy_down_light
-                    else:
-                        yield self._delimiter
-                    i = 0
-                else:
-                    i += 1
-                yield row
+    def _get_live_lines(self, rows: Iterable[list[str]]) -> list[str]:
+        """
+        Returns top rows of a live table and its rows.
+        """
+        self._live_count = 0
+        lines = list(self._iter_head())
+        for values in rows:
+            lines.extend(self._iter_live_row(values))
+        return lines
+
+    def _iter_live_row(self, values: list[str]) -> Iterator[str]:
+        """
+        Yields a row of a live table, with header before it if needed.
+        """
+        # Check whether need to inset the header.
+        n = self.insert_header_every_n_rows
+        if n and self._live_count != 0 and self._live_count % n == 0:
+            yield from self._iter_inserted_header()
+        yield self._build_row(values)
+        self._live_count += 1
+
+    def append(self, row: Sequence) -> tuple[list[str], bool]:
+        """
+        Adds a row to a live table started by `begin`.
+        Only the new row is formatted, so that each row costs the same regardless of the size of the table,
+        except "rerender" width policy when a column is widened.
+
+        :param row: Values of a row.
+        :return:
+            Lines to print and a flag that is True if the lines are the whole table again
+            and replace all lines returned before.
+        """
+        if self._live_width_policy is None:
+            raise TextTableBuilderException('Live table is not started, call `begin` first.')
+
+        values = self._format_row(row)
+        if self._live_rows is not None:
+            self._live_rows.append(values)
+
+        if self._live_width_policy != 'truncate':
+            widths = [max(width, len(value)) for width, value in zip(self._widths, values)]
+            if widths != self._widths:
+                bottom_row = self._bottom_row
+                self._widths = widths
+                self._build_borders()
+                if self._live_rows is not None:
+                    return self._get_live_lines(self._live_rows), True
+                return [bottom_row] + self._get_live_lines([values]), False
+
+        return list(self._iter_live_row(values)), False
+
+    def finish(self) -> list[str]:
+        """
+        Ends a live table started by `begin`. Returns bottom rows of a table.
+        """
+        if self._live_width_policy is None:
+            raise TextTableBuilderException('Live table is not started, call `begin` first.')
+        self._live_width_policy = None
+        self._live_rows = None
+        return list(self._iter_tail())
+
+    def _build_table_structure(self):
+        """
+        Build a table structure.
+        """
+        self._find_widths()
+        self._build_borders()
+        self._build_rows()
+
+    def _iter_lines(self) -> Iterator[str]:
+        """
+        Yields all lines of a table.
+        Rows built by `build` are used, otherwise rows are built lazily one by one.
+        Formatted values are kept only by `build` and `build_index`, where they are reused.
+        """
+        if self._built:
+            rows = self._rows
+        elif self._indexed:
+            # widths and formatted values are found by `build_index` already
+            rows = self._iter_build_rows()
         else:
-            yield from self._iter_build_rows()
+            self._find_widths()
+            self._build_borders()
+            rows = self._iter_build_rows()
 
-        if self.insert_header_at_the_bottom:
-            if issubclass(self.style, MixedTextTableStyle):
-                yield self._delimiter_up_light_down_heavy
-            else:
-                yield self._delimiter
-            yield self._head
-            if issubclass(self.style, MixedTextTableStyle):
-                self._build_bottom_row_heavy()
-                yield self._bottom_row_heavy
+        try:
+            yield from self._iter_head()
+
+            if self.insert_header_every_n_rows:
+                for i, row in enumerate(rows):
+                    # Check whether need to inset the header.
+                    if i != 0 and i % self.insert_header_every_n_rows == 0:
+                        yield from self._iter_inserted_header()
+                    yield row
             else:
-                self._build_bottom_row()
-                yield self._bottom_row
+                yield from rows
+
+            yield from self._iter_tail()
+        finally:
+            if not (self._built or self._indexed):
+                self._cells = None
+
+    def build_index(self):
+        """
+        Prepares a table to render pages: finds widths once (or takes given `widths`) and builds borders.
+        Columns that can't be sliced are converted into tuples, so that any row is accessed by its index.
+        """
+        self._find_widths()
+        if self._cells is None:
+            self.data = [variable
+                         if isinstance(variable, Sequence) or np is not None and isinstance(variable, np.ndarray)
+                         else tuple(variable) for variable in self.data]
+            self._n_rows = min(map(len, self.data), default=0)
         else:
-            self._build_bottom_row()
-            yield self._bottom_row
+            self._n_rows = min(map(len, self._cells), default=0)
+        self._build_borders()
+        self._indexed = True
+        return self
+
+    @property
+    def n_rows(self) -> int:
+        """
+        Number of rows of a table.
+        """
+        if not self._indexed:
+            self.build_index()
+        return self._n_rows
+
+    def iter_page_lines(self, start: int, stop: int, standalone: bool = False) -> Iterator[str]:
+        """
+        Yields lines of rows from `start` to `stop` (exclusive, as a slice) of a table,
+        with headers inserted between them the same way as in the whole table.
+        Only values of the page are formatted, widths are found once by `build_index`.
+
+        :param start: Index of the first row.
+        :param stop: Index of the row after the last one.
+        :param standalone:
+            If True, a page has its own top rows and bottom rows.
+            Otherwise top rows are yielded only with the first row of a table and bottom rows only with the last one,
+            so that pages joined together give the whole table. A page without rows has no lines then.
+        """
+        if not self._indexed:
+            self.build_index()
+        start, stop, _ = slice(start, stop).indices(self._n_rows)
+        stop = max(start, stop)
+        # an empty page of a table with rows has no lines, an empty table has only top and bottom rows
+        empty = start == stop and self._n_rows != 0
+
+        if self._cells is not None:
+            rows = map(self._row_template.format, *(column[start:stop] for column in self._cells))
+        else:
+            columns = [self._format_column(variable[start:stop], spec, formatter)
+                       for variable, spec, formatter in zip(self.data, self.formats, self._formatters)]
+            rows = map(self._build_row, zip(*columns))
+
+        if standalone or start == 0 and not empty:
+            yield from self._iter_head()
+
+        n = self.insert_header_every_n_rows
+        for i, row in enumerate(rows, start):
+            # Check whether need to inset the header.
+            if n and i != 0 and i % n == 0 and not (standalone and i == start):
+                yield from self._iter_inserted_header()
+            yield row
+
+        if standalone or stop == self._n_rows and not empty:
+            yield from self._iter_tail()
+
+    def render_page(self, start: int, stop: int, standalone: bool = False) -> str:
+        """
+        Returns rows from `start` to `stop` of a table as text. See `iter_page_lines`.
+        """
+        lines = list(self.iter_page_lines(start, stop, standalone))
+        lines.append('')
+        return '\n'.join(lines)
+
+    def build(self):
+        self._build_table_structure()
+        self._built = True
+        return self
+
+    def render(self) -> str:
+        """
+        Returns a table as text, the same as printed: each line ends with a new line.
+        """
+        lines = list(self._iter_lines())
+        lines.append('')
+        return '\n'.join(lines)
+
+    def render_to(self, file, encoding: str = 'utf-8', buffer_size: int = 1 << 16, errors: str = 'strict'):
+        """
+        Writes a table into a file-like object.
+        Lines are joined into chunks of about `buffer_size` chars, so that the file is written by large blocks.
+        Note, chunks written before an error (example: `UnicodeEncodeError`) stay in the file.
+
+        :param file: Text or binary file-like object. Example: `sys.stdout`, `open(path, 'wb')`, `io.BytesIO()`.
+        :param encoding: Encoding of the text written into a binary file.
+        :param buffer_size: Number of chars to join before writing.
+        :param errors: Encoding error handler of the text written into a binary file, see `str.encode`.
+            Use 'replace' for encodings without box drawing chars of the style.
+        """
+        binary = isinstance(file, (io.RawIOBase, io.BufferedIOBase)) or 'b' in getattr(file, 'mode', '')
+        write = file.write
+
+        chunk = []
+        size = 0
+        for line in self._iter_lines():
+            chunk.append(line)
+            size += len(line)
+            if size >= buffer_size:
+                chunk.append('')
+                text = '\n'.join(chunk)
+                write(text.encode(encoding, errors) if binary else text)
+                chunk = []
+                size = 0
+
+        if chunk:
+            chunk.append('')
+            text = '\n'.join(chunk)
+            write(text.encode(encoding, errors) if binary else text)
+
+    def print(self):
+        if not self._built:
+            self.build()
+        self.render_to(sys.stdout)
+
+    def iter_print(self):
+        """
+        Prints a table building rows lazily, rows are not kept in memory.
+        """
+        self.render_to(sys.stdout)
 
 
 if __name__ == '__main__':
+    import contextlib
+    import unittest
+
     # smoke test
     n = 6
     a = (1,) * n
@@ -478,3 +853,248 @@ if __name__ == '__main__':
                           insert_header_every_n_rows=3,
                           build_and_print_immediately=False)
     tb.iter_print()
+
+    # streaming smoke test, columns are widened while the table is printed
+    tb = TextTableBuilder(['x', '2**x'], [iter(range(12)), (2 ** x for x in range(12))], TextTableStyle.HeavyAndLight,
+                          insert_header_every_n_rows=4,
+                          build_and_print_immediately=False)
+    tb.stream_print('grow')
+
+    # page smoke test, rows 4 to 7 with the header inserted before row 6, other rows are not formatted
+    tb = TextTableBuilder(['x', '2*x'], [range(10**9), range(0, 2 * 10**9, 2)],
+                          insert_header_every_n_rows=3,
+                          build_and_print_immediately=False,
+                          widths=[10, 10])
+    print(tb.render_page(4, 7, standalone=True), end='')
+
+    # live smoke test, rows are printed as they are appended, the table is closed when a column is widened
+    tb = TextTableBuilder(['step', 'value'], [[0], [1.0]], TextTableStyle.Light,
+                          insert_header_every_n_rows=3,
+                          build_and_print_immediately=False)
+    print(*tb.begin('widen'), sep='\n')
+    for step in range(1, 12):
+        lines, _ = tb.append((step, 1 / step))
+        print(*lines, sep='\n')
+    print(*tb.finish(), sep='\n')
+
+    class TestsStream(unittest.TestCase):
+
+        @staticmethod
+        def builder(data, style=TextTableStyle.Light, **kwargs) -> TextTableBuilder:
+            return TextTableBuilder(['a', 'b'], data, style, build_and_print_immediately=False, **kwargs)
+
+        def test_sample_same_as_render(self):
+            data = [list(range(11)), ['x' * (i % 4) for i in range(11)]]
+            for style in (TextTableStyle.Light, TextTableStyle.Simple, TextTableStyle.HeavyAndLight):
+                for insert_header_every_n_rows in (0, 4):
+                    with self.subTest(style=style.__name__, insert_header_every_n_rows=insert_header_every_n_rows):
+                        kwargs = dict(insert_header_every_n_rows=insert_header_every_n_rows,
+                                      insert_header_at_the_bottom=True)
+                        lines = list(self.builder(data, style, **kwargs).iter_stream_lines('sample', sample_size=11))
+                        self.assertEqual('\n'.join(lines) + '\n', self.builder(data, style, **kwargs).render())
+
+        def test_truncation(self):
+            for style in (TextTableStyle.Light, TextTableStyle.Simple):
+                for width_policy in ('fixed', 'sample'):
+                    with self.subTest(style=style.__name__, width_policy=width_policy):
+                        tb = self.builder([[1, 2], ['abc', 'abcdef']], style, widths=[1, 3])
+                        lines = list(tb.iter_stream_lines(width_policy, sample_size=1))
+                        self.assertIn(' abc ', lines[3])
+                        self.assertIn(f' ab{style.truncation} ', lines[4])
+                        self.assertEqual(len(set(map(len, lines))), 1)
+
+        def test_grow(self):
+            tb = self.builder([[1, 2, 3], ['a', 'abcdef', 'b']], insert_header_every_n_rows=2)
+            lines = list(tb.iter_stream_lines('grow'))
+            self.assertEqual(lines, [
+                '┌───┬───┐',
+                '│ a │ b │',
+                '├───┼───┤',
+                '│ 1 │ a │',
+                '└───┴───┘',
+                '┌───┬────────┐',
+                '│ a │ b      │',
+                '├───┼────────┤',
+                '│ 2 │ abcdef │',
+                '│ 3 │ b      │',
+                '└───┴────────┘',
+            ])
+
+        def test_lazy(self):
+            read = []
+
+            def values():
+                for i in range(3):
+                    read.append(i)
+                    yield i
+
+            lines = self.builder([values(), iter('xyz')]).iter_stream_lines('fixed')
+            for _ in range(3):
+                next(lines)
+            self.assertEqual(read, [])
+            self.assertEqual(next(lines), '│ 0 │ x │')
+            self.assertEqual(read, [0])
+            self.assertEqual(len(list(lines)), 3)
+            self.assertEqual(read, [0, 1, 2])
+
+    class TestsFormats(unittest.TestCase):
+
+        def test_formats_and_alignments(self):
+            columns = [[1, 22], [0.5, 1234.5678], ['x', 'yyy']]
+            if np is not None:
+                columns[1] = np.array(columns[1])
+            for widths in (None, [2, 8, 3]):
+                with self.subTest(widths=widths):
+                    tb = TextTableBuilder(['a', 'b', 'c'], columns, TextTableStyle.Light,
+                                          build_and_print_immediately=False,
+                                          widths=widths,
+                                          formats=[None, ',.2f', lambda value: value.upper()],
+                                          alignments=['>', '>', '^'])
+                    self.assertEqual(tb.render().splitlines()[1:-1], [
+                        '│  a │        b │  c  │',
+                        '├────┼──────────┼─────┤',
+                        '│  1 │     0.50 │  X  │',
+                        '│ 22 │ 1,234.57 │ YYY │',
+                    ])
+
+        def test_cells_released(self):
+            tb = TextTableBuilder(['a', 'b'], [range(100), iter(range(100))], build_and_print_immediately=False)
+            with contextlib.redirect_stdout(io.StringIO()):
+                tb.iter_print()
+            self.assertIsNone(tb._cells)
+            tb.render_to(io.StringIO())
+            self.assertIsNone(tb._cells)
+            lines = tb._iter_lines()
+            next(lines)
+            lines.close()
+            self.assertIsNone(tb._cells)
+
+            # formatted values are reused by pages and rows
+            self.assertEqual(tb.build_index().render(), tb.render_page(0, 100))
+            self.assertIsNotNone(tb._cells)
+
+        def test_negative(self):
+            for kwargs, expected_output in (
+                    (dict(alignments=['<', '>', '=']), 'Invalid alignment'),
+                    (dict(alignments=['>']), 'Invalid number of alignments'),
+                    (dict(formats=[None] * 4), 'Invalid number of formats'),
+                    (dict(widths=[1, 2]), 'Invalid number of widths'),
+            ):
+                with self.subTest(kwargs=kwargs):
+                    with self.assertRaises(TextTableBuilderException) as e:
+                        TextTableBuilder(['a', 'b', 'c'], [[1], [2], [3]], build_and_print_immediately=False, **kwargs)
+                    self.assertIn(expected_output, str(e.exception))
+
+    class TestsRenderTo(unittest.TestCase):
+
+        def test_encoding(self):
+            tb = TextTableBuilder(['a'], [[1]], TextTableStyle.Light, build_and_print_immediately=False)
+            with self.assertRaises(UnicodeEncodeError):
+                tb.render_to(io.BytesIO(), 'cp1251')
+
+            file = io.BytesIO()
+            tb.render_to(file, 'cp1251', errors='replace')
+            self.assertEqual(file.getvalue(), tb.render().encode('cp1251', 'replace'))
+
+            file = io.BytesIO()
+            tb.render_to(file, buffer_size=1)
+            self.assertEqual(file.getvalue().decode(), tb.render())
+
+    class TestsPages(unittest.TestCase):
+
+        @staticmethod
+        def builder(**kwargs) -> TextTableBuilder:
+            data = [range(23), iter(['x' * (i % 7) for i in range(23)])]
+            return TextTableBuilder(['a', 'b'], data, TextTableStyle.HeavyAndLight,
+                                    insert_header_every_n_rows=5,
+                                    insert_header_at_the_bottom=True,
+                                    build_and_print_immediately=False,
+                                    **kwargs)
+
+        def test_same_as_render(self):
+            for widths in (None, [2, 4]):
+                for size in (1, 5, 7, 23):
+                    with self.subTest(widths=widths, size=size):
+                        tb = self.builder(widths=widths)
+                        pages = [tb.render_page(start, start + size) for start in range(0, 23, size)]
+                        self.assertEqual(''.join(pages), self.builder(widths=widths).render())
+
+        def test_standalone(self):
+            for widths in (None, [2, 4]):
+                with self.subTest(widths=widths):
+                    tb = self.builder(widths=widths)
+                    lines = tb.render().splitlines()
+                    self.assertEqual(tb.render_page(0, 23, standalone=True), tb.render())
+                    # rows 5 and 6, the header before row 5 is replaced with the top rows
+                    self.assertEqual(tb.render_page(5, 7, standalone=True).splitlines(),
+                                     lines[:3] + lines[11:13] + lines[-3:])
+                    self.assertEqual(tb.render_page(-3, None), tb.render_page(20, 23))
+                    self.assertEqual(tb.render_page(30, 40), '')
+
+            tb = TextTableBuilder(['a'], [[]], build_and_print_immediately=False)
+            self.assertEqual(tb.render_page(0, 10), tb.render())
+
+    class TestsLive(unittest.TestCase):
+
+        ROWS = [(i, 'x' * (i % 7)) for i in range(12)]
+
+        @staticmethod
+        def builder(data=([], []), **kwargs) -> TextTableBuilder:
+            return TextTableBuilder(['a', 'b'], list(data), TextTableStyle.Light,
+                                    insert_header_every_n_rows=5,
+                                    build_and_print_immediately=False,
+                                    **kwargs)
+
+        def test_rerender(self):
+            tb = self.builder()
+            lines = tb.begin('rerender')
+            replaced = []
+            for row in self.ROWS:
+                new_lines, replace = tb.append(row)
+                lines = new_lines if replace else lines + new_lines
+                replaced.append(replace)
+            lines += tb.finish()
+            # columns are widened by values "xx" to "xxxxxx" and 10
+            self.assertEqual(replaced, [False, False, True, True, True, True, True, False, False, False, True, False])
+            self.assertEqual('\n'.join(lines) + '\n', self.builder(zip(*self.ROWS)).render())
+
+        def test_widen(self):
+            tb = self.builder(zip(*self.ROWS[:2]))
+            lines = tb.begin('widen')
+            self.assertEqual(lines[3:], ['│ 0 │   │', '│ 1 │ x │'])
+            bottom_row = tb._bottom_row
+            self.assertEqual(tb.append((2, 'xx')), ([
+                bottom_row,
+                '┌───┬────┐',
+                '│ a │ b  │',
+                '├───┼────┤',
+                '│ 2 │ xx │',
+            ], False))
+            self.assertEqual(tb.append((3, 'x')), (['│ 3 │ x  │'], False))
+            self.assertEqual(tb.finish(), ['└───┴────┘'])
+
+        def test_truncate(self):
+            tb = self.builder(widths=[2, 3])
+            lines = tb.begin()
+            for row in self.ROWS:
+                new_lines, replace = tb.append(row)
+                self.assertFalse(replace)
+                lines += new_lines
+            lines += tb.finish()
+            self.assertEqual(len(set(map(len, lines))), 1)
+            self.assertEqual(lines[-2], '│ 11 │ xx… │')
+            # header is inserted before every 5th row
+            self.assertEqual([i for i, line in enumerate(lines) if line.startswith('│ a ')], [1, 9, 17])
+
+        def test_negative(self):
+            tb = self.builder()
+            for function, expected_output in (
+                    (lambda: tb.begin('grow'), 'Invalid width policy'),
+                    (lambda: tb.append((1, 2)), 'Live table is not started'),
+                    (lambda: tb.finish(), 'Live table is not started'),
+            ):
+                with self.assertRaises(TextTableBuilderException) as e:
+                    function()
+                self.assertIn(expected_output, str(e.exception))
+
+    unittest.main()